@@ -19,6 +19,8 @@ MATERIALIZER_PROPERTY_KEY = "materializer"
 MATERIALIZER_PROPERTY = Property(type=PropertyType.STRING)  # type: ignore[no-untyped-call] # noqa
 DATATYPE_PROPERTY_KEY = "datatype"
 DATATYPE_PROPERTY = Property(type=PropertyType.STRING)  # type: ignore[no-untyped-call] # noqa
+CONTENT_DIGEST_PROPERTY_KEY = "content_digest"
+CONTENT_DIGEST_PROPERTY = Property(type=PropertyType.STRING)  # type: ignore[no-untyped-call] # noqa
 
 
 class BaseArtifact(Artifact):
@@ -38,4 +40,5 @@ class BaseArtifact(Artifact):
     PROPERTIES: Dict[str, Property] = {  # type: ignore[assignment]
         MATERIALIZER_PROPERTY_KEY: MATERIALIZER_PROPERTY,
         DATATYPE_PROPERTY_KEY: DATATYPE_PROPERTY,
+        CONTENT_DIGEST_PROPERTY_KEY: CONTENT_DIGEST_PROPERTY,
     }
@@ -14,6 +14,7 @@
 
 
 from zenml.cli.base import *  # noqa
+from zenml.cli.benchmark import *  # noqa
 from zenml.cli.config import *  # noqa
 from zenml.cli.example import *  # noqa
 from zenml.cli.pipeline import *  # noqa
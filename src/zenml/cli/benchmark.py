@@ -0,0 +1,126 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""CLI to benchmark ZenML components."""
+
+import json
+import tempfile
+from typing import List, Optional, Tuple
+
+import click
+
+from zenml.cli import utils as cli_utils
+from zenml.cli.cli import cli
+from zenml.core.repo import Repository
+from zenml.utils import path_utils
+
+
+def _parse_sizes(
+    ctx: click.Context, param: click.Parameter, value: str
+) -> List[float]:
+    """Parses comma-separated positive payload sizes.
+
+    Raises:
+        click.BadParameter: If a size is not a positive number.
+    """
+    sizes: List[float] = []
+    for size in value.split(","):
+        try:
+            sizes.append(float(size))
+        except ValueError:
+            raise click.BadParameter(f"`{size}` is not a number.") from None
+        if not sizes[-1] > 0:
+            raise click.BadParameter(f"`{size}` is not a positive size.")
+    return sizes
+
+
+@cli.group()
+def benchmark() -> None:
+    """Benchmarks to measure the performance of ZenML components."""
+
+
+@benchmark.command(
+    "materializers",
+    help="Measure how fast materializers write and read synthetic payloads.",
+)
+@click.option(
+    "--sizes",
+    default="1,10,100",
+    show_default=True,
+    callback=_parse_sizes,
+    help="Comma-separated payload sizes in MB.",
+)
+@click.option(
+    "--repetitions",
+    "-n",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="How often each payload is written and read.",
+)
+@click.option(
+    "--case",
+    "case_names",
+    multiple=True,
+    help="Only run these payloads, e.g. `ndarray` or `dataframe-wide`.",
+)
+@click.option(
+    "--path",
+    type=click.Path(file_okay=False),
+    help="Local directory in which artifacts are written. Defaults to the "
+    "artifact store of the active stack.",
+)
+@click.option(
+    "--output-format",
+    type=click.Choice(["table", "json"]),
+    default="table",
+    show_default=True,
+)
+def benchmark_materializers(
+    sizes: List[float],
+    repetitions: int,
+    case_names: Tuple[str, ...],
+    path: Optional[str],
+    output_format: str,
+) -> None:
+    """Benchmarks all materializers and prints the results."""
+    # Imported here as it imports all materializers and their dependencies.
+    from zenml.materializers.benchmark import (
+        benchmark_materializers as run_benchmark,
+    )
+
+    if path is None:
+        path = Repository().get_active_stack().artifact_store.path
+        if path_utils.is_remote(path):
+            cli_utils.error(
+                f"The artifact store of the active stack at {path} is not "
+                f"local, please pass a local directory with `--path`."
+            )
+    path_utils.create_dir_recursive_if_not_exists(path)
+
+    with tempfile.TemporaryDirectory(
+        prefix="benchmark_", dir=path
+    ) as directory:
+        results = run_benchmark(
+            directory,
+            sizes_mb=sizes,
+            repetitions=repetitions,
+            case_names=case_names,
+        )
+
+    if output_format == "json":
+        click.echo(
+            json.dumps([result._asdict() for result in results], indent=2)
+        )
+    else:
+        cli_utils.echo_benchmark_results(results)
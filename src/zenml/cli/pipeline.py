@@ -17,6 +17,7 @@ from typing import Any
 
 import click
 
+from zenml.cli import utils as cli_utils
 from zenml.cli.cli import cli
 from zenml.config.config_keys import (
     PipelineConfigurationKeys,
@@ -65,13 +66,22 @@ def pipeline() -> None:
     type=click.Path(exists=True, dir_okay=False),
     required=True,
 )
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Only print which steps would be cached instead of running the "
+    "pipeline.",
+)
 @click.argument("python_file")
-def run_pipeline(python_file: str, config_path: str) -> None:
+def run_pipeline(
+    python_file: str, config_path: str, dry_run: bool = False
+) -> None:
     """Runs pipeline specified by the given config YAML object.
 
     Args:
         python_file: Path to the python file that defines the pipeline.
         config_path: Path to configuration YAML file.
+        dry_run: If `True`, only print which steps would be cached.
     """
     module = source_utils.import_python_file(python_file)
     config = yaml_utils.read_yaml(config_path)
@@ -121,4 +131,7 @@ def run_pipeline(python_file: str, config_path: str) -> None:
         config_path, overwrite_step_parameters=True
     )
     logger.debug("Finished setting up pipeline '%s' from CLI", pipeline_name)
-    pipeline_instance.run()
+    if dry_run:
+        cli_utils.echo_step_plans(pipeline_instance.plan())
+    else:
+        pipeline_instance.run()
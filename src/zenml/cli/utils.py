@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 import datetime
 from datetime import timedelta
-from typing import Any, Dict, List, Mapping
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping
 
 import click
 from dateutil import tz
@@ -21,6 +21,10 @@ from tabulate import tabulate
 
 from zenml.core.base_component import BaseComponent
 
+if TYPE_CHECKING:
+    from zenml.materializers.benchmark import BenchmarkResult
+    from zenml.pipelines.run_plan import StepPlan
+
 
 def title(text: str) -> None:
     """Echo a title formatted string on the CLI.
@@ -118,6 +122,31 @@ def echo_component_list(component_list: Mapping[str, BaseComponent]) -> None:
     click.echo(tabulate(list_of_dicts, headers="keys"))
 
 
+def echo_step_plans(step_plans: List["StepPlan"]) -> None:
+    """Echoes which steps of a pipeline run would be cached."""
+    rows = [
+        {
+            "step": plan.name,
+            "cached": "yes" if plan.is_cached else "no",
+            "reason": plan.reason.value if plan.reason else "",
+            "details": plan.details,
+        }
+        for plan in step_plans
+    ]
+    click.echo(tabulate(rows, headers="keys"))
+
+
+def echo_benchmark_results(results: List["BenchmarkResult"]) -> None:
+    """Echoes the results of a materializer benchmark."""
+    click.echo(
+        tabulate(
+            [result._asdict() for result in results],
+            headers="keys",
+            missingval="n/a",
+        )
+    )
+
+
 def format_date(
     dt: datetime.datetime, format: str = "%Y-%m-%d %H:%M:%S"
 ) -> str:
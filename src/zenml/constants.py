@@ -43,6 +43,10 @@ GIT_REPO_URL = "https://github.com/zenml-io/zenml.git"
 ENV_ZENML_DEBUG = "ZENML_DEBUG"
 ENV_ZENML_LOGGING_VERBOSITY = "ZENML_LOGGING_VERBOSITY"
 ENV_ABSL_LOGGING_VERBOSITY = "ZENML_ABSL_LOGGING_VERBOSITY"
+ENV_ZENML_PARQUET_COMPRESSION = "ZENML_PARQUET_COMPRESSION"
+ENV_ZENML_PARQUET_COMPRESSION_LEVEL = "ZENML_PARQUET_COMPRESSION_LEVEL"
+ENV_ZENML_PARQUET_ROW_GROUP_SIZE = "ZENML_PARQUET_ROW_GROUP_SIZE"
+ENV_ZENML_PARQUET_DISABLE_DICTIONARY = "ZENML_PARQUET_DISABLE_DICTIONARY"
 
 # Logging variables
 IS_DEBUG_ENV: bool = handle_bool_env_var(ENV_ZENML_DEBUG, default=False)
@@ -94,3 +98,8 @@ REMOTE_FS_PREFIX = ["gs://", "hdfs://", "s3://"]
 # Segment
 SEGMENT_KEY_DEV = "mDBYI0m7GcCj59EZ4f9d016L1T3rh8J5"
 SEGMENT_KEY_PROD = "sezE77zEoxHPFDXuyFfILx6fBnJFZ4p7"
+
+# Step related constants
+# Execution parameter which records the source code hash of a step so that
+# code changes invalidate the cache
+STEP_SOURCE_HASH_PARAMETER: str = "zenml_source_hash"
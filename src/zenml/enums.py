@@ -55,6 +55,16 @@ class ExecutionStatus(Enum):
     RUNNING = "running"
 
 
+class CacheMissReason(str, Enum):
+    """Enum that represents why a step would not be cached in a pipeline run."""
+
+    CACHE_DISABLED = "cache disabled"
+    NO_PREVIOUS_EXECUTION = "no previous execution"
+    CHANGED_CODE = "changed code"
+    CHANGED_PARAMETERS = "changed parameters"
+    NEW_INPUT_ARTIFACTS = "new input artifacts"
+
+
 class LoggingLevels(Enum):
     """Enum for logging levels."""
 
@@ -55,9 +55,29 @@ def _get_filesystem(path: PathType) -> Type[Filesystem]:
     )
 
 
+# Functions wrapping files opened for binary writing, see `add_write_hook()`.
+_write_hooks: List[Callable[[PathType, Any], Any]] = []
+
+
+def add_write_hook(hook: Callable[[PathType, Any], Any]) -> None:
+    """Registers a function that gets called with the path and the file
+    object of every file opened with mode `wb` and returns the file object
+    to use instead, e.g. a wrapper observing the written data."""
+    _write_hooks.append(hook)
+
+
+def remove_write_hook(hook: Callable[[PathType, Any], Any]) -> None:
+    """Removes a function registered with `add_write_hook()`."""
+    _write_hooks.remove(hook)
+
+
 def open(path: PathType, mode: str = "r") -> Any:  # noqa
     """Open a file at the given path."""
-    return _get_filesystem(path).open(path, mode=mode)
+    file = _get_filesystem(path).open(path, mode=mode)
+    if mode == "wb":
+        for hook in list(_write_hooks):
+            file = hook(path, file)
+    return file
 
 
 def copy(src: PathType, dst: PathType, overwrite: bool = False) -> None:
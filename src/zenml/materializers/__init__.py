@@ -13,12 +13,21 @@
 #  permissions and limitations under the License.
 
 from zenml.logger import get_logger
+from zenml.materializers.arrow_materializer import (  # noqa
+    ArrowMaterializer,
+)
 from zenml.materializers.beam_materializer import BeamMaterializer  # noqa
 from zenml.materializers.built_in_materializer import (  # noqa
     BuiltInMaterializer,
 )
+from zenml.materializers.chunked_numpy_materializer import (  # noqa
+    ChunkedNumpyMaterializer,
+)
 from zenml.materializers.numpy_materializer import NumpyMaterializer  # noqa
 from zenml.materializers.pandas_materializer import PandasMaterializer  # noqa
+from zenml.materializers.partitioned_dataset_materializer import (  # noqa
+    PartitionedDatasetMaterializer,
+)
 
 logger = get_logger(__name__)
 
@@ -34,6 +43,9 @@ try:
     from zenml.materializers.pytorch_materializer import (  # noqa
         PyTorchMaterializer,
     )
+    from zenml.materializers.pytorch_state_dict_materializer import (  # noqa
+        PyTorchStateDictMaterializer,
+    )
 except ImportError:
     logger.debug("PyTorch not installed.")
 
@@ -44,6 +56,13 @@ try:
 except ImportError:
     logger.debug("PyTorch Lightning not installed.")
 
+try:
+    from zenml.materializers.scipy_sparse_materializer import (  # noqa
+        ScipySparseMaterializer,
+    )
+except ImportError:
+    logger.debug("scipy not installed.")
+
 try:
     from zenml.materializers.sklearn_materializer import (  # noqa
         SklearnMaterializer,
@@ -0,0 +1,121 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+from typing import Any, List, Optional, Type, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from zenml.io import fileio
+from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.utils import path_utils
+
+DEFAULT_FILENAME = "data.arrow"
+
+
+class ArrowMaterializer(BaseMaterializer):
+    """Materializer to read and write Arrow tables as Feather v2 (Arrow IPC)
+    files.
+
+    Files in local artifact stores are memory-mapped, so reading an
+    uncompressed table doesn't copy any data. The materializer can also be
+    used for pandas dataframes, which are converted to and from Arrow tables:
+
+        @step
+        def importer() -> pd.DataFrame:
+            ...
+
+        importer().with_return_materializers(ArrowMaterializer)
+
+    Compression (`lz4` or `zstd`) makes files smaller but means that tables
+    are decompressed into memory when they are read.
+    """
+
+    ASSOCIATED_TYPES = [pa.Table]
+
+    # One of `uncompressed`, `lz4` or `zstd`.
+    COMPRESSION: str = "uncompressed"
+    # `None` uses the default level of the codec.
+    COMPRESSION_LEVEL: Optional[int] = None
+
+    def handle_input(
+        self, data_type: Type[Any], columns: Optional[List[str]] = None
+    ) -> Union[pa.Table, pd.DataFrame]:
+        """Reads an Arrow table from a Feather file.
+
+        Args:
+            data_type: Either `pa.Table` or `pd.DataFrame`.
+            columns: If given, only these columns are read.
+
+        Returns:
+            The table, converted to a dataframe if requested.
+        """
+        super().handle_input(data_type)
+        filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
+        if path_utils.is_remote(filepath):
+            with fileio.open(filepath, "rb") as f:
+                source = pa.BufferReader(f.read())
+            table = feather.read_table(source, columns=columns)
+        else:
+            table = feather.read_table(
+                filepath, columns=columns, memory_map=True
+            )
+
+        if issubclass(data_type, pd.DataFrame):
+            return table.to_pandas()
+        return table
+
+    def handle_return(self, data: Union[pa.Table, pd.DataFrame]) -> None:
+        """Writes an Arrow table or pandas dataframe to a Feather file.
+
+        Args:
+            data: The table or dataframe to write.
+        """
+        super().handle_return(data)
+        if isinstance(data, pd.DataFrame):
+            data = pa.Table.from_pandas(data)
+        with fileio.open(
+            os.path.join(self.artifact.uri, DEFAULT_FILENAME), "wb"
+        ) as f:
+            feather.write_feather(
+                data,
+                f,
+                compression=self.COMPRESSION,
+                compression_level=self.COMPRESSION_LEVEL,
+            )
+
+    def combine_chunks(
+        self, chunks: List[Union[pa.Table, pd.DataFrame]]
+    ) -> pa.Table:
+        """Concatenates table or dataframe chunks to a single table.
+
+        Args:
+            chunks: The chunks to combine, all need to have the same schema.
+
+        Returns:
+            The combined table.
+        """
+        tables = []
+        for chunk in chunks:
+            if isinstance(chunk, pd.DataFrame):
+                # Range indices would only be stored as metadata which
+                # doesn't match the concatenated table.
+                chunk = pa.Table.from_pandas(
+                    chunk,
+                    preserve_index=not isinstance(chunk.index, pd.RangeIndex),
+                )
+            tables.append(chunk)
+        return pa.concat_tables(tables)
@@ -12,7 +12,17 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Tuple, Type, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Tuple,
+    Type,
+    cast,
+)
 
 if TYPE_CHECKING:
     from zenml.artifacts.base_artifact import BaseArtifact
@@ -84,3 +94,63 @@ class BaseMaterializer(metaclass=BaseMaterializerMeta):
         #         f"{self.__class__.__name__}. Supported types: "
         #         f"{self.ASSOCIATED_TYPES}"
         #     )
+
+    def handle_return_chunks(self, chunks: Iterator[Any]) -> None:
+        """Write logic here to handle the chunks a generator step yields.
+
+        The default implementation collects all chunks, combines them using
+        `combine_chunks()` and writes the result with `handle_return()`.
+        Materializers that can append to an artifact should override this to
+        write each chunk as soon as it arrives.
+
+        Args:
+            chunks: Iterator over the chunks of the step output.
+        """
+        self.handle_return(self.combine_chunks(list(chunks)))
+
+    def combine_chunks(self, chunks: List[Any]) -> Any:
+        """Combines the chunks of a step output into a single object.
+
+        Args:
+            chunks: All chunks of the step output.
+
+        Returns:
+            The combined object that gets passed to `handle_return()`.
+
+        Raises:
+            NotImplementedError: If the materializer doesn't support chunked
+                outputs.
+        """
+        raise NotImplementedError(
+            f"Materializer {self.__class__.__name__} does not support step "
+            f"outputs that are yielded in chunks."
+        )
+
+    @classmethod
+    def get_step_read_options(
+        cls, step_resources: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Returns options that get passed to `handle_input()` when this
+        materializer reads an input of a step.
+
+        Materializers can use this to share objects between all inputs of
+        one step execution, e.g. a pipeline to which all reads are added.
+
+        Args:
+            step_resources: Dictionary shared by all inputs of the step
+                execution.
+
+        Returns:
+            Keyword arguments for `handle_input()`.
+        """
+        return {}
+
+    @classmethod
+    def supports_chunks(cls) -> bool:
+        """Returns whether the materializer can write step outputs that are
+        yielded in chunks, i.e. whether it overrides `handle_return_chunks()`
+        or `combine_chunks()`."""
+        return any(
+            getattr(cls, method) is not getattr(BaseMaterializer, method)
+            for method in ("handle_return_chunks", "combine_chunks")
+        )
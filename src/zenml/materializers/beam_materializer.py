@@ -12,34 +12,179 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
-from typing import Any, Type
+import io
+import os
+import pickle
+from typing import Any, Dict, Optional, Type, Union
 
 import apache_beam as beam
+import pyarrow as pa
 
+from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.materializers.built_in_materializer import (
+    PICKLE_PROTOCOL,
+    _BuiltInTypesUnpickler,
+    _to_built_in_types,
+)
+from zenml.utils import yaml_utils
+
+DATA_FILE_PREFIX = "data"
+METADATA_FILENAME = "beam.json"
+# Key of the pipeline shared by all inputs of a step execution.
+PIPELINE_RESOURCE_KEY = "beam_pipeline"
+
+
+class BuiltInTypesCoder(beam.coders.Coder):  # type: ignore[misc]
+    """Coder for elements consisting of built-in scalars and containers.
+
+    Unlike the `PickleCoder`, decoding never imports or calls anything, so
+    reading an artifact can't execute code.
+    """
+
+    def encode(self, value: Any) -> bytes:
+        """Encodes an element.
+
+        Raises:
+            TypeError: If the element contains other objects than built-in
+                scalars and containers.
+        """
+        return pickle.dumps(_to_built_in_types(value), protocol=PICKLE_PROTOCOL)
+
+    def decode(self, encoded: bytes) -> Any:
+        """Decodes an element."""
+        return _BuiltInTypesUnpickler(io.BytesIO(encoded)).load()
+
+    def is_deterministic(self) -> bool:
+        """Pickled sets and dicts depend on the insertion order."""
+        return False
 
 
 class BeamMaterializer(BaseMaterializer):
-    """Materializer to read data to and from beam."""
+    """Materializer to read data to and from beam.
+
+    Returned PCollections are written as sharded files by running the
+    pipeline that produces them. Consuming steps get a PCollection that
+    reads these files, so the data is never collected in memory. All inputs
+    of a step execution are read by the same pipeline, so they can be
+    combined. Elements are written to parquet files if a schema is
+    configured and to TFRecord files using `CODER` otherwise:
+
+        class UserMaterializer(BeamMaterializer):
+            SCHEMA = pa.schema([("name", pa.string()), ("age", pa.int64())])
+
+    The default coder only supports elements consisting of built-in types.
+    Arbitrary elements can be stored with `beam.coders.PickleCoder()`, but
+    artifacts written with it must only be read if they are trusted as
+    reading them can execute code.
+
+    Returned pipelines are only run, nothing is persisted for them.
+    """
 
     ASSOCIATED_TYPES = [beam.Pipeline, beam.PCollection]
 
-    def handle_input(self, data_type: Type[Any]) -> Any:
-        """Reads all files inside the artifact directory and materializes them
-        as a beam compatible output."""
-        # TODO [MEDIUM]: Implement beam reading
+    # Schema of the dict elements written to parquet files.
+    SCHEMA: Optional[pa.Schema] = None
+    # Number of files to write, 0 lets the runner decide.
+    NUM_SHARDS: int = 0
+    # Coder of the elements written to TFRecord files.
+    CODER: beam.coders.Coder = BuiltInTypesCoder()
+
+    @classmethod
+    def get_step_read_options(
+        cls, step_resources: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Adds the reads of all inputs of a step execution to one pipeline.
+
+        Args:
+            step_resources: Dictionary shared by all inputs of the step
+                execution.
+
+        Returns:
+            The `pipeline` argument of `handle_input()`.
+        """
+        pipeline = step_resources.get(PIPELINE_RESOURCE_KEY)
+        if pipeline is None:
+            # Inputs are read concurrently, `setdefault()` makes sure all of
+            # them get the same pipeline.
+            pipeline = step_resources.setdefault(
+                PIPELINE_RESOURCE_KEY, beam.Pipeline()
+            )
+        return {"pipeline": pipeline}
+
+    def handle_input(
+        self, data_type: Type[Any], pipeline: Optional[beam.Pipeline] = None
+    ) -> beam.PCollection:
+        """Reads all files inside the artifact directory as a PCollection.
+
+        Args:
+            data_type: What type the input should be materialized as.
+            pipeline: Pipeline to which the read transform is added. A new
+                pipeline using the direct runner is created if not given.
+
+        Returns:
+            A PCollection of the stored elements.
+
+        Raises:
+            ValueError: If the artifact contains no data.
+        """
         super().handle_input(data_type)
+        metadata_path = os.path.join(self.artifact.uri, METADATA_FILENAME)
+        if not fileio.exists(metadata_path):
+            raise ValueError(
+                f"Artifact {self.artifact.uri} contains no beam data, only "
+                f"returned PCollections are persisted."
+            )
+
+        metadata = yaml_utils.read_json(metadata_path)
+        if pipeline is None:
+            pipeline = beam.Pipeline()
+        file_pattern = os.path.join(self.artifact.uri, f"{DATA_FILE_PREFIX}*")
+        # Labels need to be unique if multiple artifacts are read by one
+        # pipeline.
+        label = f"Read {self.artifact.uri}"
+        if metadata["format"] == "parquet":
+            return pipeline | label >> beam.io.ReadFromParquet(file_pattern)
+        return pipeline | label >> beam.io.ReadFromTFRecord(
+            file_pattern, coder=self.CODER
+        )
 
-    def handle_return(self, pipeline: beam.Pipeline) -> None:
-        """Appends a beam.io.WriteToParquet at the end of a beam pipeline
-        and therefore persists the results.
+    def handle_return(
+        self, data: Union[beam.Pipeline, beam.PCollection]
+    ) -> None:
+        """Appends a transform writing a PCollection to the pipeline which
+        produces it and runs the pipeline.
 
         Args:
-            pipeline: A beam.pipeline object.
+            data: A PCollection to persist or a pipeline to run.
         """
-        # TODO [MEDIUM]: Implement beam writing
-        super().handle_return(pipeline)
-        pipeline | beam.ParDo()
-        pipeline.run()
-        # pipeline | beam.io.WriteToParquet(self.artifact.uri)
-        # pipeline.run()
+        super().handle_return(data)
+        if isinstance(data, beam.Pipeline):
+            data.run().wait_until_finish()
+            return
+
+        file_path_prefix = os.path.join(self.artifact.uri, DATA_FILE_PREFIX)
+        label = f"Write {self.artifact.uri}"
+        if self.SCHEMA is not None:
+            file_format = "parquet"
+            data | label >> beam.io.WriteToParquet(
+                file_path_prefix,
+                self.SCHEMA,
+                file_name_suffix=".parquet",
+                num_shards=self.NUM_SHARDS,
+            )
+        else:
+            file_format = "tfrecord"
+            data | label >> beam.io.WriteToTFRecord(
+                file_path_prefix,
+                coder=self.CODER,
+                file_name_suffix=".tfrecord",
+                num_shards=self.NUM_SHARDS,
+            )
+        data.pipeline.run().wait_until_finish()
+        # The metadata is written last so that incomplete artifacts can't be
+        # read.
+        yaml_utils.write_json(
+            os.path.join(self.artifact.uri, METADATA_FILENAME),
+            {"format": file_format},
+        )
@@ -0,0 +1,377 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Measures how fast materializers write and read synthetic payloads.
+
+Each payload is written and read through the real materializer classes,
+using artifact directories inside a given directory, usually the local
+artifact store. Read latencies measure the time until `handle_input()`
+returns, so memory-mapped data that isn't accessed yet isn't included.
+"""
+
+import math
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Type,
+)
+
+import numpy as np
+import pandas as pd
+
+from zenml.artifacts.data_artifact import DataArtifact
+from zenml.logger import get_logger
+from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.materializers.default_materializer_registry import (
+    default_materializer_registry,
+)
+
+logger = get_logger(__name__)
+
+MB = 1024 * 1024
+RSS_SAMPLE_INTERVAL_SECONDS = 0.005
+
+
+class BenchmarkCase(NamedTuple):
+    """Synthetic payload to benchmark.
+
+    Attributes:
+        name: Name used to select the case.
+        data_type: Type of the payload.
+        generate: Function creating a payload of roughly the given number of
+            bytes.
+    """
+
+    name: str
+    data_type: Type[Any]
+    generate: Callable[[int], Any]
+
+
+class BenchmarkResult(NamedTuple):
+    """Measurements of a materializer for one payload size.
+
+    Sizes are in MB, throughputs in MB/s and latencies in milliseconds.
+    The peak RSS is the maximum increase of the resident memory of the
+    process while writing or reading, `None` if it can't be measured.
+    """
+
+    case: str
+    materializer: str
+    size_mb: float
+    write_mb_s: float
+    read_mb_s: float
+    write_p50_ms: float
+    write_p99_ms: float
+    read_p50_ms: float
+    read_p99_ms: float
+    disk_mb: float
+    peak_rss_mb: Optional[float]
+
+
+def _generate_dataframe(num_bytes: int, num_columns: int) -> pd.DataFrame:
+    """Generates a dataframe of random floats."""
+    num_rows = max(1, num_bytes // (8 * num_columns))
+    return pd.DataFrame(
+        np.random.rand(num_rows, num_columns),
+        columns=[f"column_{i}" for i in range(num_columns)],
+    )
+
+
+def _generate_dict(num_bytes: int) -> Dict[str, Any]:
+    """Generates a dict with lists of ints and floats."""
+    num_items = max(1, num_bytes // 16)
+    return {
+        "ids": list(range(num_items)),
+        "scores": np.random.rand(num_items).tolist(),
+    }
+
+
+def _generate_sklearn_model(num_bytes: int) -> Any:
+    """Generates a kNN model storing its training data."""
+    from sklearn.neighbors import KNeighborsClassifier
+
+    num_rows = max(2, num_bytes // (8 * 16))
+    features = np.random.rand(num_rows, 16)
+    return KNeighborsClassifier().fit(features, np.arange(num_rows) % 2)
+
+
+def get_benchmark_cases() -> List[BenchmarkCase]:
+    """Returns all benchmark cases whose dependencies are installed."""
+    cases = [
+        BenchmarkCase(
+            "dataframe-narrow",
+            pd.DataFrame,
+            lambda num_bytes: _generate_dataframe(num_bytes, 4),
+        ),
+        BenchmarkCase(
+            "dataframe-wide",
+            pd.DataFrame,
+            lambda num_bytes: _generate_dataframe(num_bytes, 64),
+        ),
+        BenchmarkCase(
+            "ndarray",
+            np.ndarray,
+            lambda num_bytes: np.random.rand(max(1, num_bytes // 8)),
+        ),
+        BenchmarkCase("dict", dict, _generate_dict),
+    ]
+    try:
+        from sklearn.neighbors import KNeighborsClassifier
+
+        cases.append(
+            BenchmarkCase(
+                "sklearn", KNeighborsClassifier, _generate_sklearn_model
+            )
+        )
+    except ImportError:
+        logger.debug("sklearn not installed.")
+    return cases
+
+
+def _get_materializer_classes(
+    data_type: Type[Any],
+) -> List[Type[BaseMaterializer]]:
+    """Returns the default materializer for a type followed by all other
+    imported materializers associated with a base class of the type."""
+
+    def _get_subclasses(
+        cls: Type[BaseMaterializer],
+    ) -> Iterator[Type[BaseMaterializer]]:
+        for subclass in cls.__subclasses__():
+            yield subclass
+            yield from _get_subclasses(subclass)
+
+    registry = default_materializer_registry
+    for base_type in data_type.__mro__:
+        if registry.is_registered(base_type):
+            default = registry.get_single_materializer_type(base_type)
+            break
+    else:
+        return []
+
+    materializer_classes = [default]
+    for materializer_class in _get_subclasses(BaseMaterializer):
+        if materializer_class not in materializer_classes and any(
+            issubclass(data_type, associated_type)
+            for associated_type in materializer_class.ASSOCIATED_TYPES
+        ):
+            materializer_classes.append(materializer_class)
+    return materializer_classes
+
+
+def _get_payload_size(data: Any) -> int:
+    """Returns the in-memory size of a payload in bytes."""
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(deep=True).sum())
+    if isinstance(data, np.ndarray):
+        return int(data.nbytes)
+    return len(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _get_directory_size(path: str) -> int:
+    """Returns the total size of all files in a directory in bytes."""
+    return sum(
+        os.path.getsize(os.path.join(directory, file_name))
+        for directory, _, file_names in os.walk(path)
+        for file_name in file_names
+    )
+
+
+def _get_rss() -> Optional[int]:
+    """Returns the resident memory of this process in bytes or `None` if it
+    can't be measured."""
+    try:
+        import psutil
+
+        return int(psutil.Process().memory_info().rss)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+class _PeakRSSMonitor:
+    """Samples the resident memory of this process in a background thread
+    and keeps the maximum increase."""
+
+    def __init__(self) -> None:
+        """Initializes the monitor."""
+        self.peak_increase: Optional[int] = None
+        self._baseline: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        """Samples the resident memory until the monitor is stopped."""
+        while True:
+            rss = _get_rss()
+            if rss is not None and self._baseline is not None:
+                self.peak_increase = max(
+                    self.peak_increase or 0, rss - self._baseline
+                )
+            if self._stop.wait(RSS_SAMPLE_INTERVAL_SECONDS):
+                return
+
+    def __enter__(self) -> "_PeakRSSMonitor":
+        """Starts sampling."""
+        self._baseline = _get_rss()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stops sampling."""
+        self._stop.set()
+        self._thread.join()
+
+
+def _percentile(values: Sequence[float], percentile: float) -> float:
+    """Returns a percentile of some values using linear interpolation."""
+    values = sorted(values)
+    position = (len(values) - 1) * percentile / 100
+    lower, upper = math.floor(position), math.ceil(position)
+    return values[lower] + (values[upper] - values[lower]) * (
+        position - lower
+    )
+
+
+def benchmark_materializer(
+    materializer_class: Type[BaseMaterializer],
+    case: BenchmarkCase,
+    size_mb: float,
+    directory: str,
+    repetitions: int = 5,
+) -> BenchmarkResult:
+    """Writes and reads a payload repeatedly using a materializer.
+
+    Args:
+        materializer_class: The materializer to benchmark.
+        case: The payload to write and read.
+        size_mb: Approximate size of the payload.
+        directory: Directory in which the artifacts are created.
+        repetitions: How often the payload is written and read.
+
+    Returns:
+        The measurements.
+    """
+    data = case.generate(int(size_mb * MB))
+    payload_mb = _get_payload_size(data) / MB
+    write_seconds: List[float] = []
+    read_seconds: List[float] = []
+    disk_bytes = 0
+    peak_rss: Optional[int] = None
+
+    for _ in range(repetitions):
+        artifact = DataArtifact()
+        artifact.uri = tempfile.mkdtemp(dir=directory)
+        try:
+            with _PeakRSSMonitor() as write_monitor:
+                start = time.perf_counter()
+                materializer_class(artifact).handle_return(data)
+                write_seconds.append(time.perf_counter() - start)
+            disk_bytes = _get_directory_size(artifact.uri)
+
+            with _PeakRSSMonitor() as read_monitor:
+                start = time.perf_counter()
+                loaded = materializer_class(artifact).handle_input(
+                    case.data_type
+                )
+                read_seconds.append(time.perf_counter() - start)
+            del loaded
+
+            for monitor in (write_monitor, read_monitor):
+                if monitor.peak_increase is not None:
+                    peak_rss = max(peak_rss or 0, monitor.peak_increase)
+        finally:
+            shutil.rmtree(artifact.uri, ignore_errors=True)
+
+    return BenchmarkResult(
+        case=case.name,
+        materializer=materializer_class.__name__,
+        size_mb=round(payload_mb, 3),
+        write_mb_s=round(payload_mb / _percentile(write_seconds, 50), 1),
+        read_mb_s=round(payload_mb / _percentile(read_seconds, 50), 1),
+        write_p50_ms=round(_percentile(write_seconds, 50) * 1000, 2),
+        write_p99_ms=round(_percentile(write_seconds, 99) * 1000, 2),
+        read_p50_ms=round(_percentile(read_seconds, 50) * 1000, 2),
+        read_p99_ms=round(_percentile(read_seconds, 99) * 1000, 2),
+        disk_mb=round(disk_bytes / MB, 3),
+        peak_rss_mb=None if peak_rss is None else round(peak_rss / MB, 1),
+    )
+
+
+def benchmark_materializers(
+    directory: str,
+    sizes_mb: Sequence[float] = (1, 10, 100),
+    repetitions: int = 5,
+    case_names: Optional[Sequence[str]] = None,
+) -> List[BenchmarkResult]:
+    """Benchmarks all materializers for all payloads and sizes.
+
+    Materializers that fail for a payload, e.g. because of a missing
+    optional dependency, are skipped with a warning.
+
+    Args:
+        directory: Directory in which the artifacts are created.
+        sizes_mb: Approximate payload sizes.
+        repetitions: How often each payload is written and read.
+        case_names: Names of the cases to run, all cases if not given.
+
+    Returns:
+        The measurements of all materializers, payloads and sizes.
+    """
+    results = []
+    for case in get_benchmark_cases():
+        if case_names and case.name not in case_names:
+            continue
+        for materializer_class in _get_materializer_classes(case.data_type):
+            for size_mb in sizes_mb:
+                logger.debug(
+                    "Benchmarking %s with %s of %s MB.",
+                    materializer_class.__name__,
+                    case.name,
+                    size_mb,
+                )
+                try:
+                    results.append(
+                        benchmark_materializer(
+                            materializer_class,
+                            case,
+                            size_mb,
+                            directory,
+                            repetitions=repetitions,
+                        )
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "Skipping %s for %s: %s",
+                        materializer_class.__name__,
+                        case.name,
+                        e,
+                    )
+                    break
+    return results
@@ -11,19 +11,133 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import io
 import os
+import pickle
 from typing import Any, Type
 
+from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.utils import yaml_utils
 
 logger = get_logger(__name__)
 DEFAULT_FILENAME = "data.json"
+BINARY_FILENAME = "data.bin"
+# Protocol 4 can still be read by all supported Python versions.
+PICKLE_PROTOCOL = 4
+# Built-in types that are pickled with a reference to their class.
+ALLOWED_GLOBALS = {
+    ("builtins", "bytearray"),
+    ("builtins", "complex"),
+    ("builtins", "frozenset"),
+    ("builtins", "set"),
+}
+
+
+# Types that are pickled without a reference to a class outside of
+# `ALLOWED_GLOBALS`. Instances of subclasses are converted to these types.
+_SCALAR_TYPES = (type(None), bool, int, float, complex, str, bytes, bytearray)
+_CONTAINER_TYPES = (dict, list, tuple, set, frozenset)
+_EXACT_SCALAR_TYPES = frozenset(_SCALAR_TYPES)
+
+
+def _to_built_in_scalar(value: Any) -> Any:
+    """Converts a scalar like a numpy number or an `IntEnum` member to the
+    built-in type it represents.
+
+    Raises:
+        TypeError: If the value is no scalar, e.g. a function or a class.
+    """
+    if type(value).__module__ == "numpy" and hasattr(value, "item"):
+        # Numpy scalars, e.g. `np.float64` or `np.int64`.
+        value = value.item()
+    if type(value) in _EXACT_SCALAR_TYPES:
+        return value
+    if isinstance(value, str):
+        # `str()` would call an overridden `__str__`, e.g. of enums.
+        return str.__str__(value)
+    for scalar_type in _SCALAR_TYPES[1:]:
+        if isinstance(value, scalar_type):
+            return scalar_type(value)
+    raise TypeError(
+        f"Objects of type {type(value)} can't be stored by the "
+        f"`BuiltInMaterializer`, please use a custom materializer."
+    )
+
+
+def _to_built_in_types(data: Any) -> Any:
+    """Converts a value to only consist of built-in scalars and containers.
+
+    Subclasses of built-in types and numpy scalars are converted to the
+    built-in type they represent. Containers whose elements are all built-in
+    scalars are returned without copying them.
+
+    Args:
+        data: The value to convert.
+
+    Returns:
+        The value with all subclasses replaced by their built-in types.
+
+    Raises:
+        TypeError: If the value contains any other object, e.g. a function
+            or a class.
+    """
+    data_type = type(data)
+    if data_type in _EXACT_SCALAR_TYPES:
+        return data
+    if isinstance(data, dict):
+        if data_type is dict and set(
+            map(type, [*data.keys(), *data.values()])
+        ) <= _EXACT_SCALAR_TYPES:
+            return data
+        return {
+            _to_built_in_types(key): _to_built_in_types(value)
+            for key, value in data.items()
+        }
+    for container_type in _CONTAINER_TYPES[1:]:
+        if isinstance(data, container_type):
+            if (
+                data_type is container_type
+                and set(map(type, data)) <= _EXACT_SCALAR_TYPES
+            ):
+                return data
+            return container_type(map(_to_built_in_types, data))
+    return _to_built_in_scalar(data)
+
+
+class _BuiltInTypesUnpickler(pickle.Unpickler):
+    """Unpickler that never imports or calls anything except the classes of
+    a few built-in types."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        """Returns allowed built-in classes.
+
+        Raises:
+            pickle.UnpicklingError: For all other classes.
+        """
+        if (module, name) in ALLOWED_GLOBALS:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(
+            f"Refusing to load `{module}.{name}` from a built-in artifact."
+        )
 
 
 class BuiltInMaterializer(BaseMaterializer):
-    """Read/Write JSON files."""
+    """Read/Write built-in types as JSON or binary files.
+
+    By default values are stored as JSON files. A binary format, which is
+    the pickle format restricted to built-in types, can be used by
+    subclassing this materializer:
+
+        class BinaryMaterializer(BuiltInMaterializer):
+            FORMAT = "binary"
+
+    It stores each value with its built-in type, so tuples, bytes and sets
+    round-trip exactly, and encoding is much faster than JSON. Numpy scalars
+    and subclasses of built-in types, e.g. `IntEnum` members, are stored as
+    the built-in type they represent. Both formats can always be read.
+    """
 
     ASSOCIATED_TYPES = [
         int,
@@ -35,11 +149,22 @@ class BuiltInMaterializer(BaseMaterializer):
         tuple,
     ]
 
+    # Either `json` or `binary`.
+    FORMAT: str = "json"
+
     def handle_input(self, data_type: Type[Any]) -> Any:
-        """Reads basic primitive types from json."""
+        """Reads basic primitive types from a binary or json file."""
         super().handle_input(data_type)
+        binary_filepath = os.path.join(self.artifact.uri, BINARY_FILENAME)
+        if fileio.exists(binary_filepath):
+            with fileio.open(binary_filepath, "rb") as f:
+                return _BuiltInTypesUnpickler(io.BytesIO(f.read())).load()
+
         filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
         contents = yaml_utils.read_json(filepath)
+        if data_type is tuple and isinstance(contents, list):
+            # JSON has no tuples.
+            return tuple(contents)
         if type(contents) != data_type:
             # TODO [LOW]: Raise error or try to coerce
             logger.debug(
@@ -49,7 +174,25 @@ class BuiltInMaterializer(BaseMaterializer):
         return contents
 
     def handle_return(self, data: Any) -> None:
-        """Handles basic built-in types and stores them as json"""
+        """Handles basic built-in types and stores them in binary or json
+        files.
+
+        Raises:
+            ValueError: If the format is unknown.
+            TypeError: If the binary format is used and the data contains
+                other objects than scalars and containers, e.g. functions.
+        """
         super().handle_return(data)
-        filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
-        yaml_utils.write_json(filepath, data)
+        if self.FORMAT == "json":
+            filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
+            yaml_utils.write_json(filepath, data)
+        elif self.FORMAT == "binary":
+            # Converted before writing so that only artifacts which
+            # `_BuiltInTypesUnpickler` can read are written.
+            data = _to_built_in_types(data)
+            with fileio.open(
+                os.path.join(self.artifact.uri, BINARY_FILENAME), "wb"
+            ) as f:
+                f.write(pickle.dumps(data, protocol=PICKLE_PROTOCOL))
+        else:
+            raise ValueError(f"Unknown format `{self.FORMAT}`.")
@@ -0,0 +1,293 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import bz2
+import lzma
+import math
+import os
+import zlib
+from concurrent import futures
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Type, Union
+
+import numpy as np
+
+from zenml.io import fileio
+from zenml.materializers.numpy_materializer import NumpyMaterializer
+from zenml.utils import yaml_utils
+
+METADATA_FILENAME = "chunks.json"
+CHUNK_FILENAME_FORMAT = "chunk_{:06d}"
+
+Codec = Tuple[Callable[[bytes, int], bytes], Callable[[bytes], bytes]]
+
+
+def _get_codec(name: str) -> Codec:
+    """Returns the compression and decompression functions of a codec.
+
+    Args:
+        name: One of `none`, `zlib`, `bz2`, `lzma`, `zstd` or `lz4`. The
+            last two require the `zstandard` and `lz4` packages.
+
+    Returns:
+        A tuple of a function that compresses bytes with a given level and a
+        function that decompresses them.
+
+    Raises:
+        ValueError: If the codec is unknown.
+        ImportError: If the package required by the codec isn't installed.
+    """
+    if name == "none":
+        return (lambda data, level: data), (lambda data: data)
+    if name == "zlib":
+        return zlib.compress, zlib.decompress
+    if name == "bz2":
+        return bz2.compress, bz2.decompress
+    if name == "lzma":
+        return (
+            lambda data, level: lzma.compress(data, preset=level),
+            lzma.decompress,
+        )
+    if name == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "The `zstd` codec requires the `zstandard` package, please "
+                "install it with `pip install zstandard`."
+            ) from e
+
+        return (
+            lambda data, level: zstandard.ZstdCompressor(level=level).compress(
+                data
+            ),
+            lambda data: zstandard.ZstdDecompressor().decompress(data),
+        )
+    if name == "lz4":
+        try:
+            import lz4.frame
+        except ImportError as e:
+            raise ImportError(
+                "The `lz4` codec requires the `lz4` package, please install "
+                "it with `pip install lz4`."
+            ) from e
+
+        return (
+            lambda data, level: lz4.frame.compress(
+                data, compression_level=level
+            ),
+            lz4.frame.decompress,
+        )
+    raise ValueError(f"Unknown compression codec `{name}`.")
+
+
+class ChunkedNumpyMaterializer(NumpyMaterializer):
+    """Materializer that splits numpy arrays into compressed chunks along
+    their first axis.
+
+    Chunks are compressed independently and written and read by multiple
+    threads. Reading an artifact with `ArtifactView.read(rows=...)` only
+    loads the chunks that contain the requested rows. The codec, level and
+    chunk size can be configured by subclassing this materializer:
+
+        class ZstdNumpyMaterializer(ChunkedNumpyMaterializer):
+            CODEC = "zstd"
+            COMPRESSION_LEVEL = 3
+
+    This materializer is not the default for numpy arrays, steps need to use
+    it explicitly via `with_return_materializers()`.
+    """
+
+    CODEC: str = "zlib"
+    COMPRESSION_LEVEL: int = 1
+    CHUNK_SIZE_BYTES: int = 64 * 1024 * 1024
+    MAX_WORKERS: int = min(8, os.cpu_count() or 1)
+
+    def _map_chunks(
+        self, function: Callable[[int], Any], chunk_ids: Iterable[int]
+    ) -> Dict[int, Any]:
+        """Calls a function for multiple chunks using up to `MAX_WORKERS`
+        threads."""
+        with futures.ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS, thread_name_prefix="zenml_chunks"
+        ) as executor:
+            results = {i: executor.submit(function, i) for i in chunk_ids}
+            return {i: result.result() for i, result in results.items()}
+
+    def _get_chunk_path(self, chunk_id: int) -> str:
+        """Returns the path of a chunk file."""
+        return os.path.join(
+            self.artifact.uri, CHUNK_FILENAME_FORMAT.format(chunk_id)
+        )
+
+    def handle_input(
+        self,
+        data_type: Type[Any],
+        rows: Optional[Union[int, slice]] = None,
+    ) -> np.ndarray:
+        """Reads the chunks of a numpy array.
+
+        Args:
+            data_type: What type the input should be materialized as.
+            rows: Optional index or slice along the first axis. Only the
+                chunks containing these rows are read.
+
+        Returns:
+            The array or the selected rows of it.
+        """
+        metadata_path = os.path.join(self.artifact.uri, METADATA_FILENAME)
+        if not fileio.exists(metadata_path):
+            # Not written in chunks, e.g. after switching materializers.
+            arr = super().handle_input(data_type)
+            return arr if rows is None else arr[rows]
+
+        metadata = yaml_utils.read_json(metadata_path)
+        shape = tuple(metadata["shape"])
+        num_rows = shape[0] if shape else 1
+        reader = _ChunkReader(
+            self,
+            dtype=np.lib.format.descr_to_dtype(metadata["dtype"]),
+            row_shape=shape[1:],
+            num_rows=num_rows,
+            chunk_rows=metadata["chunk_rows"],
+            decompress=_get_codec(metadata["codec"])[1],
+        )
+        if rows is None:
+            return reader.read_rows(range(num_rows)).reshape(shape)
+
+        selection = range(num_rows)[rows]
+        if isinstance(selection, int):
+            return reader.read_rows(range(selection, selection + 1))[0]
+        return reader.read_rows(selection)
+
+    def handle_return(self, arr: np.ndarray) -> None:
+        """Writes a numpy array as compressed chunks.
+
+        Args:
+            arr: The numpy array to write.
+
+        Raises:
+            ValueError: If the array contains Python objects.
+        """
+        if arr.dtype.hasobject:
+            raise ValueError(
+                "Arrays of Python objects can't be stored in chunks, please "
+                "use the `NumpyMaterializer` instead."
+            )
+        rows = np.atleast_1d(arr)
+        row_nbytes = rows.itemsize * int(np.prod(rows.shape[1:]))
+        chunk_rows = max(1, self.CHUNK_SIZE_BYTES // max(row_nbytes, 1))
+        num_chunks = math.ceil(len(rows) / chunk_rows)
+        compress = _get_codec(self.CODEC)[0]
+
+        def _write_chunk(chunk_id: int) -> None:
+            chunk = rows[chunk_id * chunk_rows : (chunk_id + 1) * chunk_rows]
+            data = compress(
+                np.ascontiguousarray(chunk).tobytes(), self.COMPRESSION_LEVEL
+            )
+            with fileio.open(self._get_chunk_path(chunk_id), "wb") as f:
+                f.write(data)
+
+        self._map_chunks(_write_chunk, range(num_chunks))
+        # The metadata is written last so that incomplete artifacts are
+        # never read as chunked arrays.
+        yaml_utils.write_json(
+            os.path.join(self.artifact.uri, METADATA_FILENAME),
+            {
+                "shape": list(arr.shape),
+                "dtype": np.lib.format.dtype_to_descr(arr.dtype),
+                "chunk_rows": chunk_rows,
+                "codec": self.CODEC,
+            },
+        )
+
+
+class _ChunkReader:
+    """Reads rows of a chunked array."""
+
+    def __init__(
+        self,
+        materializer: ChunkedNumpyMaterializer,
+        dtype: np.dtype,
+        row_shape: Tuple[int, ...],
+        num_rows: int,
+        chunk_rows: int,
+        decompress: Callable[[bytes], bytes],
+    ) -> None:
+        """Initializes the reader.
+
+        Args:
+            materializer: The materializer that wrote the chunks.
+            dtype: Data type of the array.
+            row_shape: Shape of the array without the first axis.
+            num_rows: Length of the first axis.
+            chunk_rows: Number of rows per chunk.
+            decompress: Function that decompresses a chunk.
+        """
+        self._materializer = materializer
+        self._dtype = dtype
+        self._row_shape = row_shape
+        self._num_rows = num_rows
+        self._chunk_rows = chunk_rows
+        self._decompress = decompress
+
+    def _read_chunk(self, chunk_id: int) -> np.ndarray:
+        """Reads and decompresses a single chunk."""
+        path = self._materializer._get_chunk_path(chunk_id)
+        with fileio.open(path, "rb") as f:
+            data = self._decompress(f.read())
+        first_row = chunk_id * self._chunk_rows
+        num_rows = min(self._chunk_rows, self._num_rows - first_row)
+        return np.frombuffer(data, dtype=self._dtype).reshape(
+            (num_rows,) + self._row_shape
+        )
+
+    def read_rows(self, rows: range) -> np.ndarray:
+        """Reads a range of rows.
+
+        Args:
+            rows: The rows to read, the step may be negative.
+
+        Returns:
+            A new array containing the rows.
+        """
+        if len(rows) == 0:
+            return np.empty((0,) + self._row_shape, dtype=self._dtype)
+        if rows.step != 1:
+            # Read all rows between the first and last requested one and
+            # only keep the requested rows.
+            first, last = min(rows[0], rows[-1]), max(rows[0], rows[-1])
+            contiguous_rows = self.read_rows(range(first, last + 1))
+            return np.ascontiguousarray(
+                contiguous_rows[rows.start - first :: rows.step]
+            )
+
+        result = np.empty((len(rows),) + self._row_shape, dtype=self._dtype)
+
+        def _copy_chunk(chunk_id: int) -> None:
+            chunk = self._read_chunk(chunk_id)
+            chunk_start = chunk_id * self._chunk_rows
+            start = max(rows.start, chunk_start)
+            stop = min(rows.stop, chunk_start + len(chunk))
+            result[start - rows.start : stop - rows.start] = chunk[
+                start - chunk_start : stop - chunk_start
+            ]
+
+        self._materializer._map_chunks(
+            _copy_chunk,
+            range(
+                rows.start // self._chunk_rows,
+                (rows.stop - 1) // self._chunk_rows + 1,
+            ),
+        )
+        return result
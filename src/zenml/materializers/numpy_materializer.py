@@ -19,40 +19,98 @@ import numpy as np
 import pyarrow as pa
 import pyarrow.parquet as pq
 
+from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import yaml_utils
+from zenml.utils import path_utils, yaml_utils
 
-DATA_FILENAME = "data.parquet"
+DATA_FILENAME = "data.npy"
+# Files of the parquet format, used for arrays of Python objects
+PARQUET_DATA_FILENAME = "data.parquet"
 SHAPE_FILENAME = "shape.json"
 DATA_VAR = "data_var"
 
 
+def load_npy_file(path: str) -> np.ndarray:
+    """Loads a `.npy` file, memory-mapped read-only if it's stored locally.
+
+    Args:
+        path: Path of the file.
+
+    Returns:
+        The array.
+
+    Raises:
+        ValueError: If the file contains pickled Python objects, which are
+            never loaded as unpickling can run arbitrary code.
+    """
+    if not path_utils.is_remote(path):
+        try:
+            return np.load(path, mmap_mode="r")
+        except ValueError:
+            # Empty arrays can't be memory-mapped.
+            pass
+    with fileio.open(path, "rb") as f:
+        return np.load(f, allow_pickle=False)
+
+
 class NumpyMaterializer(BaseMaterializer):
-    """Materializer to read data to and from pandas."""
+    """Materializer to read and write numpy arrays as `.npy` files.
+
+    Arrays of Python objects are stored as parquet files instead, so that
+    reading an artifact never unpickles anything.
+    """
 
     ASSOCIATED_TYPES = [np.ndarray]
 
     def handle_input(self, data_type: Type[Any]) -> np.ndarray:
-        """Reads numpy array from parquet file."""
+        """Reads a numpy array from a `.npy` file.
+
+        Arrays in local artifact stores are memory-mapped read-only, so no
+        data is copied until the step accesses it. Arrays of Python objects
+        and artifacts written by previous versions are read from parquet
+        files.
+        """
         super().handle_input(data_type)
+        data_path = os.path.join(self.artifact.uri, DATA_FILENAME)
+        if not fileio.exists(data_path):
+            return self._read_parquet()
+        return load_npy_file(data_path)
+
+    def _read_parquet(self) -> np.ndarray:
+        """Reads a numpy array written as a parquet file."""
         shape_dict = yaml_utils.read_json(
             os.path.join(self.artifact.uri, SHAPE_FILENAME)
         )
         shape_tuple = tuple(shape_dict.values())
-        data = pq.read_table(os.path.join(self.artifact.uri, DATA_FILENAME))
+        data = pq.read_table(
+            os.path.join(self.artifact.uri, PARQUET_DATA_FILENAME)
+        )
         vals = getattr(data.to_pandas(), DATA_VAR).values
         return np.reshape(vals, shape_tuple)
 
     def handle_return(self, arr: np.ndarray) -> None:
-        """Writes a np.ndarray to the artifact store as a parquet file.
+        """Writes a np.ndarray to the artifact store as a `.npy` file, or as
+        a parquet file if it contains Python objects.
 
         Args:
             arr: The numpy array to write.
         """
         super().handle_return(arr)
+        if arr.dtype.hasobject:
+            self._write_parquet(arr)
+            return
+        with fileio.open(
+            os.path.join(self.artifact.uri, DATA_FILENAME), "wb"
+        ) as f:
+            np.save(f, arr, allow_pickle=False)
+
+    def _write_parquet(self, arr: np.ndarray) -> None:
+        """Writes a numpy array as a flattened parquet table."""
         yaml_utils.write_json(
             os.path.join(self.artifact.uri, SHAPE_FILENAME),
             {str(i): x for i, x in enumerate(arr.shape)},
         )
         pa_table = pa.table({DATA_VAR: arr.flatten()})
-        pq.write_table(pa_table, os.path.join(self.artifact.uri, DATA_FILENAME))
+        pq.write_table(
+            pa_table, os.path.join(self.artifact.uri, PARQUET_DATA_FILENAME)
+        )
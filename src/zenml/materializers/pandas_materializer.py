@@ -13,27 +13,161 @@
 #  permissions and limitations under the License.
 
 import os
-from typing import Any, Type
+from typing import Any, Dict, Iterator, List, Optional, Type
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
+from zenml.constants import (
+    ENV_ZENML_PARQUET_COMPRESSION,
+    ENV_ZENML_PARQUET_COMPRESSION_LEVEL,
+    ENV_ZENML_PARQUET_DISABLE_DICTIONARY,
+    ENV_ZENML_PARQUET_ROW_GROUP_SIZE,
+    handle_bool_env_var,
+)
+from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
 
-DEFAULT_FILENAME = "df.parquet.gzip"
-COMPRESSION_TYPE = "gzip"
+DEFAULT_FILENAME = "df.parquet"
+# Filename used by previous versions which always compressed with gzip
+LEGACY_FILENAME = "df.parquet.gzip"
+
+COMPRESSION_PROPERTY_KEY = "parquet_compression"
+COMPRESSION_LEVEL_PROPERTY_KEY = "parquet_compression_level"
+ROW_GROUP_SIZE_PROPERTY_KEY = "parquet_row_group_size"
+USE_DICTIONARY_PROPERTY_KEY = "parquet_use_dictionary"
+
+DEFAULT_COMPRESSION = "snappy"
+DEFAULT_ROW_GROUP_SIZE = 1024 * 1024
+
+
+def _get_optional_int_env_var(var: str) -> Optional[int]:
+    """Returns the value of an integer environment variable or `None` if
+    it's not set or not an integer."""
+    value = os.getenv(var)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
 
 
 class PandasMaterializer(BaseMaterializer):
-    """Materializer to read data to and from pandas."""
+    """Materializer to read data to and from pandas.
+
+    Dataframes are written as parquet files. The defaults for all writes can
+    be set with the `ZENML_PARQUET_COMPRESSION`,
+    `ZENML_PARQUET_COMPRESSION_LEVEL`, `ZENML_PARQUET_ROW_GROUP_SIZE` and
+    `ZENML_PARQUET_DISABLE_DICTIONARY` environment variables of the stack
+    that runs the pipeline, which are read each time an artifact is
+    written. Single steps can use other settings by
+    subclassing this materializer:
+
+        class ZstdPandasMaterializer(PandasMaterializer):
+            COMPRESSION = "zstd"
+            COMPRESSION_LEVEL = 3
+
+    The settings are stored as custom properties of the written artifacts.
+    Reading doesn't depend on them, parquet files describe their encoding.
+    """
 
     ASSOCIATED_TYPES = [pd.DataFrame]
 
-    def handle_input(self, data_type: Type[Any]) -> pd.DataFrame:
-        """Reads pd.Dataframe from a parquet file."""
-        super().handle_input(data_type)
-        return pd.read_parquet(
-            os.path.join(self.artifact.uri, DEFAULT_FILENAME)
+    # Settings that are `None` are read from the environment variables when
+    # writing, falling back to the defaults below.
+    # One of `snappy`, `gzip`, `brotli`, `zstd`, `lz4` or `none`.
+    COMPRESSION: Optional[str] = None
+    # Uses the default level of the codec if not set.
+    COMPRESSION_LEVEL: Optional[int] = None
+    # Maximum number of rows per row group. Smaller row groups allow reads
+    # with filters to skip more data.
+    ROW_GROUP_SIZE: Optional[int] = None
+    USE_DICTIONARY: Optional[bool] = None
+
+    def _get_row_group_size(self) -> int:
+        """Returns the maximum number of rows per row group."""
+        if self.ROW_GROUP_SIZE is not None:
+            return self.ROW_GROUP_SIZE
+        row_group_size = _get_optional_int_env_var(
+            ENV_ZENML_PARQUET_ROW_GROUP_SIZE
+        )
+        if row_group_size is not None:
+            return row_group_size
+        return DEFAULT_ROW_GROUP_SIZE
+
+    def _get_write_options(self) -> Dict[str, Any]:
+        """Returns the options for the parquet writer and records them and
+        the row group size as custom properties of the artifact."""
+        compression = self.COMPRESSION
+        if compression is None:
+            compression = os.getenv(
+                ENV_ZENML_PARQUET_COMPRESSION, DEFAULT_COMPRESSION
+            )
+        compression_level = self.COMPRESSION_LEVEL
+        if compression_level is None:
+            compression_level = _get_optional_int_env_var(
+                ENV_ZENML_PARQUET_COMPRESSION_LEVEL
+            )
+        use_dictionary = self.USE_DICTIONARY
+        if use_dictionary is None:
+            use_dictionary = not handle_bool_env_var(
+                ENV_ZENML_PARQUET_DISABLE_DICTIONARY
+            )
+
+        self.artifact.set_string_custom_property(
+            COMPRESSION_PROPERTY_KEY, compression
         )
+        if compression_level is not None:
+            self.artifact.set_int_custom_property(
+                COMPRESSION_LEVEL_PROPERTY_KEY, compression_level
+            )
+        self.artifact.set_int_custom_property(
+            ROW_GROUP_SIZE_PROPERTY_KEY, self._get_row_group_size()
+        )
+        self.artifact.set_int_custom_property(
+            USE_DICTIONARY_PROPERTY_KEY, int(use_dictionary)
+        )
+        return {
+            "compression": None if compression == "none" else compression,
+            "compression_level": compression_level,
+            "use_dictionary": use_dictionary,
+        }
+
+    def _get_filepath(self) -> str:
+        """Returns the path of the parquet file of the artifact."""
+        filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
+        legacy_filepath = os.path.join(self.artifact.uri, LEGACY_FILENAME)
+        if not fileio.exists(filepath) and fileio.exists(legacy_filepath):
+            return legacy_filepath
+        return filepath
+
+    def handle_input(
+        self,
+        data_type: Type[Any],
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Any]] = None,
+    ) -> pd.DataFrame:
+        """Reads pd.Dataframe from a parquet file.
+
+        Args:
+            data_type: What type the input should be materialized as.
+            columns: If given, only these columns are read.
+            filters: Row filters in the DNF format of `pyarrow.parquet`, e.g.
+                `[("year", ">=", 2020)]`. Row groups whose statistics don't
+                match the filters are skipped without reading them.
+
+        Returns:
+            The dataframe.
+        """
+        super().handle_input(data_type)
+        read_options: Dict[str, Any] = {}
+        if columns is not None:
+            read_options["columns"] = columns
+        if filters is not None:
+            read_options["filters"] = filters
+        return pd.read_parquet(self._get_filepath(), **read_options)
 
     def handle_return(self, df: pd.DataFrame) -> None:
         """Writes a pandas dataframe to the specified filename.
@@ -43,4 +177,43 @@ class PandasMaterializer(BaseMaterializer):
         """
         super().handle_return(df)
         filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
-        df.to_parquet(filepath, compression=COMPRESSION_TYPE)
+        df.to_parquet(
+            filepath,
+            row_group_size=self._get_row_group_size(),
+            **self._get_write_options(),
+        )
+
+    def handle_return_chunks(self, chunks: Iterator[pd.DataFrame]) -> None:
+        """Appends each dataframe chunk as a row group to the parquet file.
+
+        All chunks need to have the same columns and dtypes as the first one.
+
+        Args:
+            chunks: Iterator over the dataframe chunks to write.
+        """
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            self.handle_return(pd.DataFrame())
+            return
+
+        # Range indices are only stored as metadata of the first chunk, so
+        # they would be wrong for all following chunks. Concatenating chunks
+        # with range indices results in a fresh range index anyway.
+        preserve_index = not isinstance(first_chunk.index, pd.RangeIndex)
+        table = pa.Table.from_pandas(first_chunk, preserve_index=preserve_index)
+        filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
+        row_group_size = self._get_row_group_size()
+        with fileio.open(filepath, "wb") as f:
+            with pq.ParquetWriter(
+                f, table.schema, **self._get_write_options()
+            ) as writer:
+                writer.write_table(table, row_group_size=row_group_size)
+                for chunk in chunks:
+                    writer.write_table(
+                        pa.Table.from_pandas(
+                            chunk,
+                            schema=table.schema,
+                            preserve_index=preserve_index,
+                        ),
+                        row_group_size=row_group_size,
+                    )
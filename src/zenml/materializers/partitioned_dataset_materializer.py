@@ -0,0 +1,341 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import datetime
+import functools
+import os
+from concurrent import futures
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Type
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+from tfx.types import artifact_utils
+
+from zenml.io import fileio
+from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.utils import path_utils, yaml_utils
+
+METADATA_FILENAME = "partitions.json"
+PARTITION_FILENAME = "part-0.parquet"
+SPLIT_NAMES_PROPERTY_KEY = "split_names"
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+PartitionKey = Tuple[Any, ...]
+
+# Types of partition column values and how they are restored from strings.
+# Subclasses need to come before their base classes.
+_VALUE_TYPES: List[Tuple[str, Type[Any], Callable[[str], Any]]] = [
+    ("bool", bool, lambda value: value == "True"),
+    ("int", int, int),
+    ("float", float, float),
+    ("str", str, str),
+    ("timestamp", pd.Timestamp, pd.Timestamp),
+    (
+        "datetime",
+        datetime.datetime,
+        lambda value: pd.Timestamp(value).to_pydatetime(),
+    ),
+    ("date", datetime.date, lambda value: pd.Timestamp(value).date()),
+]
+
+
+def _encode_value(value: Any) -> Tuple[str, str]:
+    """Converts a partition column value to a type name and a string.
+
+    Raises:
+        TypeError: If values of this type can't be stored.
+    """
+    for type_name, value_type, _ in _VALUE_TYPES:
+        if isinstance(value, value_type):
+            if isinstance(value, datetime.date):
+                return type_name, value.isoformat()
+            return type_name, str(value)
+    raise TypeError(
+        f"Partition column values of type {type(value)} can't be stored, "
+        f"supported types are {[name for name, _, _ in _VALUE_TYPES]}."
+    )
+
+
+def _decode_value(type_name: str, value: str) -> Any:
+    """Restores a partition column value from its type name and string.
+
+    Raises:
+        ValueError: If the type name is unknown.
+    """
+    for name, _, decode in _VALUE_TYPES:
+        if name == type_name:
+            return decode(value)
+    raise ValueError(f"Unknown partition column value type `{type_name}`.")
+
+
+def _map_partitions(
+    function: Callable[[PartitionKey], Any], keys: Sequence[PartitionKey]
+) -> List[Any]:
+    """Calls a function for multiple partitions using up to `MAX_WORKERS`
+    threads and returns the results in the order of the keys."""
+    if len(keys) <= 1:
+        return [function(key) for key in keys]
+    with futures.ThreadPoolExecutor(
+        max_workers=MAX_WORKERS, thread_name_prefix="zenml_partitions"
+    ) as executor:
+        return list(executor.map(function, keys))
+
+
+class PartitionedDataset:
+    """Dataframe split into partitions by the values of some of its columns.
+
+    Steps create partitioned datasets from dataframes:
+
+        @step
+        def splitter(df: pd.DataFrame) -> PartitionedDataset:
+            return PartitionedDataset.from_dataframe(df, ["split"])
+
+    Consuming steps get a dataset whose partitions are only read from the
+    artifact store once they are accessed:
+
+        @step
+        def trainer(dataset: PartitionedDataset) -> ...:
+            train_df = dataset.read(split="train")
+    """
+
+    def __init__(
+        self,
+        partition_cols: Sequence[str],
+        partitions: Dict[PartitionKey, Callable[[], pd.DataFrame]],
+    ) -> None:
+        """Initializes the dataset.
+
+        Args:
+            partition_cols: Names of the columns the dataset is partitioned
+                by.
+            partitions: Maps the values of the partition columns to functions
+                returning the rows with these values.
+        """
+        self._partition_cols = list(partition_cols)
+        self._partitions = partitions
+
+    @classmethod
+    def from_dataframe(
+        cls, df: pd.DataFrame, partition_cols: Sequence[str]
+    ) -> "PartitionedDataset":
+        """Partitions a dataframe.
+
+        Args:
+            df: The dataframe to partition.
+            partition_cols: Names of the columns to partition by.
+
+        Returns:
+            The partitioned dataset.
+
+        Raises:
+            ValueError: If no partition columns are given or one of them
+                contains missing values.
+        """
+        partition_cols = list(partition_cols)
+        if not partition_cols:
+            raise ValueError("At least one partition column is required.")
+        if df[partition_cols].isnull().values.any():
+            raise ValueError(
+                f"Partition columns {partition_cols} can't contain missing "
+                f"values."
+            )
+
+        partitions: Dict[PartitionKey, Callable[[], pd.DataFrame]] = {}
+        for values, group in df.groupby(partition_cols, sort=True):
+            if not isinstance(values, tuple):
+                values = (values,)
+            key = tuple(
+                value.item() if isinstance(value, np.generic) else value
+                for value in values
+            )
+            partitions[key] = group.copy
+        return cls(partition_cols, partitions)
+
+    @property
+    def partition_cols(self) -> List[str]:
+        """Returns the names of the columns the dataset is partitioned by."""
+        return list(self._partition_cols)
+
+    @property
+    def partitions(self) -> List[Dict[str, Any]]:
+        """Returns the partition column values of all partitions."""
+        return [
+            dict(zip(self._partition_cols, key)) for key in self._partitions
+        ]
+
+    def get_keys(self, **values: Any) -> List[PartitionKey]:
+        """Returns the keys of all partitions matching the given values.
+
+        Args:
+            **values: Values of partition columns, e.g. `split="train"`.
+                Returns the keys of all partitions if no values are given.
+
+        Returns:
+            Tuples of the partition column values of the matching partitions
+            in the order of `partition_cols`.
+
+        Raises:
+            ValueError: If a value is given for an unknown column.
+        """
+        unknown_cols = set(values) - set(self._partition_cols)
+        if unknown_cols:
+            raise ValueError(
+                f"{sorted(unknown_cols)} are not partition columns, the "
+                f"dataset is partitioned by {self._partition_cols}."
+            )
+        return [
+            key
+            for key in self._partitions
+            if all(
+                key[self._partition_cols.index(col)] == value
+                for col, value in values.items()
+            )
+        ]
+
+    def read_partition(self, key: PartitionKey) -> pd.DataFrame:
+        """Reads a single partition.
+
+        Args:
+            key: The partition column values of the partition as returned
+                by `get_keys()`.
+
+        Returns:
+            The rows of the partition.
+        """
+        return self._partitions[key]()
+
+    def read(self, **values: Any) -> pd.DataFrame:
+        """Reads all partitions matching the given partition column values.
+
+        Args:
+            **values: Values of partition columns, e.g. `split="train"`.
+                Reads the complete dataset if no values are given.
+
+        Returns:
+            The rows of all matching partitions, partitions are read in
+            parallel.
+        """
+        keys = self.get_keys(**values)
+        if not keys:
+            return pd.DataFrame()
+        frames = _map_partitions(self.read_partition, keys)
+        return pd.concat(frames)
+
+
+class PartitionedDatasetMaterializer(BaseMaterializer):
+    """Materializer to read and write partitioned datasets.
+
+    Each partition is written in parallel to a parquet file in a hive-style
+    directory like `split=train/part-0.parquet`. A `partitions.json` file
+    lists all partitions so they can be found without listing directories in
+    the artifact store. It stores the partition column values as strings
+    together with their type, so dates and timestamps are restored as such.
+    The partitions are also stored as `split_names` of the artifact.
+    """
+
+    ASSOCIATED_TYPES = [PartitionedDataset]
+
+    @staticmethod
+    def _get_partition_dir(
+        partition_cols: Sequence[str], key: PartitionKey
+    ) -> str:
+        """Returns the hive-style directory of a partition relative to the
+        artifact URI."""
+        return "/".join(
+            f"{quote(col, safe='')}={quote(str(value), safe='')}"
+            for col, value in zip(partition_cols, key)
+        )
+
+    def _read_partition(self, relative_path: str) -> pd.DataFrame:
+        """Reads a single partition."""
+        with fileio.open(
+            os.path.join(self.artifact.uri, relative_path), "rb"
+        ) as f:
+            return pd.read_parquet(f)
+
+    def handle_input(self, data_type: Type[Any]) -> PartitionedDataset:
+        """Reads the partition index of a dataset.
+
+        Args:
+            data_type: What type the input should be materialized as.
+
+        Returns:
+            The dataset, partitions are read once they are accessed.
+        """
+        super().handle_input(data_type)
+        metadata = yaml_utils.read_json(
+            os.path.join(self.artifact.uri, METADATA_FILENAME)
+        )
+        partitions: Dict[PartitionKey, Callable[[], pd.DataFrame]] = {}
+        for partition in metadata["partitions"]:
+            values = partition["values"]
+            if "types" in partition:
+                values = map(_decode_value, partition["types"], values)
+            partitions[tuple(values)] = functools.partial(
+                self._read_partition, partition["path"]
+            )
+        return PartitionedDataset(metadata["partition_cols"], partitions)
+
+    def handle_return(self, dataset: PartitionedDataset) -> None:
+        """Writes all partitions of a dataset in parallel.
+
+        Args:
+            dataset: The dataset to write.
+
+        Raises:
+            TypeError: If a partition column value has an unsupported type.
+        """
+        super().handle_return(dataset)
+        partition_cols = dataset.partition_cols
+        keys = dataset.get_keys()
+        # Encoded before writing so unsupported values fail early.
+        encoded_keys = {
+            key: tuple(zip(*map(_encode_value, key))) for key in keys
+        }
+
+        def _write_partition(key: PartitionKey) -> Dict[str, Any]:
+            partition_dir = self._get_partition_dir(partition_cols, key)
+            path_utils.create_dir_recursive_if_not_exists(
+                os.path.join(self.artifact.uri, partition_dir)
+            )
+            relative_path = f"{partition_dir}/{PARTITION_FILENAME}"
+            with fileio.open(
+                os.path.join(self.artifact.uri, relative_path), "wb"
+            ) as f:
+                dataset.read_partition(key).to_parquet(f)
+            types, values = encoded_keys[key]
+            return {
+                "values": list(values),
+                "types": list(types),
+                "path": relative_path,
+            }
+
+        partitions = _map_partitions(_write_partition, keys)
+        # The index is written last so that incomplete artifacts can't be
+        # read.
+        yaml_utils.write_json(
+            os.path.join(self.artifact.uri, METADATA_FILENAME),
+            {"partition_cols": partition_cols, "partitions": partitions},
+        )
+
+        split_names = artifact_utils.encode_split_names(
+            ["/".join(str(value) for value in key) for key in keys]
+        )
+        if SPLIT_NAMES_PROPERTY_KEY in self.artifact.PROPERTIES:
+            setattr(self.artifact, SPLIT_NAMES_PROPERTY_KEY, split_names)
+        else:
+            self.artifact.set_string_custom_property(
+                SPLIT_NAMES_PROPERTY_KEY, split_names
+            )
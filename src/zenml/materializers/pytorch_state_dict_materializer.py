@@ -0,0 +1,250 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import functools
+import json
+import os
+import struct
+from typing import Any, Dict, Optional, Tuple, Type, Union
+
+import numpy as np
+import torch
+from torch.nn import Module, Parameter  # type: ignore[attr-defined]
+
+from zenml.io import fileio
+from zenml.materializers.pytorch_materializer import PyTorchMaterializer
+from zenml.types.pytorch_types import TorchDict
+from zenml.utils import path_utils, source_utils
+
+DEFAULT_FILENAME = "state_dict.bin"
+# Tensor data starts at offsets aligned to this many bytes.
+ALIGNMENT = 64
+HEADER_LENGTH_FORMAT = "<Q"
+
+
+def _align(offset: int) -> int:
+    """Rounds an offset up to the next multiple of `ALIGNMENT`."""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _to_numpy(tensor: torch.Tensor) -> np.ndarray:
+    """Copies a tensor to a contiguous CPU numpy array."""
+    tensor = tensor.detach().cpu().contiguous()
+    if tensor.dtype == torch.bfloat16:
+        # Numpy has no bfloat16, the raw bits are stored instead.
+        tensor = tensor.view(torch.int16)
+    return tensor.numpy()  # type: ignore[no-any-return]
+
+
+class PyTorchStateDictMaterializer(PyTorchMaterializer):
+    """Materializer that stores the `state_dict` of PyTorch models in a flat
+    file which is memory-mapped when loading.
+
+    The file starts with the length of a JSON header which lists the dtype,
+    shape and offset of each tensor, followed by the raw tensor data at
+    aligned offsets. In local artifact stores the tensors of a loaded model
+    point into a copy-on-write memory-mapping of this file, so loading takes
+    constant time and tensor data is only read from disk once it's used.
+
+    Modules are recreated by calling their class without arguments. Modules
+    that need constructor arguments can be created by subclassing this
+    materializer and overriding `create_module()`.
+
+    This materializer is not the default for PyTorch models, steps need to
+    use it explicitly via `with_return_materializers()`.
+    """
+
+    def create_module(self, module_class: Type[Module]) -> Module:
+        """Creates the module that the stored tensors are assigned to.
+
+        Args:
+            module_class: The class of the stored module.
+
+        Returns:
+            A module with the same parameters and buffers as the stored one.
+        """
+        return module_class()
+
+    def _read_tensors(self) -> Tuple[Optional[str], Dict[str, torch.Tensor]]:
+        """Reads the header and creates tensors pointing into the file.
+
+        Returns:
+            The source of the module class, if a module was stored, and the
+            state dict.
+        """
+        filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
+        if path_utils.is_remote(filepath):
+            with fileio.open(filepath, "rb") as f:
+                buffer = np.frombuffer(bytearray(f.read()), dtype=np.uint8)
+        else:
+            buffer = np.memmap(filepath, dtype=np.uint8, mode="c")
+
+        length_size = struct.calcsize(HEADER_LENGTH_FORMAT)
+        (header_length,) = struct.unpack(
+            HEADER_LENGTH_FORMAT, buffer[:length_size].tobytes()
+        )
+        header = json.loads(
+            buffer[length_size : length_size + header_length].tobytes()
+        )
+        data_start = _align(length_size + header_length)
+
+        tensors: Dict[str, torch.Tensor] = {}
+        for name, entry in header["tensors"].items():
+            if "alias" in entry:
+                tensors[name] = tensors[entry["alias"]]
+                continue
+            start = data_start + entry["offset"]
+            array = (
+                buffer[start : start + entry["nbytes"]]
+                .view(entry["numpy_dtype"])
+                .reshape(entry["shape"])
+            )
+            tensor = torch.from_numpy(array)
+            if entry["dtype"] == "bfloat16":
+                tensor = tensor.view(torch.bfloat16)
+            tensors[name] = tensor
+        return header["module"], tensors
+
+    @staticmethod
+    def _assign_tensors(
+        module: Module, tensors: Dict[str, torch.Tensor]
+    ) -> None:
+        """Replaces the parameters and buffers of a module without copying
+        the tensors.
+
+        Raises:
+            RuntimeError: If the keys of the state dicts don't match.
+        """
+        expected_keys = set(module.state_dict())
+        if expected_keys != set(tensors):
+            raise RuntimeError(
+                f"Stored state dict doesn't match the module. Missing keys: "
+                f"{sorted(expected_keys - set(tensors))}, unexpected keys: "
+                f"{sorted(set(tensors) - expected_keys)}."
+            )
+
+        # Tied tensors are stored once and need to stay tied.
+        parameters: Dict[int, Parameter] = {}
+        for name, tensor in tensors.items():
+            module_path, _, attribute = name.rpartition(".")
+            owner = functools.reduce(
+                getattr, module_path.split(".") if module_path else [], module
+            )
+            parameter = owner._parameters.get(attribute)
+            if parameter is not None:
+                if id(tensor) not in parameters:
+                    parameters[id(tensor)] = Parameter(
+                        tensor, requires_grad=parameter.requires_grad
+                    )
+                owner._parameters[attribute] = parameters[id(tensor)]
+            else:
+                owner._buffers[attribute] = tensor
+
+    def handle_input(self, data_type: Type[Any]) -> Union[Module, TorchDict]:
+        """Reads a PyTorch model or state dict.
+
+        Returns:
+            The model if a module was stored, otherwise the state dict.
+        """
+        if not fileio.exists(
+            os.path.join(self.artifact.uri, DEFAULT_FILENAME)
+        ):
+            # Written by the `PyTorchMaterializer`.
+            return super().handle_input(data_type)
+
+        module_source, tensors = self._read_tensors()
+        if module_source is None:
+            return TorchDict(tensors)
+
+        module = self.create_module(
+            source_utils.load_source_path_class(module_source)
+        )
+        self._assign_tensors(module, tensors)
+        return module
+
+    def handle_return(self, model: Union[Module, TorchDict]) -> None:
+        """Writes the tensors of a PyTorch model or state dict.
+
+        Args:
+            model: A torch.nn.Module or a dict of tensors.
+
+        Raises:
+            ValueError: If the dict contains values that aren't tensors.
+        """
+        if isinstance(model, Module):
+            module_source: Optional[str] = source_utils.resolve_class(
+                type(model)
+            )
+            state_dict = model.state_dict()
+        else:
+            module_source = None
+            state_dict = model
+
+        entries: Dict[str, Dict[str, Any]] = {}
+        tensors: Dict[str, torch.Tensor] = {}
+        stored_names: Dict[Tuple[Any, ...], str] = {}
+        offset = 0
+        for name, tensor in state_dict.items():
+            if not isinstance(tensor, torch.Tensor):
+                raise ValueError(
+                    f"`{name}` is a {type(tensor)} but only tensors can be "
+                    f"stored in a flat file, please use the "
+                    f"`PyTorchMaterializer` instead."
+                )
+            key = (
+                tensor.data_ptr(),
+                tensor.dtype,
+                tuple(tensor.shape),
+                tuple(tensor.stride()),
+            )
+            if tensor.numel() and key in stored_names:
+                entries[name] = {"alias": stored_names[key]}
+                continue
+            stored_names[key] = name
+
+            numpy_dtype = (
+                np.dtype(np.int16)
+                if tensor.dtype == torch.bfloat16
+                else torch.empty(0, dtype=tensor.dtype).numpy().dtype
+            )
+            offset = _align(offset)
+            nbytes = tensor.numel() * tensor.element_size()
+            entries[name] = {
+                "dtype": str(tensor.dtype)[len("torch.") :],
+                "numpy_dtype": numpy_dtype.str,
+                "shape": list(tensor.shape),
+                "offset": offset,
+                "nbytes": nbytes,
+            }
+            tensors[name] = tensor
+            offset += nbytes
+
+        header = json.dumps(
+            {"module": module_source, "tensors": entries}
+        ).encode("utf-8")
+        header_end = struct.calcsize(HEADER_LENGTH_FORMAT) + len(header)
+        data_start = _align(header_end)
+        with fileio.open(
+            os.path.join(self.artifact.uri, DEFAULT_FILENAME), "wb"
+        ) as f:
+            f.write(struct.pack(HEADER_LENGTH_FORMAT, len(header)))
+            f.write(header)
+            position = header_end
+            for name, tensor in tensors.items():
+                start = data_start + entries[name]["offset"]
+                f.write(b"\0" * (start - position))
+                # Tensors are converted one at a time to limit the memory
+                # needed for models on other devices.
+                f.write(_to_numpy(tensor).tobytes())
+                position = start + entries[name]["nbytes"]
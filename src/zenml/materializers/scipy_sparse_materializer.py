@@ -0,0 +1,102 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+from typing import Any, Type, Union
+
+import numpy as np
+from scipy import sparse
+
+from zenml.io import fileio
+from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.materializers.numpy_materializer import load_npy_file
+from zenml.utils import yaml_utils
+
+METADATA_FILENAME = "sparse.json"
+ARRAY_NAMES = ("data", "indices", "indptr")
+
+SparseMatrix = Union[sparse.csr_matrix, sparse.csc_matrix]
+
+
+def _get_index_dtype(matrix: SparseMatrix) -> Type[np.integer]:
+    """Returns the dtype of the index arrays that scipy uses when creating a
+    matrix from its arrays.
+
+    Scipy converts index arrays to the smallest dtype that fits the shape
+    and number of values of the matrix, which would copy the memory-mapped
+    arrays when loading if they were stored with a larger dtype.
+    """
+    int32_max = np.iinfo(np.int32).max
+    if max(matrix.shape) <= int32_max and matrix.nnz <= int32_max:
+        return np.int32
+    return np.int64
+
+
+class ScipySparseMaterializer(BaseMaterializer):
+    """Materializer to read and write compressed sparse row and column
+    matrices.
+
+    The `data`, `indices` and `indptr` arrays of a matrix are stored as
+    `.npy` files. In local artifact stores they are memory-mapped read-only
+    when loading, so a matrix only takes memory once its values are used.
+    """
+
+    ASSOCIATED_TYPES = [sparse.csr_matrix, sparse.csc_matrix]
+
+    def handle_input(self, data_type: Type[Any]) -> SparseMatrix:
+        """Reads a sparse matrix from its arrays.
+
+        Args:
+            data_type: What type the input should be materialized as.
+
+        Returns:
+            The sparse matrix in the format it was stored in.
+        """
+        super().handle_input(data_type)
+        metadata = yaml_utils.read_json(
+            os.path.join(self.artifact.uri, METADATA_FILENAME)
+        )
+        data, indices, indptr = (
+            load_npy_file(os.path.join(self.artifact.uri, f"{name}.npy"))
+            for name in ARRAY_NAMES
+        )
+        matrix_class = (
+            sparse.csr_matrix
+            if metadata["format"] == "csr"
+            else sparse.csc_matrix
+        )
+        return matrix_class(
+            (data, indices, indptr), shape=tuple(metadata["shape"]), copy=False
+        )
+
+    def handle_return(self, matrix: SparseMatrix) -> None:
+        """Writes the arrays of a sparse matrix.
+
+        Args:
+            matrix: The sparse matrix to write.
+        """
+        super().handle_return(matrix)
+        index_dtype = _get_index_dtype(matrix)
+        for name in ARRAY_NAMES:
+            array = getattr(matrix, name)
+            if name != "data":
+                array = array.astype(index_dtype, copy=False)
+            with fileio.open(
+                os.path.join(self.artifact.uri, f"{name}.npy"), "wb"
+            ) as f:
+                np.save(f, array, allow_pickle=False)
+        yaml_utils.write_json(
+            os.path.join(self.artifact.uri, METADATA_FILENAME),
+            {"format": matrix.format, "shape": list(matrix.shape)},
+        )
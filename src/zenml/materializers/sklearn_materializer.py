@@ -14,8 +14,9 @@
 
 import os
 import pickle
-from typing import Any, Type, Union
+from typing import Any, Optional, Type, Union
 
+import joblib
 from sklearn.base import (
     BaseEstimator,
     BiclusterMixin,
@@ -29,13 +30,25 @@ from sklearn.base import (
     TransformerMixin,
 )
 
+from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.utils import path_utils
 
-DEFAULT_FILENAME = "model"
+DEFAULT_FILENAME = "model.joblib"
+# Plain pickle file written by previous versions
+PICKLE_FILENAME = "model"
 
 
 class SklearnMaterializer(BaseMaterializer):
-    """Materializer to read data to and from sklearn."""
+    """Materializer to read data to and from sklearn.
+
+    Models are stored in the joblib format which writes the numpy arrays of
+    fitted estimators as raw buffers next to the pickled estimator. Models in
+    local artifact stores are loaded with these arrays memory-mapped
+    read-only, so processes loading the same model share one copy of it in
+    memory. Subclasses can set `MMAP_MODE = None` to load independent
+    copies instead, e.g. for estimators that modify their fitted arrays.
+    """
 
     ASSOCIATED_TYPES = [
         BaseEstimator,
@@ -50,6 +63,9 @@ class SklearnMaterializer(BaseMaterializer):
         TransformerMixin,
     ]
 
+    # Memory-mapping mode passed to `numpy.load`, `None` disables it.
+    MMAP_MODE: Optional[str] = "r"
+
     def handle_input(
         self, data_type: Type[Any]
     ) -> Union[
@@ -64,12 +80,20 @@ class SklearnMaterializer(BaseMaterializer):
         DensityMixin,
         TransformerMixin,
     ]:
-        """Reads a base sklearn model from a pickle file."""
+        """Reads a base sklearn model from a joblib or pickle file."""
         super().handle_input(data_type)
         filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
-        with open(filepath, "rb") as fid:
-            clf = pickle.load(fid)
-        return clf
+        if not fileio.exists(filepath):
+            with fileio.open(
+                os.path.join(self.artifact.uri, PICKLE_FILENAME), "rb"
+            ) as fid:
+                return pickle.load(fid)
+
+        if path_utils.is_remote(filepath):
+            # Remote files can't be memory-mapped.
+            with fileio.open(filepath, "rb") as fid:
+                return joblib.load(fid)
+        return joblib.load(filepath, mmap_mode=self.MMAP_MODE)
 
     def handle_return(
         self,
@@ -86,12 +110,12 @@ class SklearnMaterializer(BaseMaterializer):
             TransformerMixin,
         ],
     ) -> None:
-        """Creates a pickle for a sklearn model.
+        """Stores a sklearn model in the joblib format.
 
         Args:
             clf: A sklearn model.
         """
         super().handle_return(clf)
         filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
-        with open(filepath, "wb") as fid:
-            pickle.dump(clf, fid)
+        with fileio.open(filepath, "wb") as fid:
+            joblib.dump(clf, fid)
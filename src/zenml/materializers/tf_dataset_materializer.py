@@ -11,31 +11,167 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import functools
 import os
-from typing import Any, Type
+from typing import Any, Callable, Optional, Type
 
 import tensorflow as tf
 
+from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.utils import yaml_utils
 
 DEFAULT_FILENAME = "saved_data"
+METADATA_FILENAME = "dataset.json"
 
 
 class TensorflowDatasetMaterializer(BaseMaterializer):
-    """Materializer to read data to and from beam."""
+    """Materializer to read data to and from tf.data.
+
+    Datasets are written to multiple shards which are read in parallel. The
+    sharding, compression and number of readers can be configured by
+    subclassing this materializer:
+
+        class GzipDatasetMaterializer(TensorflowDatasetMaterializer):
+            NUM_SHARDS = 64
+            COMPRESSION = "GZIP"
+
+    `SHARD_BY = "index"` distributes elements round-robin and is the only
+    strategy that keeps the order of the elements when reading. `"hash"`
+    distributes them by a hash of their contents. Custom shard functions map
+    an element to an int64 shard id:
+
+        class LabelDatasetMaterializer(TensorflowDatasetMaterializer):
+            SHARD_FUNC = staticmethod(lambda features, label: label)
+    """
 
     ASSOCIATED_TYPES = [tf.data.Dataset]
 
+    NUM_SHARDS: int = 8
+    # Either `index` or `hash`, ignored if `SHARD_FUNC` is set.
+    SHARD_BY: str = "index"
+    SHARD_FUNC: Optional[Callable[..., tf.Tensor]] = None
+    # Either `None`, `GZIP` or `SNAPPY`.
+    COMPRESSION: Optional[str] = None
+    # Number of shards that are read in parallel.
+    NUM_READERS: int = 8
+
+    def _read_dataset(self, datasets: tf.data.Dataset) -> tf.data.Dataset:
+        """Reads multiple shards in parallel.
+
+        Args:
+            datasets: A dataset of the datasets of all shards.
+
+        Returns:
+            The interleaved elements of all shards, in no particular order.
+        """
+        return datasets.interleave(
+            lambda dataset: dataset,
+            cycle_length=self.NUM_READERS,
+            num_parallel_calls=self.NUM_READERS,
+        )
+
+    def _read_dataset_in_order(
+        self, datasets: tf.data.Dataset, num_shards: int
+    ) -> tf.data.Dataset:
+        """Reads round-robin shards in parallel and restores the original
+        order of their elements.
+
+        The shards are loaded ordered by their id, so taking one element of
+        each shard in turn returns the elements in the order they were
+        written.
+
+        Args:
+            datasets: A dataset of the datasets of all shards.
+            num_shards: The number of shards the elements were distributed
+                to.
+
+        Returns:
+            The elements of all shards in their original order.
+        """
+        return datasets.interleave(
+            lambda dataset: dataset,
+            cycle_length=num_shards,
+            block_length=1,
+            num_parallel_calls=min(self.NUM_READERS, num_shards),
+            deterministic=True,
+        )
+
     def handle_input(self, data_type: Type[Any]) -> Any:
         """Reads data into tf.data.Dataset"""
         super().handle_input(data_type)
         path = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
-        return tf.data.experimental.load(path)
+        metadata_path = os.path.join(self.artifact.uri, METADATA_FILENAME)
+        if not fileio.exists(metadata_path):
+            # Written by previous versions as a single shard.
+            return tf.data.experimental.load(path)
+
+        metadata = yaml_utils.read_json(metadata_path)
+        if metadata["indexed"]:
+            reader_func = functools.partial(
+                self._read_dataset_in_order,
+                num_shards=metadata.get("num_shards", self.NUM_SHARDS),
+            )
+        else:
+            reader_func = self._read_dataset
+        dataset = tf.data.experimental.load(
+            path,
+            compression=metadata["compression"],
+            reader_func=reader_func,
+        )
+        if metadata["indexed"]:
+            dataset = dataset.map(
+                lambda index, element: element,
+                num_parallel_calls=tf.data.experimental.AUTOTUNE,
+            )
+        return dataset
 
     def handle_return(self, dataset: tf.data.Dataset) -> None:
-        """Persists a tf.data.Dataset object."""
+        """Persists a tf.data.Dataset object.
+
+        Raises:
+            ValueError: If `SHARD_BY` is unknown.
+        """
         super().handle_return(dataset)
+        num_shards = self.NUM_SHARDS
+        indexed = False
+        if self.SHARD_FUNC is not None:
+            shard_func = self.SHARD_FUNC
+        elif self.SHARD_BY == "index":
+            # The index is saved with each element and removed when
+            # reading.
+            indexed = True
+            dataset = dataset.enumerate()
+
+            def shard_func(index: tf.Tensor, element: Any) -> tf.Tensor:
+                return index % num_shards
+
+        elif self.SHARD_BY == "hash":
+
+            def shard_func(*element: Any) -> tf.Tensor:
+                content = tf.strings.reduce_join(
+                    [
+                        tf.io.serialize_tensor(tensor)
+                        for tensor in tf.nest.flatten(element)
+                    ]
+                )
+                return tf.strings.to_hash_bucket_fast(content, num_shards)
+
+        else:
+            raise ValueError(f"Unknown shard strategy `{self.SHARD_BY}`.")
+
         path = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
         tf.data.experimental.save(
-            dataset, path, compression=None, shard_func=None
+            dataset,
+            path,
+            compression=self.COMPRESSION,
+            shard_func=shard_func,
+        )
+        yaml_utils.write_json(
+            os.path.join(self.artifact.uri, METADATA_FILENAME),
+            {
+                "compression": self.COMPRESSION,
+                "indexed": indexed,
+                "num_shards": num_shards,
+            },
         )
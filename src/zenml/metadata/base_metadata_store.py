@@ -30,6 +30,7 @@ from zenml.artifacts.base_artifact import (
     DATATYPE_PROPERTY_KEY,
     MATERIALIZER_PROPERTY_KEY,
 )
+from zenml.constants import STEP_SOURCE_HASH_PARAMETER
 from zenml.core.base_component import BaseComponent
 from zenml.core.component_factory import metadata_store_factory
 from zenml.enums import ExecutionStatus, MLMetadataTypes
@@ -44,6 +45,10 @@ from zenml.utils.path_utils import get_zenml_config_dir
 
 logger = get_logger(__name__)
 
+# Prefix of the execution type names of steps created with the `@step`
+# decorator
+STEP_TYPE_NAME_PREFIX = "zenml.steps.base_step."
+
 
 # TODO [HIGH]: can we remove this registration?
 @metadata_store_factory.register(MLMetadataTypes.base)  # type: ignore[misc]
@@ -190,20 +195,21 @@ class BaseMetadataStore(BaseComponent):
         for execution in reversed(pipeline_run._executions):  # noqa
             step_name = step_type_mapping[execution.type_id]
             # TODO [HIGH]: why is the name like this?
-            step_prefix = "zenml.steps.base_step."
-            if step_name.startswith(step_prefix):
-                step_name = step_name[len(step_prefix) :]
+            if step_name.startswith(STEP_TYPE_NAME_PREFIX):
+                step_name = step_name[len(STEP_TYPE_NAME_PREFIX) :]
 
             step_parameters = {
                 k: json.loads(v.string_value)
                 for k, v in execution.custom_properties.items()
             }
+            source_hash = step_parameters.pop(STEP_SOURCE_HASH_PARAMETER, None)
 
             step = StepView(
                 id_=execution.id,
                 name=step_name,
                 parameters=step_parameters,
                 metadata_store=self,
+                source_hash=source_hash,
             )
             steps[step_name] = step
 
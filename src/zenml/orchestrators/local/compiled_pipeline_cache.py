@@ -0,0 +1,174 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""On-disk cache for compiled pipeline IRs so that repeated runs of the same
+pipeline definition don't need to compile it again."""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+import tfx.orchestration.pipeline as tfx_pipeline
+from google.protobuf.message import DecodeError
+from tfx import version as tfx_version
+from tfx.proto.orchestration import pipeline_pb2
+
+from zenml import __version__
+from zenml.io import fileio
+from zenml.logger import get_logger
+from zenml.steps.utils import _FunctionExecutor
+from zenml.utils import path_utils, source_utils
+
+logger = get_logger(__name__)
+
+COMPILED_PIPELINES_DIR_NAME = "compiled_pipelines"
+COMPILED_PIPELINE_FILE_SUFFIX = ".pb"
+
+
+def get_pipeline_fingerprint(pipeline: tfx_pipeline.Pipeline) -> Optional[str]:
+    """Computes a hash of everything that influences the compiled pipeline.
+
+    The hash covers the pipeline settings as well as the source code,
+    inputs, outputs, parameters and materializers of each step.
+
+    Args:
+        pipeline: The logical pipeline before compilation.
+
+    Returns:
+        The hash or `None` if the pipeline contains components that aren't
+        ZenML steps or a step's source code is not available.
+    """
+    components = []
+    for component in pipeline.components:
+        executor_class = getattr(
+            component.executor_spec, "executor_class", None
+        )
+        if not (
+            isinstance(executor_class, type)
+            and issubclass(executor_class, _FunctionExecutor)
+        ):
+            return None
+
+        try:
+            source_hash = source_utils.get_hashed_source(
+                executor_class._FUNCTION
+            )
+        except (OSError, TypeError):
+            logger.debug(
+                "Unable to get source of step `%s`, compiled pipeline can't "
+                "be cached.",
+                component.id,
+            )
+            return None
+
+        registry = executor_class.spec_materializer_registry
+        materializers = registry.get_materializer_types() if registry else {}
+        components.append(
+            {
+                "id": component.id,
+                "executor": component.executor_spec.class_path,
+                "source": source_hash,
+                "inputs": {
+                    key: [
+                        channel.type_name,
+                        channel.producer_component_id,
+                        channel.output_key,
+                    ]
+                    for key, channel in component.spec.inputs.items()
+                },
+                "outputs": {
+                    key: channel.type_name
+                    for key, channel in component.spec.outputs.items()
+                },
+                "parameters": component.exec_properties,
+                "materializers": {
+                    key: source_utils.resolve_class(materializer)
+                    for key, materializer in materializers.items()
+                },
+            }
+        )
+
+    fingerprint: Dict[str, Any] = {
+        "zenml_version": __version__,
+        "tfx_version": tfx_version.__version__,
+        "pipeline_name": pipeline.pipeline_info.pipeline_name,
+        "pipeline_root": pipeline.pipeline_info.pipeline_root,
+        "enable_cache": pipeline.enable_cache,
+        "metadata_connection_config": str(
+            pipeline.metadata_connection_config
+        ),
+        "beam_pipeline_args": pipeline.beam_pipeline_args,
+        "components": components,
+    }
+    return hashlib.sha256(
+        json.dumps(fingerprint, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class CompiledPipelineCache:
+    """Stores compiled pipeline IRs keyed by their pipeline fingerprint.
+
+    Cached pipelines still contain the unresolved run id runtime parameter,
+    so they need to be substituted for each run just like a freshly compiled
+    pipeline.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        """Initializes the cache.
+
+        Args:
+            cache_dir: Directory in which compiled pipelines are stored.
+                Defaults to a directory inside the `.zen` directory of the
+                current repository.
+        """
+        self._cache_dir = cache_dir or os.path.join(
+            path_utils.get_zenml_config_dir(), COMPILED_PIPELINES_DIR_NAME
+        )
+
+    def _get_path(self, key: str) -> str:
+        """Returns the path of the cache file for the given key."""
+        return os.path.join(
+            self._cache_dir, f"{key}{COMPILED_PIPELINE_FILE_SUFFIX}"
+        )
+
+    def load(self, key: str) -> Optional[pipeline_pb2.Pipeline]:
+        """Returns the compiled pipeline for the given key or `None` if no
+        compiled pipeline is cached for this key."""
+        path = self._get_path(key)
+        if not fileio.exists(path):
+            return None
+
+        pipeline = pipeline_pb2.Pipeline()
+        try:
+            with fileio.open(path, "rb") as f:
+                pipeline.ParseFromString(f.read())
+        except DecodeError:
+            logger.warning(
+                "Ignoring corrupted compiled pipeline cache file %s.", path
+            )
+            return None
+        logger.debug("Using cached compiled pipeline %s.", path)
+        return pipeline
+
+    def save(self, key: str, pipeline: pipeline_pb2.Pipeline) -> None:
+        """Stores a compiled pipeline for the given key."""
+        path_utils.create_dir_recursive_if_not_exists(self._cache_dir)
+        path = self._get_path(key)
+        # Write to a temporary file first so concurrent runs never read a
+        # partially written pipeline.
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with fileio.open(temporary_path, "wb") as f:
+            f.write(pipeline.SerializeToString())
+        fileio.rename(temporary_path, path, overwrite=True)
+        logger.debug("Cached compiled pipeline in %s.", path)
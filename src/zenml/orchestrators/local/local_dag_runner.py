@@ -32,9 +32,13 @@
 by Google at: https://github.com/tensorflow/tfx/blob/master/tfx/orchestration
 /local/local_dag_runner.py"""
 
+import multiprocessing
 import time
+import traceback
+from concurrent import futures
 from datetime import datetime
-from typing import Optional
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Optional, Set
 
 import tfx.orchestration.pipeline as tfx_pipeline
 from tfx.dsl.compiler import compiler
@@ -47,8 +51,21 @@ from tfx.orchestration.portable import (
     runtime_parameter_utils,
     tfx_runner,
 )
+from tfx.proto.orchestration import pipeline_pb2
 
 from zenml.logger import get_logger
+from zenml.orchestrators.local.compiled_pipeline_cache import (
+    CompiledPipelineCache,
+    get_pipeline_fingerprint,
+)
+from zenml.orchestrators.local.metadata_connection_pool import (
+    MetadataConnectionPool,
+)
+from zenml.steps.utils import (
+    _FunctionExecutor,
+    get_executor_sources,
+    regenerate_executor_class,
+)
 
 logger = get_logger(__name__)
 
@@ -76,11 +93,156 @@ def format_timedelta_pretty(seconds: float) -> str:
         return f"{seconds:.3f}s"
 
 
+def run_nodes_concurrently(
+    node_ids: List[str],
+    upstream_node_ids: Dict[str, Set[str]],
+    launch_fn: Callable[[str], None],
+    max_parallelism: int,
+) -> None:
+    """Launches nodes on a bounded thread pool as soon as all their upstream
+    nodes have finished.
+
+    Args:
+        node_ids: Ids of all nodes to launch in topological order.
+        upstream_node_ids: Maps each node id to the ids of the nodes that need
+            to finish before it can be launched.
+        launch_fn: Function that launches a single node given its id.
+        max_parallelism: Maximum number of nodes running at the same time.
+
+    Raises:
+        The first exception raised while launching a node. Nodes that are
+        already running are allowed to finish, but no new nodes are launched
+        after a failure.
+    """
+    pending = list(node_ids)
+    completed: Set[str] = set()
+    errors: List[BaseException] = []
+
+    with futures.ThreadPoolExecutor(
+        max_workers=max_parallelism, thread_name_prefix="zenml_step"
+    ) as executor:
+        running: Dict["futures.Future[None]", str] = {}
+        while pending or running:
+            if not errors:
+                ready = [
+                    node_id
+                    for node_id in pending
+                    if upstream_node_ids.get(node_id, set()) <= completed
+                ]
+                for node_id in ready:
+                    pending.remove(node_id)
+                    running[executor.submit(launch_fn, node_id)] = node_id
+
+            if not running:
+                # Either a node failed or the remaining nodes can never be
+                # launched, in both cases there is nothing left to wait for.
+                break
+
+            done, _ = futures.wait(
+                running.keys(), return_when=futures.FIRST_COMPLETED
+            )
+            for future in done:
+                node_id = running.pop(future)
+                exception = future.exception()
+                if exception:
+                    logger.error(f"Step `{node_id}` has failed.")
+                    errors.append(exception)
+                else:
+                    completed.add(node_id)
+
+    if errors:
+        raise errors[0]
+    if pending:
+        raise RuntimeError(
+            f"Unable to launch steps {pending} as their upstream steps "
+            f"never finished."
+        )
+
+
+def _launch_node_in_process(
+    serialized_pipeline: bytes,
+    node_id: str,
+    executor_sources: List[Dict[str, Any]],
+    connection: Connection,
+) -> None:
+    """Entrypoint of the worker process that launches a single node.
+
+    Args:
+        serialized_pipeline: The compiled pipeline IR.
+        node_id: Id of the node to launch.
+        executor_sources: Sources to regenerate the step executor classes
+            which only exist in the memory of the parent process.
+        connection: Connection to send the error message (or `None` if the
+            node succeeded) and the execution duration back to the parent.
+    """
+    start = time.time()
+    error_message = None
+    try:
+        pipeline = pipeline_pb2.Pipeline()
+        pipeline.ParseFromString(serialized_pipeline)
+        for sources in executor_sources:
+            regenerate_executor_class(sources)
+
+        deployment_config = runner_utils.extract_local_deployment_config(
+            pipeline
+        )
+        pipeline_node = next(
+            node.pipeline_node
+            for node in pipeline.nodes
+            if node.pipeline_node.node_info.id == node_id
+        )
+        LocalDagRunner._launch_node(
+            pipeline,
+            pipeline_node,
+            deployment_config,
+            metadata.Metadata(deployment_config.metadata_connection_config),  # type: ignore[attr-defined] # noqa
+        )
+    except Exception:
+        error_message = traceback.format_exc()
+    finally:
+        connection.send((error_message, time.time() - start))
+        connection.close()
+
+
 class LocalDagRunner(tfx_runner.TfxRunner):
     """Local TFX DAG runner."""
 
-    def __init__(self) -> None:
-        """Initializes LocalDagRunner as a TFX orchestrator."""
+    def __init__(
+        self,
+        max_parallelism: int = 1,
+        isolate_steps: bool = False,
+        process_start_method: str = "spawn",
+        cache_compiled_pipelines: bool = False,
+    ) -> None:
+        """Initializes LocalDagRunner as a TFX orchestrator.
+
+        Args:
+            max_parallelism: Maximum number of steps that are executed at the
+                same time. Steps only start once all their upstream steps
+                have finished.
+            isolate_steps: If `True`, each step is launched in a fresh worker
+                process which exits once the step is finished.
+            process_start_method: The `multiprocessing` start method used to
+                create the worker processes if `isolate_steps` is `True`.
+            cache_compiled_pipelines: If `True`, compiled pipelines are
+                stored on disk and reused by later runs of a pipeline with
+                the same steps, parameters and materializers.
+        """
+        if max_parallelism < 1:
+            raise ValueError(
+                f"`max_parallelism` needs to be at least 1, got "
+                f"{max_parallelism}."
+            )
+        if process_start_method not in multiprocessing.get_all_start_methods():
+            raise ValueError(
+                f"Process start method `{process_start_method}` is not "
+                f"available on this platform. Available methods: "
+                f"{multiprocessing.get_all_start_methods()}"
+            )
+        self._max_parallelism = max_parallelism
+        self._isolate_steps = isolate_steps
+        self._process_start_method = process_start_method
+        self._cache_compiled_pipelines = cache_compiled_pipelines
 
     def run(
         self, pipeline: tfx_pipeline.Pipeline, run_name: Optional[str] = None
@@ -91,14 +253,22 @@ class LocalDagRunner(tfx_runner.TfxRunner):
           pipeline: Logical pipeline containing pipeline args and components.
           run_name: Optional name for the run.
         """
+        executor_sources = []
         for component in pipeline.components:
             if isinstance(component, base_component.BaseComponent):
                 component._resolve_pip_dependencies(
                     pipeline.pipeline_info.pipeline_root
                 )
+            executor_class = getattr(
+                component.executor_spec, "executor_class", None
+            )
+            if self._isolate_steps and (
+                isinstance(executor_class, type)
+                and issubclass(executor_class, _FunctionExecutor)
+            ):
+                executor_sources.append(get_executor_sources(executor_class))
 
-        c = compiler.Compiler()
-        pipeline = c.compile(pipeline)
+        pipeline = self._compile(pipeline)
 
         run_name = run_name or datetime.now().isoformat()
         # Substitute the runtime parameter to be a concrete run_id
@@ -117,31 +287,161 @@ class LocalDagRunner(tfx_runner.TfxRunner):
         logger.debug(f"Using deployment config:\n {deployment_config}")
         logger.debug(f"Using connection config:\n {connection_config}")
 
-        # Run each component. Note that the pipeline.components list is in
-        # topological order.
-        for node in pipeline.nodes:
-            pipeline_node = node.pipeline_node
-            node_id = pipeline_node.node_info.id
-            executor_spec = runner_utils.extract_executor_spec(
-                deployment_config, node_id
-            )
-            custom_driver_spec = runner_utils.extract_custom_driver_spec(
-                deployment_config, node_id
-            )
+        # Note that the pipeline.nodes list is in topological order.
+        pipeline_nodes = {
+            node.pipeline_node.node_info.id: node.pipeline_node
+            for node in pipeline.nodes
+        }
+        serialized_pipeline = (
+            pipeline.SerializeToString() if self._isolate_steps else b""
+        )
 
-            component_launcher = launcher.Launcher(
-                pipeline_node=pipeline_node,
-                mlmd_connection=metadata.Metadata(connection_config),
-                pipeline_info=pipeline.pipeline_info,
-                pipeline_runtime_spec=pipeline.runtime_spec,
-                executor_spec=executor_spec,
-                custom_driver_spec=custom_driver_spec,
-            )
+        def _launch(node_id: str) -> None:
+            """Launches the node with the given id."""
             start = time.time()
             logger.info(f"Step `{node_id}` has started.")
-            component_launcher.launch()
+            if self._isolate_steps:
+                self._launch_node_in_subprocess(
+                    serialized_pipeline, node_id, executor_sources
+                )
+            else:
+                self._launch_node(
+                    pipeline,
+                    pipeline_nodes[node_id],
+                    deployment_config,
+                    connection_pool.connection(),
+                )
             end = time.time()
             logger.info(
                 f"Step `{node_id}` has finished"
                 f" in {format_timedelta_pretty(end - start)}."
             )
+
+        # All steps that run in this process share the connections of this
+        # pool, worker processes open their own connection.
+        with MetadataConnectionPool(connection_config) as connection_pool:
+            if self._max_parallelism == 1:
+                for node_id in pipeline_nodes:
+                    _launch(node_id)
+            else:
+                upstream_node_ids = {
+                    node_id: set(pipeline_node.upstream_nodes)
+                    for node_id, pipeline_node in pipeline_nodes.items()
+                }
+                run_nodes_concurrently(
+                    list(pipeline_nodes),
+                    upstream_node_ids,
+                    _launch,
+                    max_parallelism=self._max_parallelism,
+                )
+
+    def _compile(
+        self, pipeline: tfx_pipeline.Pipeline
+    ) -> pipeline_pb2.Pipeline:
+        """Compiles a logical pipeline or loads the compiled pipeline from
+        the cache if caching compiled pipelines is enabled.
+
+        Args:
+            pipeline: The logical pipeline to compile.
+
+        Returns:
+            The compiled pipeline with unresolved runtime parameters.
+        """
+        cache_key = None
+        if self._cache_compiled_pipelines:
+            cache = CompiledPipelineCache()
+            cache_key = get_pipeline_fingerprint(pipeline)
+            if cache_key:
+                compiled_pipeline = cache.load(cache_key)
+                if compiled_pipeline:
+                    logger.debug("Reusing compiled pipeline %s.", cache_key)
+                    return compiled_pipeline
+
+        c = compiler.Compiler()
+        compiled_pipeline = c.compile(pipeline)
+        if cache_key:
+            cache.save(cache_key, compiled_pipeline)
+        return compiled_pipeline
+
+    def _launch_node_in_subprocess(
+        self,
+        serialized_pipeline: bytes,
+        node_id: str,
+        executor_sources: List[Dict[str, Any]],
+    ) -> None:
+        """Launches a single node in a new worker process and waits until
+        the process has finished.
+
+        Args:
+            serialized_pipeline: The compiled pipeline IR.
+            node_id: Id of the node to launch.
+            executor_sources: Sources of all step executor classes.
+
+        Raises:
+            RuntimeError: If the step failed or the worker process died.
+        """
+        context = multiprocessing.get_context(self._process_start_method)
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_launch_node_in_process,
+            args=(serialized_pipeline, node_id, executor_sources, sender),
+            name=f"zenml_step_{node_id}",
+        )
+        process.start()
+        # Close our copy of the sending end so `recv()` fails instead of
+        # blocking forever if the worker dies without sending anything.
+        sender.close()
+        try:
+            error_message, duration = receiver.recv()
+        except EOFError:
+            error_message, duration = None, None
+        finally:
+            receiver.close()
+            process.join()
+
+        if error_message:
+            raise RuntimeError(
+                f"Step `{node_id}` failed in worker process:\n{error_message}"
+            )
+        if process.exitcode != 0 or duration is None:
+            raise RuntimeError(
+                f"Worker process of step `{node_id}` exited unexpectedly "
+                f"with exit code {process.exitcode}."
+            )
+        logger.debug(
+            f"Step `{node_id}` ran for {format_timedelta_pretty(duration)} "
+            f"in worker process {process.pid}."
+        )
+
+    @staticmethod
+    def _launch_node(
+        pipeline: pipeline_pb2.Pipeline,
+        pipeline_node: pipeline_pb2.PipelineNode,
+        deployment_config: Any,
+        mlmd_connection: metadata.Metadata,
+    ) -> None:
+        """Launches a single node of a compiled pipeline.
+
+        Args:
+            pipeline: The compiled pipeline.
+            pipeline_node: The node to launch.
+            deployment_config: Local deployment config of the pipeline.
+            mlmd_connection: Connection to the metadata store.
+        """
+        node_id = pipeline_node.node_info.id
+        executor_spec = runner_utils.extract_executor_spec(
+            deployment_config, node_id
+        )
+        custom_driver_spec = runner_utils.extract_custom_driver_spec(
+            deployment_config, node_id
+        )
+
+        component_launcher = launcher.Launcher(
+            pipeline_node=pipeline_node,
+            mlmd_connection=mlmd_connection,
+            pipeline_info=pipeline.pipeline_info,
+            pipeline_runtime_spec=pipeline.runtime_spec,
+            executor_spec=executor_spec,
+            custom_driver_spec=custom_driver_spec,
+        )
+        component_launcher.launch()
@@ -28,7 +28,29 @@ if TYPE_CHECKING:
 
 @orchestrator_store_factory.register(OrchestratorTypes.local)
 class LocalOrchestrator(BaseOrchestrator):
-    """Orchestrator responsible for running pipelines locally."""
+    """Orchestrator responsible for running pipelines locally.
+
+    Attributes:
+        max_parallelism: Maximum number of steps that are executed at the same
+            time. Defaults to 1, which runs all steps sequentially.
+        isolate_steps: If `True`, each step runs in its own worker process
+            which exits after the step is finished. This frees the memory
+            used by a step and allows CPU-heavy steps to run on multiple
+            cores in parallel. Pipelines running with this option need to be
+            started from a script that guards its entrypoint with
+            `if __name__ == "__main__":`.
+        process_start_method: The `multiprocessing` start method (`spawn` or
+            `forkserver`) used to create worker processes.
+        cache_compiled_pipelines: If `True`, compiled pipelines are cached
+            inside the `.zen` directory and reused when the same pipeline
+            definition is run again. Cached pipelines are never deleted, so
+            this is disabled by default.
+    """
+
+    max_parallelism: int = 1
+    isolate_steps: bool = False
+    process_start_method: str = "spawn"
+    cache_compiled_pipelines: bool = False
 
     def run(
         self,
@@ -43,7 +65,12 @@ class LocalOrchestrator(BaseOrchestrator):
             run_name: Optional name for the run.
             **pipeline_args: Unused kwargs to conform with base signature.
         """
-        runner = LocalDagRunner()
+        runner = LocalDagRunner(
+            max_parallelism=self.max_parallelism,
+            isolate_steps=self.isolate_steps,
+            process_start_method=self.process_start_method,
+            cache_compiled_pipelines=self.cache_compiled_pipelines,
+        )
 
         # Establish the connections between the components
         zenml_pipeline.connect(**zenml_pipeline.steps)
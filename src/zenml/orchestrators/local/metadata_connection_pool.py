@@ -0,0 +1,149 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Metadata connections that are shared by all steps of a local pipeline
+run."""
+
+import threading
+from types import TracebackType
+from typing import Any, List, Optional, Type
+
+from ml_metadata.metadata_store import metadata_store
+from tfx.orchestration import metadata
+
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class MetadataConnectionPool:
+    """Pool of metadata store connections owned by a single pipeline run.
+
+    Opening a metadata store connection means a connection handshake and
+    schema check for MySQL or reopening the database file for SQLite. Instead
+    of doing this for every step, connections are opened once and handed out
+    to the steps of a run. Each connection is only used by a single step at
+    a time, so steps that run in parallel get separate connections.
+    """
+
+    def __init__(self, connection_config: Any) -> None:
+        """Initializes an empty pool.
+
+        Args:
+            connection_config: Metadata connection config used to open new
+                connections.
+        """
+        self._connection_config = connection_config
+        self._idle_stores: List[metadata_store.MetadataStore] = []
+        self._lock = threading.Lock()
+        self._num_opened_connections = 0
+        self._closed = False
+
+    @property
+    def connection_config(self) -> Any:
+        """Returns the config used to open new connections."""
+        return self._connection_config
+
+    @property
+    def num_opened_connections(self) -> int:
+        """Returns how many connections this pool has opened."""
+        return self._num_opened_connections
+
+    def acquire(self) -> metadata_store.MetadataStore:
+        """Returns an idle connection or opens a new one if all connections
+        are currently in use."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Metadata connection pool is closed.")
+            if self._idle_stores:
+                return self._idle_stores.pop()
+
+        # Reuse the TFX connection logic which retries failed connections.
+        # Connections are opened outside the lock so slow connection attempts
+        # don't block steps releasing their connections.
+        with metadata.Metadata(self._connection_config) as m:
+            store = m.store
+        with self._lock:
+            self._num_opened_connections += 1
+            num_opened_connections = self._num_opened_connections
+        logger.debug("Opened metadata connection %d.", num_opened_connections)
+        return store
+
+    def release(self, store: metadata_store.MetadataStore) -> None:
+        """Hands a connection back to the pool so other steps can use it."""
+        with self._lock:
+            if not self._closed:
+                self._idle_stores.append(store)
+
+    def connection(self) -> "PooledMetadata":
+        """Returns a TFX metadata connection backed by this pool."""
+        return PooledMetadata(self)
+
+    def close(self) -> None:
+        """Drops all connections of this pool."""
+        with self._lock:
+            self._closed = True
+            self._idle_stores.clear()
+        logger.debug(
+            "Closed metadata connection pool after opening %d connection(s).",
+            self._num_opened_connections,
+        )
+
+    def __enter__(self) -> "MetadataConnectionPool":
+        """Returns the pool itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Closes the pool."""
+        self.close()
+
+
+class PooledMetadata(metadata.Metadata):
+    """TFX metadata connection that borrows its underlying store from a
+    `MetadataConnectionPool` instead of opening a new one on every `with`
+    block."""
+
+    def __init__(self, pool: MetadataConnectionPool) -> None:
+        """Initializes the connection.
+
+        Args:
+            pool: The pool to borrow connections from.
+        """
+        super().__init__(pool.connection_config)
+        self._pool = pool
+        self._borrowed_stores: List[metadata_store.MetadataStore] = []
+
+    def __enter__(self) -> "PooledMetadata":
+        """Borrows a connection from the pool."""
+        store = self._pool.acquire()
+        self._borrowed_stores.append(store)
+        self._store = store
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Hands the borrowed connection back to the pool."""
+        self._pool.release(self._borrowed_stores.pop())
+        # Support nested `with` blocks on the same object.
+        self._store = (
+            self._borrowed_stores[-1] if self._borrowed_stores else None
+        )
@@ -14,7 +14,17 @@
 import inspect
 import json
 from abc import abstractmethod
-from typing import Any, ClassVar, Dict, NoReturn, Optional, Tuple, Type, cast
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
 from zenml.config.config_keys import (
     PipelineConfigurationKeys,
@@ -27,6 +37,7 @@ from zenml.exceptions import (
     PipelineInterfaceError,
 )
 from zenml.logger import get_logger
+from zenml.pipelines.run_plan import StepPlan, plan_pipeline_run
 from zenml.stacks.base_stack import BaseStack
 from zenml.steps.base_step import BaseStep
 from zenml.utils import analytics_utils, yaml_utils
@@ -176,6 +187,18 @@ class BasePipeline(metaclass=BasePipelineMeta):
         self.stack.orchestrator.post_run()
         return ret
 
+    def plan(self) -> List[StepPlan]:
+        """Predicts which steps would be cached if the pipeline was run now.
+
+        This only reads from the metadata store of the pipeline stack, no
+        step gets executed.
+
+        Returns:
+            A plan for each step in the order in which the steps would run,
+            including the reason why steps would not be cached.
+        """
+        return plan_pipeline_run(self)
+
     def with_config(
         self, config_file: str, overwrite_step_parameters: bool = False
     ) -> "BasePipeline":
@@ -0,0 +1,249 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Predicts which steps of a pipeline run would be cached without running
+the pipeline."""
+
+import json
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional
+
+from zenml.enums import CacheMissReason, ExecutionStatus
+from zenml.logger import get_logger
+from zenml.metadata.base_metadata_store import STEP_TYPE_NAME_PREFIX
+from zenml.post_execution import ArtifactView, StepView
+from zenml.steps.step_cache import StepCache
+from zenml.steps.utils import PARAM_ENABLE_CACHE, get_step_source_hash
+
+if TYPE_CHECKING:
+    from zenml.metadata.base_metadata_store import BaseMetadataStore
+    from zenml.pipelines.base_pipeline import BasePipeline
+    from zenml.steps.base_step import BaseStep
+
+logger = get_logger(__name__)
+
+
+class StepPlan(NamedTuple):
+    """Prediction whether a step would be cached in the next pipeline run.
+
+    Attributes:
+        name: Name of the step in the pipeline.
+        is_cached: Whether the outputs of a previous execution would be
+            reused.
+        reason: Why the step would be executed, `None` for cached steps.
+        details: Human readable details about the reason, e.g. the names of
+            changed parameters.
+    """
+
+    name: str
+    is_cached: bool
+    reason: Optional[CacheMissReason] = None
+    details: str = ""
+
+
+def _get_execution_name(step: "BaseStep") -> str:
+    """Returns the name under which executions of a step are stored in the
+    metadata store."""
+    name = f"{step.__module__}.{step.__class__.__name__}"
+    if name.startswith(STEP_TYPE_NAME_PREFIX):
+        name = name[len(STEP_TYPE_NAME_PREFIX) :]
+    return name
+
+
+def _get_previous_executions(
+    metadata_store: "BaseMetadataStore", pipeline_name: str
+) -> Dict[str, List[StepView]]:
+    """Returns all successful step executions of a pipeline, newest first.
+
+    Args:
+        metadata_store: The metadata store to query.
+        pipeline_name: Name of the pipeline.
+
+    Returns:
+        A dictionary mapping step execution names to their executions.
+    """
+    executions: Dict[str, List[StepView]] = defaultdict(list)
+    pipeline = metadata_store.get_pipeline(pipeline_name)
+    if not pipeline:
+        return executions
+
+    for run in reversed(pipeline.runs):
+        for step in run.steps:
+            if step.status == ExecutionStatus.COMPLETED:
+                executions[step.name].append(step)
+    return executions
+
+
+def plan_pipeline_run(pipeline: "BasePipeline") -> List[StepPlan]:
+    """Predicts which steps of the next run of a pipeline would be cached.
+
+    A step is cached if a previous successful execution of it used the same
+    source code, parameters and input artifacts, which is what the
+    orchestrator checks as well. Steps that enable the step cache are also
+    cached if the step cache contains an entry for their cache key. Steps
+    that would not be cached are compared against their latest execution to
+    explain why they would run. Nothing gets executed, but content digests
+    of input artifacts might get stored in the step cache.
+
+    Args:
+        pipeline: The pipeline to plan.
+
+    Returns:
+        A plan for each step in the order in which the steps would run.
+    """
+    pipeline.connect(**pipeline.steps)
+    steps_by_id = {
+        step.component.id: (name, step) for name, step in pipeline.steps.items()
+    }
+    previous_executions = _get_previous_executions(
+        pipeline.stack.metadata_store, pipeline.name
+    )
+
+    # Output artifacts of all cached steps, executed steps produce new
+    # artifacts which no previous execution can have used as inputs.
+    cached_outputs: Dict[str, Dict[str, ArtifactView]] = {}
+    # Output content digests of steps whose outputs would be reused from the
+    # step cache. These steps still produce new artifacts, but downstream
+    # steps with enabled step cache key on the contents of their inputs.
+    output_digests: Dict[str, Dict[str, str]] = {}
+    planned: Dict[str, StepPlan] = {}
+    step_cache: Optional[StepCache] = None
+
+    def _is_in_step_cache(
+        component_id: str, input_artifacts: Dict[str, ArtifactView]
+    ) -> bool:
+        """Checks whether the step cache contains the outputs of a step."""
+        nonlocal step_cache
+        if step_cache is None:
+            step_cache = StepCache()
+
+        _, step = steps_by_id[component_id]
+        input_digests = {
+            input_name: step_cache.get_content_digest(artifact)  # type: ignore[arg-type] # noqa
+            for input_name, artifact in input_artifacts.items()
+        }
+        for input_name, channel in step.component.inputs.items():
+            if input_name not in input_digests:
+                input_digests[input_name] = output_digests[
+                    channel.producer_component_id
+                ][channel.output_key]
+
+        executor_class = step.component.executor_spec.executor_class
+        cache_key = executor_class.get_cache_key(
+            input_digests, dict(step.component.exec_properties)
+        )
+        if cache_key is None:
+            return False
+        outputs = step_cache.load(cache_key)
+        if outputs is None or set(outputs) != set(step.OUTPUT_SPEC):
+            return False
+
+        output_digests[component_id] = {
+            output_name: output["content_digest"]
+            for output_name, output in outputs.items()
+        }
+        return True
+
+    def _plan_step(component_id: str) -> StepPlan:
+        name, step = steps_by_id[component_id]
+        step_cache_enabled = getattr(step, PARAM_ENABLE_CACHE)
+        input_artifacts: Dict[str, ArtifactView] = {}
+        executed_upstream_steps = []
+        unknown_upstream_steps = []
+        for input_name, channel in step.component.inputs.items():
+            producer_id = channel.producer_component_id
+            if producer_id not in planned:
+                planned[producer_id] = _plan_step(producer_id)
+            if producer_id in cached_outputs:
+                input_artifacts[input_name] = cached_outputs[producer_id][
+                    channel.output_key
+                ]
+            else:
+                executed_upstream_steps.append(steps_by_id[producer_id][0])
+                if producer_id not in output_digests:
+                    unknown_upstream_steps.append(steps_by_id[producer_id][0])
+        input_ids = {k: a.id for k, a in input_artifacts.items()}
+
+        executions = previous_executions.get(_get_execution_name(step), [])
+        source_hash = get_step_source_hash(step)
+        parameters = {k: json.loads(v) for k, v in step.PARAM_SPEC.items()}
+        if pipeline.enable_cache and not executed_upstream_steps:
+            for execution in executions:
+                if (
+                    execution.source_hash == source_hash
+                    and execution.parameters == parameters
+                    and {k: a.id for k, a in execution.inputs.items()}
+                    == input_ids
+                ):
+                    cached_outputs[component_id] = execution.outputs
+                    return StepPlan(name, True)
+
+        if (
+            step_cache_enabled
+            and not unknown_upstream_steps
+            and _is_in_step_cache(component_id, input_artifacts)
+        ):
+            return StepPlan(
+                name, True, details="Outputs are reused from the step cache."
+            )
+
+        if not pipeline.enable_cache and not step_cache_enabled:
+            return StepPlan(name, False, CacheMissReason.CACHE_DISABLED)
+        upstream_steps = (
+            unknown_upstream_steps
+            if step_cache_enabled
+            else executed_upstream_steps
+        )
+        if upstream_steps:
+            return StepPlan(
+                name,
+                False,
+                CacheMissReason.NEW_INPUT_ARTIFACTS,
+                f"Upstream steps {sorted(upstream_steps)} will run.",
+            )
+        if not executions:
+            return StepPlan(name, False, CacheMissReason.NO_PREVIOUS_EXECUTION)
+
+        latest = executions[0]
+        if latest.source_hash != source_hash:
+            return StepPlan(name, False, CacheMissReason.CHANGED_CODE)
+        if latest.parameters != parameters:
+            changed_parameters = sorted(
+                key
+                for key in set(parameters) | set(latest.parameters)
+                if parameters.get(key) != latest.parameters.get(key)
+            )
+            return StepPlan(
+                name,
+                False,
+                CacheMissReason.CHANGED_PARAMETERS,
+                f"Changed parameters: {changed_parameters}.",
+            )
+        changed_inputs = sorted(
+            key
+            for key, artifact in latest.inputs.items()
+            if input_ids.get(key) != artifact.id
+        )
+        return StepPlan(
+            name,
+            False,
+            CacheMissReason.NEW_INPUT_ARTIFACTS,
+            f"Changed inputs: {changed_inputs}.",
+        )
+
+    for component_id in steps_by_id:
+        if component_id not in planned:
+            planned[component_id] = _plan_step(component_id)
+
+    logger.debug("Planned run of pipeline `%s`.", pipeline.name)
+    return list(planned.values())
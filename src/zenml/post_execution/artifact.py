@@ -55,6 +55,11 @@ class ArtifactView:
         self._materializer = materializer
         self._data_type = data_type
 
+    @property
+    def id(self) -> int:
+        """Returns the artifact id."""
+        return self._id
+
     @property
     def type(self) -> str:
         """Returns the artifact type."""
@@ -69,6 +74,7 @@ class ArtifactView:
         self,
         output_data_type: Optional[Type[Any]] = None,
         materializer_class: Optional[Type[BaseMaterializer]] = None,
+        **read_options: Any,
     ) -> Any:
         """Materializes the data stored in this artifact.
 
@@ -79,6 +85,10 @@ class ArtifactView:
                 used to read the artifact data. If no materializer class is
                 given, we use the materializer that was used to write the
                 artifact during execution of the pipeline.
+            **read_options: Materializer specific options to only read parts
+                of the artifact, e.g. `rows` for the
+                `ChunkedNumpyMaterializer`. These get passed to the
+                materializers `handle_input` method.
 
         Returns:
               The materialized data.
@@ -104,7 +114,7 @@ class ArtifactView:
         #  works because materializers only require a `.uri` property at the
         #  moment.
         materializer = materializer_class(self)  # type: ignore[arg-type]
-        return materializer.handle_input(output_data_type)
+        return materializer.handle_input(output_data_type, **read_options)
 
     def __repr__(self) -> str:
         """Returns a string representation of this artifact."""
@@ -12,7 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from zenml.enums import ExecutionStatus
 from zenml.post_execution.artifact import ArtifactView
@@ -32,6 +32,7 @@ class StepView:
         name: str,
         parameters: Dict[str, Any],
         metadata_store: "BaseMetadataStore",
+        source_hash: Optional[str] = None,
     ):
         """Initializes a post-execution step object.
 
@@ -44,11 +45,14 @@ class StepView:
             parameters: Parameters that were used to run this step.
             metadata_store: The metadata store which should be used to fetch
                 additional information related to this step.
+            source_hash: Hash of the source code that was used to run this
+                step, if it was recorded.
         """
         self._id = id_
         self._name = name
         self._parameters = parameters
         self._metadata_store = metadata_store
+        self._source_hash = source_hash
 
         self._inputs: Dict[str, ArtifactView] = {}
         self._outputs: Dict[str, ArtifactView] = {}
@@ -76,6 +80,12 @@ class StepView:
         """The parameters used to run this step."""
         return self._parameters
 
+    @property
+    def source_hash(self) -> Optional[str]:
+        """Returns the hash of the source code that was used to run this step
+        or `None` if it was run before ZenML started recording it."""
+        return self._source_hash
+
     @property
     def status(self) -> ExecutionStatus:
         """Returns the current status of the step."""
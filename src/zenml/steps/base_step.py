@@ -31,6 +31,7 @@ from typing import (
 from tfx.types.channel import Channel
 
 from zenml.artifacts.base_artifact import BaseArtifact
+from zenml.constants import STEP_SOURCE_HASH_PARAMETER
 from zenml.exceptions import StepInterfaceError
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
@@ -41,12 +42,15 @@ from zenml.materializers.spec_materializer_registry import (
     SpecMaterializerRegistry,
 )
 from zenml.steps.base_step_config import BaseStepConfig
-from zenml.steps.step_output import Output
+from zenml.steps.step_input import unwrap_lazy_type
+from zenml.steps.step_output import Output, get_chunk_type
 from zenml.steps.utils import (
+    PARAM_MATERIALIZATION_WORKERS,
     SINGLE_RETURN_OUT_NAME,
     STEP_INNER_FUNC_NAME,
     _ZenMLSimpleComponent,
     generate_component,
+    get_step_source_hash,
 )
 
 logger = get_logger(__name__)
@@ -97,7 +101,11 @@ class BaseStepMeta(type):
 
         # Parse the input signature of the function
         for arg in process_args:
-            arg_type = process_spec.annotations.get(arg, None)
+            # Lazy inputs are materialized with the materializer of the
+            # wrapped type.
+            arg_type, _ = unwrap_lazy_type(
+                process_spec.annotations.get(arg, None)
+            )
             # Check whether its a `BaseStepConfig` or a registered
             # materializer type.
             if issubclass(arg_type, BaseStepConfig):
@@ -111,8 +119,30 @@ class BaseStepMeta(type):
             else:
                 cls.INPUT_SIGNATURE.update({arg: arg_type})
 
+        if getattr(cls, PARAM_MATERIALIZATION_WORKERS) < 1:
+            raise StepInterfaceError(
+                f"Step `{name}` needs at least one materialization worker."
+            )
+
+        if inspect.isasyncgenfunction(getattr(cls, STEP_INNER_FUNC_NAME)):
+            raise StepInterfaceError(
+                f"Step `{name}` is an asynchronous generator. Steps can "
+                f"either be `async def` functions or yield chunks of their "
+                f"output, but not both."
+            )
+
         # Infer the returned values
         return_spec = process_spec.annotations.get("return", None)
+        if inspect.isgeneratorfunction(getattr(cls, STEP_INNER_FUNC_NAME)):
+            # Generator steps yield chunks of a single output.
+            chunk_type = get_chunk_type(return_spec)
+            if chunk_type is None:
+                raise StepInterfaceError(
+                    f"Step `{name}` yields chunks of its output, please "
+                    f"annotate its return type with `Iterator[...]`, e.g. "
+                    f"`Iterator[pd.DataFrame]`."
+                )
+            return_spec = chunk_type
         if return_spec is not None:
             if isinstance(return_spec, Output):
                 # If its a named, potentially multi, outputs we go through
@@ -141,6 +171,11 @@ class BaseStep(metaclass=BaseStepMeta):
     INPUT_SIGNATURE: ClassVar[Dict[str, Type[Any]]] = None  # type: ignore[assignment] # noqa
     OUTPUT_SIGNATURE: ClassVar[Dict[str, Type[Any]]] = None  # type: ignore[assignment] # noqa
     CONFIG: ClassVar[Optional[Type[BaseStepConfig]]] = None
+    # Number of threads used to read inputs and write outputs concurrently
+    materialization_workers: ClassVar[int] = 1
+    # Whether to reuse outputs of previous executions with the same source
+    # code, parameters and input data
+    enable_cache: ClassVar[bool] = False
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.materializers: Dict[str, Type[BaseMaterializer]] = {}
@@ -204,6 +239,23 @@ class BaseStep(metaclass=BaseStepMeta):
         self.resolve_signature_materializers(self.INPUT_SIGNATURE, True)
         # Construct OUTPUT_SPEC from OUTPUT_SIGNATURE
         self.resolve_signature_materializers(self.OUTPUT_SIGNATURE, False)
+        if inspect.isgeneratorfunction(getattr(self, STEP_INNER_FUNC_NAME)):
+            # Fail before the pipeline runs instead of after the step yielded
+            # all of its chunks.
+            materializer_types = (
+                self.spec_materializer_registry.get_materializer_types()
+            )
+            for output_name in self.OUTPUT_SIGNATURE:
+                materializer_class = materializer_types[output_name]
+                if not materializer_class.supports_chunks():
+                    raise StepInterfaceError(
+                        f"Step `{self.step_name}` yields chunks of its output "
+                        f"`{output_name}`, but materializer "
+                        f"`{materializer_class.__name__}` does not support "
+                        f"chunked outputs. Please use a materializer that "
+                        f"implements `handle_return_chunks()` or "
+                        f"`combine_chunks()`."
+                    )
 
         # Basic checks
         for artifact in artifacts.keys():
@@ -221,8 +273,13 @@ class BaseStep(metaclass=BaseStepMeta):
                     f"of the step but not connected in the pipeline creation!"
                 )
 
+        # The source hash is recorded as a parameter so that code changes
+        # invalidate cached executions.
+        source_hash = json.dumps(get_step_source_hash(self))
         self.__component = generate_component(self)(
-            **artifacts, **self.PARAM_SPEC
+            **artifacts,
+            **self.PARAM_SPEC,
+            **{STEP_SOURCE_HASH_PARAMETER: source_hash},
         )
 
         # Resolve the returns in the right order.
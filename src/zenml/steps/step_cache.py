@@ -0,0 +1,385 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Content-addressed cache for step outputs.
+
+Unlike the TFX cache, which keys on the ids of the input artifacts, entries
+of this cache are keyed on the source code and parameters of a step and the
+contents of its input artifacts. Re-ingesting identical data therefore still
+results in cache hits for all downstream steps.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from zenml import __version__
+from zenml.artifacts.base_artifact import (
+    CONTENT_DIGEST_PROPERTY_KEY,
+    BaseArtifact,
+)
+from zenml.io import fileio
+from zenml.logger import get_logger
+from zenml.utils import path_utils, yaml_utils
+
+logger = get_logger(__name__)
+
+STEP_CACHE_DIR_NAME = ".step_cache"
+STEP_CACHE_FILE_SUFFIX = ".json"
+# Directory inside the cache directory storing computed content digests
+DIGESTS_DIR_NAME = "digests"
+READ_BLOCK_SIZE = 1024 * 1024
+
+
+def _get_file_digest(path: str) -> str:
+    """Computes the hash of the contents of a single file."""
+    digest = hashlib.sha256()
+    with fileio.open(path, "rb") as f:
+        for block in iter(lambda: f.read(READ_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_artifact_content_digest(
+    uri: str, written_files: Optional[Dict[str, Tuple[str, int]]] = None
+) -> str:
+    """Computes a hash of the relative paths and contents of all files of an
+    artifact.
+
+    Args:
+        uri: The URI of the artifact directory.
+        written_files: Maps normalized file paths to the content digests and
+            sizes of files whose contents were hashed while writing them.
+            These files are not read again unless their size changed.
+
+    Returns:
+        The hex digest of the artifact contents.
+    """
+    written_files = written_files or {}
+    digest = hashlib.sha256()
+    for directory, _, file_names in sorted(fileio.walk(uri)):
+        for file_name in sorted(file_names):
+            path = os.path.join(
+                path_utils.convert_to_str(directory),
+                path_utils.convert_to_str(file_name),
+            )
+            file_digest, size = written_files.get(
+                os.path.normpath(path), ("", -1)
+            )
+            if not file_digest or (
+                not path_utils.is_remote(path)
+                and os.path.getsize(path) != size
+            ):
+                file_digest = _get_file_digest(path)
+            digest.update(os.path.relpath(path, uri).encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(file_digest.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class _HashingFile:
+    """Wraps a file opened for writing and hashes all data written to it."""
+
+    def __init__(
+        self, file: Any, on_close: Callable[["_HashingFile"], None]
+    ) -> None:
+        """Initializes the wrapper.
+
+        Args:
+            file: The file object to wrap.
+            on_close: Gets called with the wrapper once the file is closed.
+        """
+        self._file = file
+        self._on_close = on_close
+        self._closed = False
+        self.digest = hashlib.sha256()
+        self.size = 0
+        # Data written after seeking can't be hashed sequentially.
+        self.is_sequential = True
+
+    def write(self, data: Any) -> Any:
+        """Writes data to the file and adds it to the hash."""
+        self.digest.update(data)
+        self.size += memoryview(data).nbytes
+        return self._file.write(data)
+
+    def writelines(self, lines: Iterable[Any]) -> None:
+        """Writes multiple chunks of data to the file."""
+        for line in lines:
+            self.write(line)
+
+    def seek(self, *args: Any) -> Any:
+        """Moves the file position, which invalidates the hash."""
+        self.is_sequential = False
+        return self._file.seek(*args)
+
+    def truncate(self, *args: Any) -> Any:
+        """Truncates the file, which invalidates the hash."""
+        self.is_sequential = False
+        return self._file.truncate(*args)
+
+    def close(self) -> None:
+        """Closes the file."""
+        self._file.close()
+        if not self._closed:
+            self._closed = True
+            self._on_close(self)
+
+    def __enter__(self) -> "_HashingFile":
+        """Returns the wrapper itself."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Closes the file."""
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        """Forwards all other attributes to the wrapped file."""
+        return getattr(self._file, name)
+
+
+class ContentDigestRecorder:
+    """Hashes the files of artifacts while they are written, so computing
+    their content digests doesn't need to read them again.
+
+    Only files written with `fileio.open(path, "wb")` while the recorder is
+    active are hashed while writing, all other files are read once when the
+    digest is computed.
+    """
+
+    def __init__(self, uris: Iterable[str]) -> None:
+        """Initializes the recorder.
+
+        Args:
+            uris: The URIs of the artifacts whose files should be hashed.
+        """
+        self._prefixes = tuple(
+            os.path.join(os.path.normpath(uri), "") for uri in uris
+        )
+        self._written_files: Dict[str, Tuple[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def _wrap(self, path: Any, file: Any) -> Any:
+        """Wraps files inside the recorded artifacts in a `_HashingFile`."""
+        path = os.path.normpath(path_utils.convert_to_str(path))
+        if not path.startswith(self._prefixes):
+            return file
+        return _HashingFile(file, functools.partial(self._record, path))
+
+    def _record(self, path: str, file: _HashingFile) -> None:
+        """Stores the digest of a closed file."""
+        with self._lock:
+            if file.is_sequential:
+                self._written_files[path] = (file.digest.hexdigest(), file.size)
+            else:
+                self._written_files.pop(path, None)
+
+    def get_content_digest(self, uri: str) -> str:
+        """Returns the content digest of an artifact.
+
+        Args:
+            uri: The URI of the artifact directory.
+
+        Returns:
+            The hex digest of the artifact contents.
+        """
+        with self._lock:
+            written_files = dict(self._written_files)
+        return get_artifact_content_digest(uri, written_files)
+
+    def __enter__(self) -> "ContentDigestRecorder":
+        """Starts hashing written files."""
+        fileio.add_write_hook(self._wrap)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stops hashing written files."""
+        fileio.remove_write_hook(self._wrap)
+
+
+def get_step_cache_key(
+    source_hash: str,
+    parameters: Dict[str, Any],
+    input_digests: Dict[str, str],
+    output_materializers: Dict[str, str],
+) -> str:
+    """Computes the cache key of a step execution.
+
+    Args:
+        source_hash: Hash of the source code of the step function.
+        parameters: The serialized step parameters.
+        input_digests: Maps input names to the content digests of the input
+            artifacts.
+        output_materializers: Maps output names to the sources of the
+            materializers that write them.
+
+    Returns:
+        The cache key.
+    """
+    key = {
+        "zenml_version": __version__,
+        "source": source_hash,
+        "parameters": parameters,
+        "inputs": input_digests,
+        "outputs": output_materializers,
+    }
+    return hashlib.sha256(
+        json.dumps(key, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def link_artifact_contents(source_uri: str, destination_uri: str) -> None:
+    """Makes the files of an artifact available under a new URI.
+
+    Files are hard-linked if both URIs are local paths and copied otherwise.
+
+    Args:
+        source_uri: The URI of the existing artifact.
+        destination_uri: The URI of the new artifact.
+    """
+    use_links = not (
+        path_utils.is_remote(source_uri)
+        or path_utils.is_remote(destination_uri)
+    )
+    for directory, _, file_names in fileio.walk(source_uri):
+        directory = path_utils.convert_to_str(directory)
+        target_directory = os.path.normpath(
+            os.path.join(
+                destination_uri, os.path.relpath(directory, source_uri)
+            )
+        )
+        path_utils.create_dir_recursive_if_not_exists(target_directory)
+        for file_name in file_names:
+            file_name = path_utils.convert_to_str(file_name)
+            source = os.path.join(directory, file_name)
+            destination = os.path.join(target_directory, file_name)
+            if use_links:
+                try:
+                    os.link(source, destination)
+                    continue
+                except OSError:
+                    # E.g. different devices or a filesystem without hard
+                    # links.
+                    pass
+            fileio.copy(source, destination, overwrite=True)
+
+
+class StepCache:
+    """Stores the outputs of step executions keyed by their cache key.
+
+    Each entry maps the output names of a step to the URI, materializer,
+    datatype and content digest of the output artifact.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        """Initializes the cache.
+
+        Args:
+            cache_dir: Directory in which cache entries are stored. Defaults
+                to a directory inside the artifact store of the active stack,
+                next to the artifacts the entries point to.
+        """
+        if cache_dir is None:
+            # Imported here as the repository imports the local orchestrator,
+            # which imports the step executors using this module.
+            from zenml.core.repo import Repository
+
+            artifact_store = Repository().get_active_stack().artifact_store
+            cache_dir = os.path.join(artifact_store.path, STEP_CACHE_DIR_NAME)
+        self._cache_dir = cache_dir
+
+    def _get_path(self, key: str) -> str:
+        """Returns the path of the cache entry for the given key."""
+        return os.path.join(self._cache_dir, f"{key}{STEP_CACHE_FILE_SUFFIX}")
+
+    def _write_json(self, path: str, contents: Dict[str, Any]) -> None:
+        """Writes a JSON file inside the cache directory.
+
+        The contents are written to a temporary file first so concurrent
+        steps never read a partially written file.
+        """
+        path_utils.create_dir_recursive_if_not_exists(os.path.dirname(path))
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        yaml_utils.write_json(temporary_path, contents)
+        fileio.rename(temporary_path, path, overwrite=True)
+
+    def get_content_digest(self, artifact: BaseArtifact) -> str:
+        """Returns the content digest of an artifact.
+
+        The digest is stored as a property of artifacts written by steps with
+        enabled cache. For all other artifacts it is computed once and stored
+        in the cache directory keyed by the artifact URI, as artifacts are
+        never changed after they are written.
+
+        Args:
+            artifact: A TFX artifact type.
+
+        Returns:
+            The hex digest of the artifact contents.
+        """
+        digest: str = getattr(artifact, CONTENT_DIGEST_PROPERTY_KEY, "")
+        if digest:
+            return digest
+
+        uri_hash = hashlib.sha256(artifact.uri.encode("utf-8")).hexdigest()
+        path = os.path.join(
+            self._cache_dir,
+            DIGESTS_DIR_NAME,
+            f"{uri_hash}{STEP_CACHE_FILE_SUFFIX}",
+        )
+        if fileio.exists(path):
+            try:
+                stored = yaml_utils.read_json(path)
+                if stored.get("uri") == artifact.uri:
+                    digest = stored["content_digest"]
+            except (ValueError, KeyError):
+                logger.warning("Ignoring corrupted content digest %s.", path)
+
+        if not digest:
+            digest = get_artifact_content_digest(artifact.uri)
+            self._write_json(
+                path, {"uri": artifact.uri, "content_digest": digest}
+            )
+        setattr(artifact, CONTENT_DIGEST_PROPERTY_KEY, digest)
+        return digest
+
+    def load(self, key: str) -> Optional[Dict[str, Dict[str, str]]]:
+        """Returns the cached outputs for the given key or `None` if there is
+        no entry for this key or one of the output artifacts was deleted."""
+        path = self._get_path(key)
+        if not fileio.exists(path):
+            return None
+
+        try:
+            outputs: Dict[str, Dict[str, str]] = yaml_utils.read_json(path)
+        except ValueError:
+            logger.warning("Ignoring corrupted step cache entry %s.", path)
+            return None
+
+        for output in outputs.values():
+            if not fileio.exists(output["uri"]):
+                logger.debug(
+                    "Ignoring step cache entry %s because artifact %s does "
+                    "not exist anymore.",
+                    path,
+                    output["uri"],
+                )
+                return None
+        return outputs
+
+    def save(self, key: str, outputs: Dict[str, Dict[str, str]]) -> None:
+        """Stores the outputs of a step execution for the given key."""
+        self._write_json(self._get_path(key), outputs)
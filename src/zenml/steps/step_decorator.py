@@ -14,7 +14,11 @@
 from typing import Any, Callable, Optional, Type, TypeVar, Union, overload
 
 from zenml.steps.base_step import BaseStep
-from zenml.steps.utils import STEP_INNER_FUNC_NAME
+from zenml.steps.utils import (
+    PARAM_ENABLE_CACHE,
+    PARAM_MATERIALIZATION_WORKERS,
+    STEP_INNER_FUNC_NAME,
+)
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -26,13 +30,22 @@ def step(_func: F) -> Type[BaseStep]:
 
 
 @overload
-def step(*, name: Optional[str] = None) -> Callable[[F], Type[BaseStep]]:
+def step(
+    *,
+    name: Optional[str] = None,
+    materialization_workers: int = 1,
+    enable_cache: bool = False
+) -> Callable[[F], Type[BaseStep]]:
     """Type annotations for step decorator in case of arguments."""
     ...
 
 
 def step(
-    _func: Optional[F] = None, *, name: Optional[str] = None
+    _func: Optional[F] = None,
+    *,
+    name: Optional[str] = None,
+    materialization_workers: int = 1,
+    enable_cache: bool = False
 ) -> Union[Type[BaseStep], Callable[[F], Type[BaseStep]]]:
     """Outer decorator function for the creation of a ZenML step
 
@@ -42,6 +55,11 @@ def step(
     Args:
         _func: Optional func from outside.
         name (required) the given name for the step.
+        materialization_workers: Number of threads used to read the input
+            artifacts and write the outputs of the step concurrently.
+        enable_cache: Whether to reuse the outputs of a previous execution
+            of this step with the same source code, parameters and input
+            artifact contents instead of executing it again.
 
     Returns:
         the inner decorator which creates the step class based on the
@@ -53,7 +71,8 @@ def step(
 
         Args:
           func: types.FunctionType, this function will be used as the
-            "process" method of the generated Step
+            "process" method of the generated Step. `async def` functions
+            are run on an event loop when the step gets executed.
 
         Returns:
             The class of a newly generated ZenML Step.
@@ -64,6 +83,8 @@ def step(
             (BaseStep,),
             {
                 STEP_INNER_FUNC_NAME: staticmethod(func),
+                PARAM_MATERIALIZATION_WORKERS: materialization_workers,
+                PARAM_ENABLE_CACHE: enable_cache,
             },
         )
 
@@ -0,0 +1,89 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import threading
+from typing import Any, Callable, Generic, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class Lazy(Generic[T]):
+    """Annotation for step inputs that should only be read from the artifact
+    store once the step accesses them.
+
+    Steps that only need an input on some code paths can annotate it with
+    `Lazy[...]` and call `read()` where it's needed:
+
+        @step
+        def evaluator(model: Lazy[tf.keras.Model], skip: bool) -> float:
+            if skip:
+                return 0.0
+            return evaluate(model.read())
+
+    Steps that only need parts of an input can pass materializer specific
+    read options, e.g. `data.read(columns=["age"])` for dataframes.
+    """
+
+    def __init__(self, load: Callable[..., T]):
+        """Initializes the lazy input.
+
+        Args:
+            load: Function that materializes the input artifact. It gets
+                called with the read options passed to `read()`.
+        """
+        self._load = load
+        self._value: Optional[T] = None
+        self._is_loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Returns whether the complete input artifact was already
+        materialized."""
+        return self._is_loaded
+
+    def read(self, **read_options: Any) -> T:
+        """Materializes the input artifact.
+
+        Args:
+            **read_options: Materializer specific options to only read parts
+                of the artifact. Partial reads are not cached.
+
+        Returns:
+            The input. Reading the complete input multiple times returns the
+            same object.
+        """
+        if read_options:
+            return self._load(**read_options)
+
+        with self._lock:
+            if not self._is_loaded:
+                self._value = self._load()
+                self._is_loaded = True
+        return self._value  # type: ignore[return-value]
+
+
+def unwrap_lazy_type(annotation: Any) -> Tuple[Any, bool]:
+    """Removes the `Lazy` annotation of a step input.
+
+    Args:
+        annotation: The annotation of a step input, e.g. `Lazy[np.ndarray]`.
+
+    Returns:
+        A tuple of the wrapped type (or the annotation itself if it isn't
+        lazy) and a boolean indicating whether the input is lazy.
+    """
+    if getattr(annotation, "__origin__", None) is Lazy:
+        return annotation.__args__[0], True
+    return annotation, False
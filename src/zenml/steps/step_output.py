@@ -12,7 +12,20 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
-from typing import Any, Iterator, NamedTuple, Tuple, Type
+import collections.abc
+import typing
+from typing import Any, Iterator, NamedTuple, Optional, Tuple, Type
+
+# `__origin__` is the `collections.abc` class since Python 3.7 and the
+# `typing` class in Python 3.6.
+CHUNK_ORIGINS = (
+    collections.abc.Iterator,
+    collections.abc.Iterable,
+    collections.abc.Generator,
+    typing.Iterator,
+    typing.Iterable,
+    typing.Generator,
+)
 
 
 class Output(object):
@@ -26,3 +39,19 @@ class Output(object):
     def items(self) -> Iterator[Tuple[str, Type[Any]]]:
         """Yields a tuple of type (output_name, output_type)."""
         yield from self.outputs.__annotations__.items()
+
+
+def get_chunk_type(annotation: Any) -> Optional[Type[Any]]:
+    """Returns the type of the chunks a generator step yields.
+
+    Args:
+        annotation: The return annotation of a generator step function, e.g.
+            `Iterator[pd.DataFrame]`.
+
+    Returns:
+        The type of the chunks or `None` if the annotation isn't an
+        `Iterator`, `Iterable` or `Generator` annotation.
+    """
+    if getattr(annotation, "__origin__", None) in CHUNK_ORIGINS:
+        return annotation.__args__[0]  # type: ignore[no-any-return]
+    return None
@@ -25,20 +25,30 @@ is proposed by ZenML.
 
 from __future__ import absolute_import, division, print_function
 
+import asyncio
+import functools
+import importlib
 import inspect
 import json
 import sys
+import threading
+from collections import OrderedDict
+from concurrent import futures
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     ClassVar,
+    Coroutine,
     Dict,
+    FrozenSet,
     ItemsView,
     Iterator,
     KeysView,
     List,
+    NamedTuple,
     Optional,
+    Tuple,
     Type,
     ValuesView,
 )
@@ -51,15 +61,26 @@ from tfx.types import component_spec
 from tfx.types.channel import Channel
 from tfx.utils import json_utils
 
-from zenml.artifacts.base_artifact import BaseArtifact
-from zenml.exceptions import MissingStepParameterError
+from zenml.artifacts.base_artifact import (
+    CONTENT_DIGEST_PROPERTY_KEY,
+    BaseArtifact,
+)
+from zenml.constants import STEP_SOURCE_HASH_PARAMETER
+from zenml.exceptions import MissingStepParameterError, StepInterfaceError
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.materializers.spec_materializer_registry import (
     SpecMaterializerRegistry,
 )
 from zenml.steps.base_step_config import BaseStepConfig
-from zenml.steps.step_output import Output
+from zenml.steps.step_cache import (
+    ContentDigestRecorder,
+    StepCache,
+    get_step_cache_key,
+    link_artifact_contents,
+)
+from zenml.steps.step_input import Lazy, unwrap_lazy_type
+from zenml.steps.step_output import Output, get_chunk_type
 from zenml.utils import source_utils
 
 if TYPE_CHECKING:
@@ -70,6 +91,8 @@ logger = get_logger(__name__)
 STEP_INNER_FUNC_NAME: str = "process"
 SINGLE_RETURN_OUT_NAME: str = "output"
 PARAM_STEP_NAME: str = "step_name"
+PARAM_MATERIALIZATION_WORKERS: str = "materialization_workers"
+PARAM_ENABLE_CACHE: str = "enable_cache"
 
 
 def do_types_match(type_a: Type[Any], type_b: Type[Any]) -> bool:
@@ -87,12 +110,102 @@ def do_types_match(type_a: Type[Any], type_b: Type[Any]) -> bool:
     return type_a == type_b
 
 
+def _get_component_cache_key(step: "BaseStep") -> Tuple[Any, ...]:
+    """Returns a key that identifies all generated classes of a step.
+
+    Two step instances with the same key share their generated component
+    spec, executor and component classes.
+
+    Args:
+        step: a ZenML step instance
+
+    Returns:
+        A hashable tuple of the step class, name, materializers and
+        signatures.
+    """
+    materializers = step.spec_materializer_registry.get_materializer_types()
+    return (
+        step.__class__,
+        step.step_name,
+        tuple(sorted(materializers.items(), key=lambda item: item[0])),
+        tuple(step.INPUT_SPEC.items()),
+        tuple(step.OUTPUT_SPEC.items()),
+        tuple(sorted(step.PARAM_SPEC)),
+    )
+
+
+# Least recently used classes are dropped once the cache is full.
+MAX_CACHED_COMPONENT_CLASSES = 256
+_component_classes: "OrderedDict[Tuple[Any, ...], Callable[..., Any]]" = (
+    OrderedDict()
+)
+_executor_name_counts: Dict[str, int] = {}
+_component_classes_lock = threading.Lock()
+
+
 def generate_component(step: "BaseStep") -> Callable[..., Any]:
     """Utility function which converts a ZenML step into a TFX Component
 
+    The generated classes of function-based steps are cached, so creating
+    many pipelines from the same steps with the same materializers only
+    generates them once. The executors of class-based steps call the
+    `process` method of the given step instance, which can have its own
+    state, so their classes are generated for each instance and not cached.
+
+    Args:
+        step: a ZenML step instance
+
+    Returns:
+        component: the class of the corresponding TFX component
+    """
+    function = getattr(step, STEP_INNER_FUNC_NAME)
+    if inspect.ismethod(function):
+        # The lock also guards the executor name counts.
+        with _component_classes_lock:
+            return _generate_component_class(step, function)
+
+    cache_key = _get_component_cache_key(step)
+    with _component_classes_lock:
+        if cache_key in _component_classes:
+            _component_classes.move_to_end(cache_key)
+            return _component_classes[cache_key]
+
+        component_class = _generate_component_class(step, function)
+        _component_classes[cache_key] = component_class
+        if len(_component_classes) > MAX_CACHED_COMPONENT_CLASSES:
+            _component_classes.popitem(last=False)
+        return component_class
+
+
+def get_step_source_hash(step: "BaseStep") -> str:
+    """Returns the hash of the source code of a step.
+
     Args:
         step: a ZenML step instance
 
+    Returns:
+        The hash or an empty string if the source code is not available,
+        e.g. for steps defined in an interactive shell.
+    """
+    try:
+        return source_utils.get_hashed_source(
+            getattr(step, STEP_INNER_FUNC_NAME)
+        )
+    except (OSError, TypeError):
+        logger.debug("Unable to get source code of step `%s`.", step.step_name)
+        return ""
+
+
+def _generate_component_class(
+    step: "BaseStep", function: Callable[..., Any]
+) -> Callable[..., Any]:
+    """Generates the TFX component spec, executor and component classes for
+    a step.
+
+    Args:
+        step: a ZenML step instance
+        function: The step function that the executor calls.
+
     Returns:
         component: the class of the corresponding TFX component
     """
@@ -105,6 +218,7 @@ def generate_component(step: "BaseStep") -> Callable[..., Any]:
         spec_outputs[key] = component_spec.ChannelParameter(type=artifact_type)
     for key, prim_type in step.PARAM_SPEC.items():
         spec_params[key] = component_spec.ExecutionParameter(type=str)  # type: ignore[no-untyped-call] # noqa
+    spec_params[STEP_SOURCE_HASH_PARAMETER] = component_spec.ExecutionParameter(type=str)  # type: ignore[no-untyped-call] # noqa
 
     component_spec_class = type(
         "%s_Spec" % step.__class__.__name__,
@@ -116,20 +230,34 @@ def generate_component(step: "BaseStep") -> Callable[..., Any]:
         },
     )
 
+    # Each variant of a step (e.g. with different materializers) gets its own
+    # executor name so that all of them stay importable at the same time.
+    executor_name = "%s_Executor" % step.__class__.__name__
+    executor_key = f"{step.__module__}.{executor_name}"
+    variant = _executor_name_counts.get(executor_key, 0)
+    _executor_name_counts[executor_key] = variant + 1
+    if variant:
+        executor_name = f"{executor_name}_{variant}"
+
+    spec_materializer_registry = SpecMaterializerRegistry()
+    for (
+        key,
+        materializer,
+    ) in step.spec_materializer_registry.get_materializer_types().items():
+        spec_materializer_registry.register_materializer_type(
+            key, materializer
+        )
+
     # Defining a executor class bu utilizing the process function
-    executor_class = type(
-        "%s_Executor" % step.__class__.__name__,
-        (_FunctionExecutor,),
-        {
-            "_FUNCTION": staticmethod(getattr(step, STEP_INNER_FUNC_NAME)),
-            "__module__": step.__module__,
-            "spec_materializer_registry": step.spec_materializer_registry,
-            PARAM_STEP_NAME: step.step_name,
-        },
+    executor_class = _generate_executor_class(
+        executor_name=executor_name,
+        executor_module=step.__module__,
+        function=function,
+        spec_materializer_registry=spec_materializer_registry,
+        step_name=step.step_name,
+        materialization_workers=getattr(step, PARAM_MATERIALIZATION_WORKERS),
+        enable_cache=getattr(step, PARAM_ENABLE_CACHE),
     )
-
-    module = sys.modules[step.__module__]
-    setattr(module, "%s_Executor" % step.__class__.__name__, executor_class)
     executor_spec_instance = ExecutorClassSpec(executor_class=executor_class)
 
     # Defining the component with the corresponding executor and spec
@@ -144,6 +272,294 @@ def generate_component(step: "BaseStep") -> Callable[..., Any]:
     )
 
 
+class StepExecutionPlan(NamedTuple):
+    """Everything `_FunctionExecutor.Do()` needs to know about a step
+    function to bind its arguments and handle its return values.
+
+    Attributes:
+        config_arg: Name of the `BaseStepConfig` argument, if any.
+        config_type: Type of the `BaseStepConfig` argument, if any.
+        input_types: Maps the names of all input artifact arguments to the
+            type they should be materialized as.
+        lazy_inputs: Names of the input artifact arguments annotated with
+            `Lazy[...]` that are only materialized when the step reads them.
+        output_types: Maps output names to their declared types, in the order
+            in which the step function returns them.
+        is_multi_output: Whether the step returns an `Output(...)` tuple.
+        yields_chunks: Whether the step is a generator function that yields
+            chunks of its single output.
+        is_coroutine: Whether the step is an `async def` function that needs
+            to run on an event loop.
+        output_materializers: Maps output names to materializer classes.
+        output_materializer_sources: Maps output names to the sources of
+            their materializer classes.
+        output_type_sources: Maps output names to the sources of their
+            declared types.
+    """
+
+    config_arg: Optional[str]
+    config_type: Optional[Type[BaseStepConfig]]
+    input_types: Dict[str, Type[Any]]
+    lazy_inputs: FrozenSet[str]
+    output_types: Dict[str, Type[Any]]
+    is_multi_output: bool
+    yields_chunks: bool
+    is_coroutine: bool
+    output_materializers: Dict[str, Type[BaseMaterializer]]
+    output_materializer_sources: Dict[str, str]
+    output_type_sources: Dict[str, str]
+
+
+def get_execution_plan(
+    function: Callable[..., Any],
+    spec_materializer_registry: Optional[SpecMaterializerRegistry],
+) -> StepExecutionPlan:
+    """Inspects a step function once so that executing the step doesn't need
+    any introspection.
+
+    Args:
+        function: The step function.
+        spec_materializer_registry: Materializers for the step inputs and
+            outputs.
+
+    Returns:
+        The execution plan of the step function.
+    """
+    spec = inspect.getfullargspec(function)
+    args = list(spec.args)
+    # Bound `process` methods of class-based steps include `self`
+    if inspect.ismethod(function) and args:
+        args.pop(0)
+
+    config_arg, config_type = None, None
+    input_types = {}
+    lazy_inputs = set()
+    for arg in args:
+        arg_type, is_lazy = unwrap_lazy_type(spec.annotations.get(arg, None))
+        if isinstance(arg_type, type) and issubclass(arg_type, BaseStepConfig):
+            config_arg, config_type = arg, arg_type
+        else:
+            input_types[arg] = arg_type
+            if is_lazy:
+                lazy_inputs.add(arg)
+
+    return_type = spec.annotations.get("return", None)
+    yields_chunks = inspect.isgeneratorfunction(function)
+    if yields_chunks:
+        return_type = get_chunk_type(return_type)
+    output_types: Dict[str, Type[Any]] = {}
+    is_multi_output = isinstance(return_type, Output)
+    if isinstance(return_type, Output):
+        output_types = dict(return_type.items())
+    elif return_type is not None:
+        output_types = {SINGLE_RETURN_OUT_NAME: return_type}
+
+    output_materializers = {}
+    if spec_materializer_registry:
+        output_materializers = {
+            name: spec_materializer_registry.get_single_materializer_type(name)
+            for name in output_types
+            if spec_materializer_registry.is_registered(name)
+        }
+
+    return StepExecutionPlan(
+        config_arg=config_arg,
+        config_type=config_type,
+        input_types=input_types,
+        lazy_inputs=frozenset(lazy_inputs),
+        output_types=output_types,
+        is_multi_output=is_multi_output,
+        yields_chunks=yields_chunks,
+        is_coroutine=inspect.iscoroutinefunction(function),
+        output_materializers=output_materializers,
+        output_materializer_sources={
+            name: source_utils.resolve_class(materializer)
+            for name, materializer in output_materializers.items()
+        },
+        output_type_sources={
+            name: source_utils.resolve_class(output_type)
+            for name, output_type in output_types.items()
+            if isinstance(output_type, type)
+        },
+    )
+
+
+def _generate_executor_class(
+    executor_name: str,
+    executor_module: str,
+    function: Callable[..., Any],
+    spec_materializer_registry: SpecMaterializerRegistry,
+    step_name: str,
+    materialization_workers: int = 1,
+    enable_cache: bool = False,
+) -> Type["_FunctionExecutor"]:
+    """Creates a TFX executor class for a step function and makes it
+    importable from the given module.
+
+    Args:
+        executor_name: Name of the executor class.
+        executor_module: Module in which the executor class gets registered.
+        function: The step function that the executor calls.
+        spec_materializer_registry: Materializers for the step inputs and
+            outputs.
+        step_name: Name of the step.
+        materialization_workers: Number of threads used to read inputs and
+            write outputs of the step concurrently.
+        enable_cache: Whether to reuse the outputs of previous executions
+            with the same source code, parameters and input data.
+
+    Returns:
+        The executor class.
+    """
+    executor_class = type(
+        executor_name,
+        (_FunctionExecutor,),
+        {
+            "_FUNCTION": staticmethod(function),
+            "__module__": executor_module,
+            "spec_materializer_registry": spec_materializer_registry,
+            "_EXECUTION_PLAN": get_execution_plan(
+                function, spec_materializer_registry
+            ),
+            PARAM_STEP_NAME: step_name,
+            PARAM_MATERIALIZATION_WORKERS: materialization_workers,
+            PARAM_ENABLE_CACHE: enable_cache,
+        },
+    )
+
+    module = sys.modules[executor_module]
+    setattr(module, executor_name, executor_class)
+    return executor_class
+
+
+def get_executor_sources(
+    executor_class: Type["_FunctionExecutor"],
+) -> Dict[str, Any]:
+    """Returns serializable sources of a generated executor class so that it
+    can be regenerated in a different process via
+    `regenerate_executor_class()`.
+
+    Args:
+        executor_class: An executor class created by `generate_component()`.
+
+    Returns:
+        A dictionary that only contains strings and booleans.
+
+    Raises:
+        StepInterfaceError: If the step function can't be imported from
+            outside the process that created it.
+    """
+    function = executor_class._FUNCTION
+    is_method = inspect.ismethod(function)
+    if "<locals>" in function.__qualname__:
+        raise StepInterfaceError(
+            f"Step `{getattr(executor_class, PARAM_STEP_NAME)}` is defined "
+            f"inside a function and can therefore not be executed in a "
+            f"separate process. Please define it at module level."
+        )
+
+    registry = executor_class.spec_materializer_registry
+    materializers = registry.get_materializer_types() if registry else {}
+    return {
+        "executor_name": executor_class.__name__,
+        "executor_module": executor_class.__module__,
+        "function_module": function.__module__,
+        "function_name": function.__qualname__,
+        "is_method": is_method,
+        "step_name": getattr(executor_class, PARAM_STEP_NAME),
+        "materialization_workers": getattr(
+            executor_class, PARAM_MATERIALIZATION_WORKERS
+        ),
+        "enable_cache": getattr(executor_class, PARAM_ENABLE_CACHE),
+        "materializers": {
+            key: source_utils.resolve_class(materializer)
+            for key, materializer in materializers.items()
+        },
+    }
+
+
+def regenerate_executor_class(
+    sources: Dict[str, Any]
+) -> Type["_FunctionExecutor"]:
+    """Regenerates an executor class from the sources returned by
+    `get_executor_sources()` and makes it importable again.
+
+    Args:
+        sources: Sources of the executor class.
+
+    Returns:
+        The regenerated executor class.
+    """
+    obj: Any = importlib.import_module(sources["function_module"])
+    name_parts = sources["function_name"].split(".")
+    owner = obj
+    for name_part in name_parts:
+        owner, obj = obj, getattr(obj, name_part)
+
+    if sources["is_method"]:
+        # Class-based steps call the process method on a step instance.
+        function = getattr(owner(), name_parts[-1])
+    elif isinstance(obj, type) and issubclass(obj, _step_base_class()):
+        # The `@step` decorator replaces the function with the step class
+        # inside its module.
+        function = getattr(obj, STEP_INNER_FUNC_NAME)
+    else:
+        function = obj
+
+    spec_materializer_registry = SpecMaterializerRegistry()
+    for key, source in sources["materializers"].items():
+        spec_materializer_registry.register_materializer_type(
+            key, source_utils.load_source_path_class(source)
+        )
+
+    importlib.import_module(sources["executor_module"])
+    return _generate_executor_class(
+        executor_name=sources["executor_name"],
+        executor_module=sources["executor_module"],
+        function=function,
+        spec_materializer_registry=spec_materializer_registry,
+        step_name=sources["step_name"],
+        materialization_workers=sources["materialization_workers"],
+        enable_cache=sources["enable_cache"],
+    )
+
+
+def run_coroutine(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Runs a coroutine to completion and returns its result.
+
+    Event loops can't be nested and steps might get executed from a thread
+    that already runs one (e.g. in a Jupyter notebook), so the coroutine
+    always runs on a new event loop in a separate thread.
+
+    Args:
+        coroutine: The coroutine returned by an `async def` step function.
+
+    Returns:
+        The return value of the coroutine.
+    """
+
+    def _run() -> Any:
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    with futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="zenml_event_loop"
+    ) as executor:
+        return executor.submit(_run).result()
+
+
+def _step_base_class() -> Type["BaseStep"]:
+    """Returns the `BaseStep` class, imported lazily to avoid circular
+    imports."""
+    from zenml.steps.base_step import BaseStep
+
+    return BaseStep
+
+
 class _PropertyDictWrapper(json_utils.Jsonable):
     """Helper class to wrap inputs/outputs from TFX nodes.
     Currently, this class is read-only (setting properties is not implemented).
@@ -223,6 +639,19 @@ class _FunctionExecutor(BaseExecutor):
     spec_materializer_registry: ClassVar[
         Optional[SpecMaterializerRegistry]
     ] = None
+    _EXECUTION_PLAN: ClassVar[Optional[StepExecutionPlan]] = None
+    materialization_workers: ClassVar[int] = 1
+    enable_cache: ClassVar[bool] = False
+
+    @classmethod
+    def get_execution_plan(cls) -> StepExecutionPlan:
+        """Returns the precomputed execution plan of the step function and
+        computes it if the executor class was created without one."""
+        if cls._EXECUTION_PLAN is None:
+            cls._EXECUTION_PLAN = get_execution_plan(
+                cls._FUNCTION, cls.spec_materializer_registry
+            )
+        return cls._EXECUTION_PLAN
 
     def resolve_materializer_with_registry(
         self, param_name: str, artifact: BaseArtifact
@@ -248,7 +677,11 @@ class _FunctionExecutor(BaseExecutor):
         return materializer_class
 
     def resolve_input_artifact(
-        self, artifact: BaseArtifact, data_type: Type[Any]
+        self,
+        artifact: BaseArtifact,
+        data_type: Type[Any],
+        step_resources: Optional[Dict[str, Any]] = None,
+        **read_options: Any,
     ) -> Any:
         """Resolves an input artifact, i.e., reading it from the Artifact Store
         to a pythonic object.
@@ -256,15 +689,25 @@ class _FunctionExecutor(BaseExecutor):
         Args:
             artifact: A TFX artifact type.
             data_type: The type of data to be materialized.
+            step_resources: Dictionary shared by all inputs of the step
+                execution, see `BaseMaterializer.get_step_read_options()`.
+            **read_options: Materializer specific options to only read parts
+                of the artifact.
 
         Returns:
             Return the output of `handle_input()` of selected materializer.
         """
-        materializer = source_utils.load_source_path_class(
+        materializer_class = source_utils.load_source_path_class(
             artifact.materializer
-        )(artifact)
+        )
+        if step_resources is not None:
+            read_options = {
+                **materializer_class.get_step_read_options(step_resources),
+                **read_options,
+            }
+        materializer = materializer_class(artifact)
         # The materializer now returns a resolved input
-        return materializer.handle_input(data_type=data_type)
+        return materializer.handle_input(data_type=data_type, **read_options)
 
     def resolve_output_artifact(
         self, param_name: str, artifact: BaseArtifact, data: Any
@@ -277,12 +720,51 @@ class _FunctionExecutor(BaseExecutor):
             artifact: A TFX artifact type.
             data: The object to be passed to `handle_return()`.
         """
+        materializer_class = self._resolve_output_materializer(
+            param_name, artifact
+        )
+        plan = self.get_execution_plan()
+        data_type = type(data)
+        if data_type is plan.output_types.get(param_name):
+            artifact.datatype = plan.output_type_sources[param_name]
+        else:
+            artifact.datatype = source_utils.resolve_class(data_type)
+        materializer_class(artifact).handle_return(data)
+
+    def resolve_chunked_output_artifact(
+        self, param_name: str, artifact: BaseArtifact, chunks: Iterator[Any]
+    ) -> None:
+        """Resolves an output artifact that a generator step yields in chunks.
+        Calls `handle_return_chunks(chunks)` of the selected materializer.
+
+        Args:
+            param_name: Name of output param.
+            artifact: A TFX artifact type.
+            chunks: The chunks to be passed to `handle_return_chunks()`.
+        """
+        materializer_class = self._resolve_output_materializer(
+            param_name, artifact
+        )
+        artifact.datatype = self.get_execution_plan().output_type_sources[
+            param_name
+        ]
+        materializer_class(artifact).handle_return_chunks(chunks)
+
+    def _resolve_output_materializer(
+        self, param_name: str, artifact: BaseArtifact
+    ) -> Type[BaseMaterializer]:
+        """Returns the materializer class for an output and stores its source
+        on the output artifact."""
+        plan = self.get_execution_plan()
+        if param_name in plan.output_materializers:
+            artifact.materializer = plan.output_materializer_sources[param_name]
+            return plan.output_materializers[param_name]
+
         materializer_class = self.resolve_materializer_with_registry(
             param_name, artifact
         )
         artifact.materializer = source_utils.resolve_class(materializer_class)
-        artifact.datatype = source_utils.resolve_class(type(data))
-        materializer_class(artifact).handle_return(data)
+        return materializer_class
 
     def check_output_types_match(
         self, output_value: Any, specified_type: Type[Any]
@@ -306,6 +788,210 @@ class _FunctionExecutor(BaseExecutor):
                 f"{getattr(self, PARAM_STEP_NAME)}"
             )
 
+    @classmethod
+    def get_cache_key(
+        cls,
+        input_digests: Dict[str, str],
+        exec_properties: Dict[str, Any],
+    ) -> Optional[str]:
+        """Computes the step cache key of an execution of this step.
+
+        Args:
+            input_digests: Maps input names to the content digests of the
+                input artifacts.
+            exec_properties: dictionary containing the execution parameters
+
+        Returns:
+            The cache key or `None` if the source code of the step function
+            is not available.
+        """
+        try:
+            source_hash = source_utils.get_hashed_source(cls._FUNCTION)
+        except (OSError, TypeError):
+            logger.warning(
+                "Unable to get the source code of step `%s`, skipping the "
+                "step cache.",
+                getattr(cls, PARAM_STEP_NAME),
+            )
+            return None
+
+        plan = cls.get_execution_plan()
+        registry = cls.spec_materializer_registry
+        output_materializers = {}
+        for name in plan.output_types:
+            if name in plan.output_materializer_sources:
+                source = plan.output_materializer_sources[name]
+            elif registry:
+                source = source_utils.resolve_class(
+                    registry.get_single_materializer_type(name)
+                )
+            else:
+                continue
+            output_materializers[name] = source
+        return get_step_cache_key(
+            source_hash, exec_properties, input_digests, output_materializers
+        )
+
+    def _get_cache_key(
+        self,
+        step_cache: StepCache,
+        input_dict: Dict[str, List[BaseArtifact]],
+        exec_properties: Dict[str, Any],
+    ) -> Optional[str]:
+        """Computes the step cache key of this execution.
+
+        Args:
+            step_cache: The cache storing the digests of input artifacts.
+            input_dict: dictionary containing the input artifacts
+            exec_properties: dictionary containing the execution parameters
+
+        Returns:
+            The cache key or `None` if the source code of the step function
+            is not available.
+        """
+        input_digests = self._map_concurrently(
+            step_cache.get_content_digest,
+            {
+                arg: (input_dict[arg][0],)
+                for arg in self.get_execution_plan().input_types
+            },
+        )
+        return self.get_cache_key(input_digests, exec_properties)
+
+    def _use_cached_outputs(
+        self,
+        step_cache: StepCache,
+        cache_key: str,
+        output_dict: Dict[str, List[BaseArtifact]],
+    ) -> bool:
+        """Links the outputs of a cached execution to the output artifacts.
+
+        Args:
+            step_cache: The step cache.
+            cache_key: Cache key of this execution.
+            output_dict: dictionary containing the output artifacts
+
+        Returns:
+            Whether a cache entry for all outputs was found.
+        """
+        outputs = step_cache.load(cache_key)
+        if outputs is None or set(outputs) != set(output_dict):
+            return False
+
+        for name, output in outputs.items():
+            artifact = output_dict[name][0]
+            link_artifact_contents(output["uri"], artifact.uri)
+            artifact.materializer = output["materializer"]
+            artifact.datatype = output["datatype"]
+            setattr(
+                artifact, CONTENT_DIGEST_PROPERTY_KEY, output["content_digest"]
+            )
+        logger.info(
+            "Reusing cached outputs of step `%s`.",
+            getattr(self, PARAM_STEP_NAME),
+        )
+        return True
+
+    def _cache_outputs(
+        self,
+        step_cache: StepCache,
+        cache_key: str,
+        output_dict: Dict[str, List[BaseArtifact]],
+        recorder: ContentDigestRecorder,
+    ) -> None:
+        """Stores the output artifacts of this execution in the step cache.
+
+        Args:
+            step_cache: The step cache.
+            cache_key: Cache key of this execution.
+            output_dict: dictionary containing the output artifacts
+            recorder: The recorder which hashed the output files while they
+                were written.
+        """
+        outputs = {}
+        for name, artifacts in output_dict.items():
+            artifact = artifacts[0]
+            digest = recorder.get_content_digest(artifact.uri)
+            setattr(artifact, CONTENT_DIGEST_PROPERTY_KEY, digest)
+            outputs[name] = {
+                "uri": artifact.uri,
+                "materializer": artifact.materializer,
+                "datatype": artifact.datatype,
+                "content_digest": digest,
+            }
+        step_cache.save(cache_key, outputs)
+
+    def _write_outputs(
+        self, output_dict: Dict[str, List[BaseArtifact]], return_values: Any
+    ) -> None:
+        """Writes the return values of the step function to the output
+        artifacts.
+
+        Args:
+            output_dict: dictionary containing the output artifacts
+            return_values: The return values of the step function.
+        """
+        plan = self.get_execution_plan()
+        if plan.yields_chunks:
+            # The generator only runs while the materializer consumes the
+            # chunks, so the complete output is never held in memory.
+            self.resolve_chunked_output_artifact(
+                SINGLE_RETURN_OUT_NAME,
+                output_dict[SINGLE_RETURN_OUT_NAME][0],
+                return_values,
+            )
+        elif plan.is_multi_output:
+            # Resolve named (and multi-) outputs.
+            self._map_concurrently(
+                self.resolve_output_artifact,
+                {
+                    output_name: (
+                        output_name,
+                        output_dict[output_name][0],
+                        return_values[i],  # order preserved.
+                    )
+                    for i, output_name in enumerate(plan.output_types)
+                },
+            )
+        elif plan.output_types:
+            # Resolve single output
+            self.resolve_output_artifact(
+                SINGLE_RETURN_OUT_NAME,
+                output_dict[SINGLE_RETURN_OUT_NAME][0],
+                return_values,
+            )
+
+    def _map_concurrently(
+        self, function: Callable[..., Any], args: Dict[str, Tuple[Any, ...]]
+    ) -> Dict[str, Any]:
+        """Calls a function for multiple sets of arguments, using up to
+        `materialization_workers` threads.
+
+        Args:
+            function: The function to call, e.g. `resolve_input_artifact`.
+            args: Maps keys to the positional arguments of one function call.
+
+        Returns:
+            A dictionary mapping the keys of `args` to the return values of
+            the function calls.
+        """
+        num_workers = min(
+            getattr(self, PARAM_MATERIALIZATION_WORKERS), len(args)
+        )
+        if num_workers <= 1:
+            return {
+                key: function(*call_args) for key, call_args in args.items()
+            }
+
+        with futures.ThreadPoolExecutor(
+            max_workers=num_workers, thread_name_prefix="zenml_materializer"
+        ) as executor:
+            results = {
+                key: executor.submit(function, *call_args)
+                for key, call_args in args.items()
+            }
+            return {key: result.result() for key, result in results.items()}
+
     def Do(
         self,
         input_dict: Dict[str, List[BaseArtifact]],
@@ -319,55 +1005,91 @@ class _FunctionExecutor(BaseExecutor):
             output_dict: dictionary containing the output artifacts
             exec_properties: dictionary containing the execution parameters
         """
+        plan = self.get_execution_plan()
+
         # Building the args for the process function
         function_params = {}
 
         # First, we parse the inputs, i.e., params and input artifacts.
-        spec = inspect.getfullargspec(self._FUNCTION)
-        args = spec.args
-        for arg in args:
-            arg_type = spec.annotations.get(arg, None)
-            if issubclass(arg_type, BaseStepConfig):
-                # Resolving the execution parameters
-                new_exec = {
-                    k: json.loads(v) for k, v in exec_properties.items()
-                }
-
-                try:
-                    config_object = arg_type.parse_obj(new_exec)
-                except pydantic.ValidationError as e:
-                    missing_fields = [
-                        field
-                        for error_dict in e.errors()
-                        for field in error_dict["loc"]
-                    ]
-
-                    raise MissingStepParameterError(
-                        getattr(self, PARAM_STEP_NAME), missing_fields, arg_type
-                    ) from None
-                function_params[arg] = config_object
-            else:
-                # At this point, it has to be an artifact, so we resolve
-                function_params[arg] = self.resolve_input_artifact(
-                    input_dict[arg][0], arg_type
+        if plan.config_arg and plan.config_type:
+            # Resolving the execution parameters
+            new_exec = {
+                k: json.loads(v)
+                for k, v in exec_properties.items()
+                if k != STEP_SOURCE_HASH_PARAMETER
+            }
+
+            try:
+                config_object = plan.config_type.parse_obj(new_exec)
+            except pydantic.ValidationError as e:
+                missing_fields = [
+                    field
+                    for error_dict in e.errors()
+                    for field in error_dict["loc"]
+                ]
+
+                raise MissingStepParameterError(
+                    getattr(self, PARAM_STEP_NAME),
+                    missing_fields,
+                    plan.config_type,
+                ) from None
+            function_params[plan.config_arg] = config_object
+
+        step_cache, cache_key = None, None
+        if getattr(self, PARAM_ENABLE_CACHE):
+            step_cache = StepCache()
+            cache_key = self._get_cache_key(
+                step_cache, input_dict, exec_properties
+            )
+            if cache_key and self._use_cached_outputs(
+                step_cache, cache_key, output_dict
+            ):
+                return
+
+        # At this point, all other arguments have to be artifacts, so we
+        # resolve them.
+        step_resources: Dict[str, Any] = {}
+        function_params.update(
+            self._map_concurrently(
+                self.resolve_input_artifact,
+                {
+                    arg: (input_dict[arg][0], arg_type, step_resources)
+                    for arg, arg_type in plan.input_types.items()
+                    if arg not in plan.lazy_inputs
+                },
+            )
+        )
+        lazy_inputs = {
+            arg: Lazy(
+                functools.partial(
+                    self.resolve_input_artifact,
+                    input_dict[arg][0],
+                    plan.input_types[arg],
+                    step_resources,
                 )
+            )
+            for arg in plan.lazy_inputs
+        }
+        function_params.update(lazy_inputs)
 
         return_values = self._FUNCTION(**function_params)
-        spec = inspect.getfullargspec(self._FUNCTION)
-        return_type: Type[Any] = spec.annotations.get("return", None)
-        if return_type is not None:
-            if isinstance(return_type, Output):
-                # Resolve named (and multi-) outputs.
-                for i, output_tuple in enumerate(return_type.items()):
-                    self.resolve_output_artifact(
-                        output_tuple[0],
-                        output_dict[output_tuple[0]][0],
-                        return_values[i],  # order preserved.
-                    )
-            else:
-                # Resolve single output
-                self.resolve_output_artifact(
-                    SINGLE_RETURN_OUT_NAME,
-                    output_dict[SINGLE_RETURN_OUT_NAME][0],
-                    return_values,
+        if plan.is_coroutine:
+            return_values = run_coroutine(return_values)
+        if step_cache and cache_key:
+            # The outputs are hashed while they are written so they don't
+            # need to be read again to store them in the step cache.
+            with ContentDigestRecorder(
+                artifacts[0].uri for artifacts in output_dict.values()
+            ) as recorder:
+                self._write_outputs(output_dict, return_values)
+            self._cache_outputs(step_cache, cache_key, output_dict, recorder)
+        else:
+            self._write_outputs(output_dict, return_values)
+
+        for arg, lazy_input in lazy_inputs.items():
+            if not lazy_input.is_loaded:
+                logger.debug(
+                    "Step `%s` did not read lazy input `%s`.",
+                    getattr(self, PARAM_STEP_NAME),
+                    arg,
                 )
@@ -23,6 +23,7 @@ can also be optionally pinned.
 * pin: Whatever comes after the `@` symbol from a source, usually the git sha
 or the version of zenml as a string.
 """
+import hashlib
 import importlib
 import inspect
 import os
@@ -266,3 +267,34 @@ def import_python_file(file_path: str) -> types.ModuleType:
 
     module_name = os.path.splitext(os.path.basename(file_path))[0]
     return importlib.import_module(module_name)
+
+
+def get_source(value: Any) -> str:
+    """Returns the source code of an object.
+
+    Args:
+        value: A class, function or method.
+
+    Raises:
+        TypeError: If the source code is not available, e.g. for built-in
+            objects.
+        OSError: If the source code can't be retrieved, e.g. for objects
+            defined in an interactive session.
+    """
+    return inspect.getsource(value)
+
+
+def get_hashed_source(value: Any) -> str:
+    """Returns a hash of the source code of an object.
+
+    Args:
+        value: A class, function or method.
+
+    Raises:
+        TypeError: If the source code is not available, e.g. for built-in
+            objects.
+        OSError: If the source code can't be retrieved, e.g. for objects
+            defined in an interactive session.
+    """
+    source_code = get_source(value)
+    return hashlib.sha256(source_code.encode("utf-8")).hexdigest()
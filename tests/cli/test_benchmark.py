@@ -0,0 +1,66 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import json
+import os
+
+from click.testing import CliRunner
+
+from zenml.cli.benchmark import benchmark_materializers
+
+
+def test_benchmark_materializers_prints_json(tmp_path):
+    """Tests that the materializer benchmark reports all metrics as JSON and
+    cleans up its artifacts."""
+    runner = CliRunner()
+    result = runner.invoke(
+        benchmark_materializers,
+        [
+            "--sizes",
+            "0.01",
+            "-n",
+            "2",
+            "--case",
+            "ndarray",
+            "--path",
+            str(tmp_path),
+            "--output-format",
+            "json",
+        ],
+    )
+
+    assert result.exit_code == 0
+    entries = json.loads(result.output)
+    materializers = [entry["materializer"] for entry in entries]
+    assert materializers[0] == "NumpyMaterializer"
+    assert "ChunkedNumpyMaterializer" in materializers
+    for entry in entries:
+        assert entry["case"] == "ndarray"
+        assert entry["write_mb_s"] > 0
+        assert entry["read_p99_ms"] >= entry["read_p50_ms"]
+        assert entry["disk_mb"] > 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_benchmark_materializers_rejects_invalid_options(tmp_path):
+    """Tests that invalid sizes and repetitions are usage errors."""
+    runner = CliRunner()
+    for args in (
+        ["--sizes", "1,abc"],
+        ["--sizes", "-1"],
+        ["--repetitions", "0"],
+    ):
+        result = runner.invoke(
+            benchmark_materializers, [*args, "--path", str(tmp_path)]
+        )
+        assert result.exit_code == 2
@@ -0,0 +1,60 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import pandas as pd
+import pyarrow as pa
+
+from zenml.artifacts.data_artifact import DataArtifact
+from zenml.materializers.arrow_materializer import ArrowMaterializer
+from zenml.materializers.default_materializer_registry import (
+    default_materializer_registry,
+)
+from zenml.materializers.pandas_materializer import PandasMaterializer
+
+
+def test_arrow_materializer_registration():
+    """Tests that arrow tables use the arrow materializer while dataframes
+    still use the pandas materializer by default."""
+    registry = default_materializer_registry
+    assert registry.get_single_materializer_type(pa.Table) is ArrowMaterializer
+    assert (
+        registry.get_single_materializer_type(pd.DataFrame)
+        is PandasMaterializer
+    )
+
+
+def test_arrow_materializer_roundtrip(tmp_path):
+    """Tests that tables are read back memory-mapped and that only the
+    requested columns are read."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    table = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    ArrowMaterializer(artifact).handle_return(table)
+
+    loaded = ArrowMaterializer(artifact).handle_input(pa.Table)
+    assert loaded.equals(table)
+    projected = ArrowMaterializer(artifact).handle_input(
+        pa.Table, columns=["b"]
+    )
+    assert projected.column_names == ["b"]
+
+
+def test_arrow_materializer_handles_dataframes(tmp_path):
+    """Tests that the arrow materializer can be used for dataframes."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    df = pd.DataFrame({"a": [1.0, 2.0]}, index=["first", "second"])
+    ArrowMaterializer(artifact).handle_return(df)
+
+    loaded = ArrowMaterializer(artifact).handle_input(pd.DataFrame)
+    pd.testing.assert_frame_equal(loaded, df)
@@ -11,3 +11,43 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import pytest
+
+from zenml.artifacts.data_artifact import DataArtifact
+from zenml.materializers.base_materializer import BaseMaterializer
+
+
+class ChunkedType:
+    """Type for which the test materializers are registered."""
+
+
+class ChunkedListMaterializer(BaseMaterializer):
+    """Materializer that combines chunks into a list."""
+
+    ASSOCIATED_TYPES = [ChunkedType]
+
+    def handle_return(self, data):
+        self.returned = data
+
+    def combine_chunks(self, chunks):
+        return chunks
+
+
+def test_chunks_get_combined_by_default():
+    """Tests that materializers without a chunked write implementation
+    combine all chunks and write them with `handle_return()`."""
+    materializer = ChunkedListMaterializer(DataArtifact())
+    materializer.handle_return_chunks(iter([1, 2, 3]))
+
+    assert materializer.returned == [1, 2, 3]
+
+
+def test_chunks_are_not_supported_without_combine_implementation():
+    """Tests that the base materializer doesn't know how to combine
+    chunks."""
+
+    class SomeMaterializer(BaseMaterializer):
+        ASSOCIATED_TYPES = [ChunkedType]
+
+    with pytest.raises(NotImplementedError):
+        SomeMaterializer(DataArtifact()).handle_return_chunks(iter([{1}]))
@@ -0,0 +1,127 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import glob
+import os
+import pickle
+
+import apache_beam as beam
+import pyarrow as pa
+import pytest
+from apache_beam.testing.util import assert_that, equal_to
+
+from zenml.artifacts.data_artifact import DataArtifact
+from zenml.materializers.beam_materializer import (
+    BeamMaterializer,
+    BuiltInTypesCoder,
+)
+from zenml.steps.step_decorator import step
+from zenml.steps.utils import generate_component
+from zenml.utils import source_utils
+
+
+class UserMaterializer(BeamMaterializer):
+    SCHEMA = pa.schema([("name", pa.string()), ("age", pa.int64())])
+    NUM_SHARDS = 2
+
+
+@pytest.mark.parametrize(
+    "materializer_class, elements",
+    [
+        (UserMaterializer, [{"name": "a", "age": 1}, {"name": "b", "age": 2}]),
+        (BeamMaterializer, [("a", b"\x00"), ("b", (1, 2.5))]),
+    ],
+)
+def test_beam_materializer_roundtrip(tmp_path, materializer_class, elements):
+    """Tests that PCollections are written as files and read by another
+    pipeline on the direct runner."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    pcollection = beam.Pipeline() | beam.Create(elements)
+
+    materializer_class(artifact).handle_return(pcollection)
+    assert glob.glob(os.path.join(artifact.uri, "data*"))
+
+    pipeline = beam.Pipeline()
+    loaded = materializer_class(artifact).handle_input(
+        beam.PCollection, pipeline=pipeline
+    )
+    assert_that(loaded, equal_to(elements))
+    pipeline.run().wait_until_finish()
+
+
+def test_beam_materializer_only_runs_pipelines(tmp_path):
+    """Tests that returned pipelines are run but can't be read."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    pipeline = beam.Pipeline()
+    _ = pipeline | beam.Create([1])
+    BeamMaterializer(artifact).handle_return(pipeline)
+
+    with pytest.raises(ValueError):
+        BeamMaterializer(artifact).handle_input(beam.PCollection)
+
+
+def test_built_in_types_coder_refuses_other_objects():
+    """Tests that the default coder neither writes nor reads objects which
+    would need to be imported."""
+    coder = BuiltInTypesCoder()
+    assert coder.decode(coder.encode(("a", {1: b"\x00"}))) == (
+        "a",
+        {1: b"\x00"},
+    )
+
+    with pytest.raises(TypeError):
+        coder.encode(DataArtifact)
+    with pytest.raises(pickle.UnpicklingError):
+        coder.decode(pickle.dumps(DataArtifact))
+
+
+@step
+def merge_step(
+    first: beam.PCollection, second: beam.PCollection
+) -> beam.PCollection:
+    """Merges two PCollections, which requires them to share a pipeline."""
+    return (first, second) | beam.Flatten()
+
+
+def test_step_reads_all_inputs_with_one_pipeline(tmp_path):
+    """Tests that all inputs of a step execution are read by the same
+    pipeline."""
+    input_dict = {}
+    for name, elements in [("first", [1, 2]), ("second", [3])]:
+        artifact = DataArtifact()
+        artifact.uri = str(tmp_path / name)
+        artifact.materializer = source_utils.resolve_class(BeamMaterializer)
+        os.makedirs(artifact.uri)
+        BeamMaterializer(artifact).handle_return(
+            beam.Pipeline() | beam.Create(elements)
+        )
+        input_dict[name] = [artifact]
+    output = DataArtifact()
+    output.uri = str(tmp_path / "output")
+    os.makedirs(output.uri)
+
+    step_instance = merge_step()
+    step_instance.resolve_signature_materializers(
+        step_instance.OUTPUT_SIGNATURE, is_input=False
+    )
+    executor = generate_component(step_instance).EXECUTOR_SPEC.executor_class()
+    executor.Do(input_dict, {"output": [output]}, {})
+
+    pipeline = beam.Pipeline()
+    merged = BeamMaterializer(output).handle_input(
+        beam.PCollection, pipeline=pipeline
+    )
+    assert_that(merged, equal_to([1, 2, 3]))
+    pipeline.run().wait_until_finish()
@@ -0,0 +1,47 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import pandas as pd
+import pytest
+
+from zenml.materializers.benchmark import (
+    _percentile,
+    benchmark_materializer,
+    get_benchmark_cases,
+)
+from zenml.materializers.pandas_materializer import PandasMaterializer
+
+
+def test_percentile_interpolates():
+    """Tests that percentiles interpolate between values."""
+    assert _percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert _percentile([1.0, 2.0], 50) == 1.5
+    assert _percentile([1.0, 2.0], 100) == 2.0
+
+
+@pytest.mark.parametrize("case_name", ["dataframe-narrow", "dataframe-wide"])
+def test_benchmark_materializer_measures_dataframes(tmp_path, case_name):
+    """Tests that a benchmark writes and reads the payload the requested
+    number of times."""
+    case = next(c for c in get_benchmark_cases() if c.name == case_name)
+    assert case.data_type is pd.DataFrame
+
+    result = benchmark_materializer(
+        PandasMaterializer, case, 0.1, str(tmp_path), repetitions=3
+    )
+
+    assert result.materializer == "PandasMaterializer"
+    assert 0.05 < result.size_mb < 0.2
+    assert result.read_mb_s > 0
+    assert result.write_p99_ms >= result.write_p50_ms
+    assert list(tmp_path.iterdir()) == []
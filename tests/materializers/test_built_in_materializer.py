@@ -0,0 +1,116 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import enum
+import os
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+
+from zenml.artifacts.data_artifact import DataArtifact
+from zenml.materializers.built_in_materializer import (
+    BINARY_FILENAME,
+    DEFAULT_FILENAME,
+    BuiltInMaterializer,
+)
+from zenml.steps import step
+
+
+class BinaryMaterializer(BuiltInMaterializer):
+    FORMAT = "binary"
+
+
+class Color(enum.IntEnum):
+    RED = 1
+
+
+def test_built_in_materializer_round_trips_exact_types(tmp_path):
+    """Tests that tuples, bytes and sets keep their types in the binary
+    format."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    data = {"pair": (1, 2.5), "raw": b"\x00\xff", "ids": [{3, 4}, None]}
+
+    BinaryMaterializer(artifact).handle_return(data)
+    loaded = BuiltInMaterializer(artifact).handle_input(dict)
+
+    assert loaded == data
+    assert isinstance(loaded["pair"], tuple)
+    assert os.path.exists(os.path.join(artifact.uri, BINARY_FILENAME))
+
+
+def test_built_in_materializer_converts_subclasses(tmp_path):
+    """Tests that numpy scalars and subclasses of built-in types are stored
+    as the built-in type they represent in the binary format."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    data = [np.float64(0.5), np.int64(2), Color.RED, OrderedDict(a=1)]
+
+    BinaryMaterializer(artifact).handle_return(data)
+    loaded = BuiltInMaterializer(artifact).handle_input(list)
+
+    assert loaded == [0.5, 2, 1, {"a": 1}]
+    assert [type(value) for value in loaded] == [float, int, int, dict]
+
+
+def test_built_in_materializer_rejects_other_types(tmp_path):
+    """Tests that objects which aren't built-in types can neither be written
+    nor read."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    with pytest.raises(TypeError):
+        BinaryMaterializer(artifact).handle_return({"f": os.path.join})
+    with pytest.raises(TypeError):
+        BinaryMaterializer(artifact).handle_return({"nested": [(1, int)]})
+
+    with open(os.path.join(artifact.uri, BINARY_FILENAME), "wb") as f:
+        pickle.dump([OrderedDict()], f)
+    with pytest.raises(pickle.UnpicklingError):
+        BuiltInMaterializer(artifact).handle_input(list)
+
+
+def test_built_in_materializer_json_format(tmp_path):
+    """Tests that JSON files are written by default."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    BuiltInMaterializer(artifact).handle_return((1, "a"))
+
+    assert os.path.exists(os.path.join(artifact.uri, DEFAULT_FILENAME))
+    assert BuiltInMaterializer(artifact).handle_input(tuple) == (1, "a")
+
+
+@step
+def score_step() -> float:
+    """Returns a numpy scalar like `model.score()` of sklearn."""
+    return np.float64(0.5)
+
+
+@pytest.mark.parametrize(
+    "materializer_class", [BuiltInMaterializer, BinaryMaterializer]
+)
+def test_step_returning_numpy_scalar_as_float(tmp_path, materializer_class):
+    """Tests that a step annotated with `-> float` can return a numpy
+    scalar."""
+    step_instance = score_step().with_return_materializers(
+        materializer_class
+    )
+    step_instance()
+    executor = step_instance.component.executor_spec.executor_class()
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+
+    executor.resolve_output_artifact("output", artifact, executor._FUNCTION())
+
+    assert executor.resolve_input_artifact(artifact, float) == 0.5
@@ -0,0 +1,84 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+
+import numpy as np
+import pytest
+
+from zenml.artifacts.data_artifact import DataArtifact
+from zenml.materializers import ChunkedNumpyMaterializer, NumpyMaterializer
+from zenml.materializers.default_materializer_registry import (
+    default_materializer_registry,
+)
+
+
+class SmallChunksMaterializer(ChunkedNumpyMaterializer):
+    """Materializer that writes chunks of four 8-byte rows."""
+
+    CHUNK_SIZE_BYTES = 32
+
+
+@pytest.fixture
+def chunked_artifact(tmp_path):
+    """Returns an artifact containing a chunked array with ten rows."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    SmallChunksMaterializer(artifact).handle_return(np.arange(10.0))
+    return artifact
+
+
+def test_numpy_materializer_stays_default():
+    """Tests that the chunked materializer doesn't replace the default
+    numpy materializer."""
+    assert (
+        default_materializer_registry.get_single_materializer_type(np.ndarray)
+        is NumpyMaterializer
+    )
+
+
+def test_chunked_array_roundtrip(chunked_artifact):
+    """Tests that arrays are split into chunks and read back completely."""
+    chunk_files = [
+        name
+        for name in os.listdir(chunked_artifact.uri)
+        if name.startswith("chunk_")
+    ]
+    loaded = SmallChunksMaterializer(chunked_artifact).handle_input(np.ndarray)
+
+    assert len(chunk_files) == 3
+    np.testing.assert_array_equal(loaded, np.arange(10.0))
+
+
+@pytest.mark.parametrize(
+    "rows", [slice(2, 7), slice(None, None, -3), slice(8, 1, -2), 5, -1]
+)
+def test_chunked_array_row_selection(chunked_artifact, rows):
+    """Tests that selecting rows returns the same result as indexing the
+    full array."""
+    loaded = SmallChunksMaterializer(chunked_artifact).handle_input(
+        np.ndarray, rows=rows
+    )
+
+    np.testing.assert_array_equal(loaded, np.arange(10.0)[rows])
+
+
+def test_chunked_array_only_reads_needed_chunks(chunked_artifact):
+    """Tests that chunks without selected rows are not read."""
+    os.remove(os.path.join(chunked_artifact.uri, "chunk_000002"))
+
+    loaded = SmallChunksMaterializer(chunked_artifact).handle_input(
+        np.ndarray, rows=slice(0, 8)
+    )
+
+    np.testing.assert_array_equal(loaded, np.arange(8.0))
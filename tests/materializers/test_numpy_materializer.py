@@ -0,0 +1,98 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from zenml.artifacts.data_artifact import DataArtifact
+from zenml.materializers.numpy_materializer import (
+    DATA_FILENAME,
+    DATA_VAR,
+    PARQUET_DATA_FILENAME,
+    SHAPE_FILENAME,
+    NumpyMaterializer,
+)
+from zenml.utils import yaml_utils
+
+
+def _create_artifact(tmp_path):
+    """Returns an artifact stored in a temporary directory."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    return artifact
+
+
+def test_numpy_materializer_returns_read_only_memory_map(tmp_path):
+    """Tests that arrays are memory-mapped instead of copied when reading
+    them from a local artifact store."""
+    artifact = _create_artifact(tmp_path)
+    arr = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+    NumpyMaterializer(artifact).handle_return(arr)
+    loaded = NumpyMaterializer(artifact).handle_input(np.ndarray)
+
+    assert isinstance(loaded, np.memmap)
+    assert not loaded.flags.writeable
+    np.testing.assert_array_equal(loaded, arr)
+
+
+def test_numpy_materializer_keeps_structured_dtypes(tmp_path):
+    """Tests that the dtype of structured arrays survives a roundtrip."""
+    artifact = _create_artifact(tmp_path)
+    arr = np.array([(1, 2.0), (3, 4.0)], dtype=[("a", "i4"), ("b", "f8")])
+
+    NumpyMaterializer(artifact).handle_return(arr)
+    loaded = NumpyMaterializer(artifact).handle_input(np.ndarray)
+
+    assert loaded.dtype == arr.dtype
+    np.testing.assert_array_equal(loaded, arr)
+
+
+def test_numpy_materializer_reads_parquet_artifacts(tmp_path):
+    """Tests that artifacts written in the previous parquet format can
+    still be read."""
+    artifact = _create_artifact(tmp_path)
+    arr = np.arange(6).reshape(2, 3)
+    yaml_utils.write_json(
+        os.path.join(artifact.uri, SHAPE_FILENAME),
+        {str(i): x for i, x in enumerate(arr.shape)},
+    )
+    pq.write_table(
+        pa.table({DATA_VAR: arr.flatten()}),
+        os.path.join(artifact.uri, PARQUET_DATA_FILENAME),
+    )
+
+    loaded = NumpyMaterializer(artifact).handle_input(np.ndarray)
+
+    np.testing.assert_array_equal(loaded, arr)
+
+
+def test_numpy_materializer_never_unpickles_object_arrays(tmp_path):
+    """Tests that arrays of Python objects are stored as parquet and that
+    pickled `.npy` files are not loaded."""
+    artifact = _create_artifact(tmp_path)
+    arr = np.array(["a", "bc", None], dtype=object)
+
+    NumpyMaterializer(artifact).handle_return(arr)
+
+    assert not os.path.exists(os.path.join(artifact.uri, DATA_FILENAME))
+    loaded = NumpyMaterializer(artifact).handle_input(np.ndarray)
+    np.testing.assert_array_equal(loaded, arr)
+
+    np.save(os.path.join(artifact.uri, DATA_FILENAME), arr, allow_pickle=True)
+    with pytest.raises(ValueError):
+        NumpyMaterializer(artifact).handle_input(np.ndarray)
@@ -0,0 +1,117 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from zenml.artifacts.data_artifact import DataArtifact
+from zenml.materializers.pandas_materializer import (
+    DEFAULT_FILENAME,
+    LEGACY_FILENAME,
+    PandasMaterializer,
+)
+
+
+def test_pandas_materializer_appends_chunks(tmp_path):
+    """Tests that dataframe chunks are written to a single parquet file that
+    reads back as the concatenated dataframe."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    chunks = [
+        pd.DataFrame({"a": [i, i + 1], "b": ["x", "y"]}) for i in range(3)
+    ]
+
+    PandasMaterializer(artifact).handle_return_chunks(iter(chunks))
+    df = PandasMaterializer(artifact).handle_input(pd.DataFrame)
+
+    pd.testing.assert_frame_equal(df, pd.concat(chunks, ignore_index=True))
+
+
+def test_pandas_materializer_reads_selected_columns_and_rows(tmp_path):
+    """Tests that columns and filters are pushed into the parquet reader."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [0.1] * 3})
+    PandasMaterializer(artifact).handle_return(df)
+
+    materializer = PandasMaterializer(artifact)
+    projected = materializer.handle_input(pd.DataFrame, columns=["a", "b"])
+    assert list(projected.columns) == ["a", "b"]
+
+    filtered = materializer.handle_input(
+        pd.DataFrame, columns=["b"], filters=[("a", ">=", 2)]
+    )
+    assert filtered["b"].tolist() == ["y", "z"]
+
+
+def test_pandas_materializer_uses_configured_write_options(tmp_path):
+    """Tests that subclasses can configure the parquet writer and that the
+    settings are recorded in the artifact."""
+
+    class UncompressedPandasMaterializer(PandasMaterializer):
+        COMPRESSION = "none"
+        ROW_GROUP_SIZE = 2
+        USE_DICTIONARY = False
+
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    df = pd.DataFrame({"a": range(5)})
+    UncompressedPandasMaterializer(artifact).handle_return(df)
+
+    metadata = pq.ParquetFile(str(tmp_path / DEFAULT_FILENAME)).metadata
+    assert metadata.num_row_groups == 3
+    assert metadata.row_group(0).column(0).compression == "UNCOMPRESSED"
+    assert artifact.get_string_custom_property("parquet_compression") == "none"
+    assert artifact.get_int_custom_property("parquet_row_group_size") == 2
+    assert artifact.get_int_custom_property("parquet_use_dictionary") == 0
+    pd.testing.assert_frame_equal(
+        PandasMaterializer(artifact).handle_input(pd.DataFrame), df
+    )
+
+
+def test_pandas_materializer_reads_environment_when_writing(
+    tmp_path, monkeypatch
+):
+    """Tests that the environment variables are read when an artifact is
+    written and that a compression level of 0 is kept."""
+    monkeypatch.setenv("ZENML_PARQUET_COMPRESSION", "zstd")
+    monkeypatch.setenv("ZENML_PARQUET_COMPRESSION_LEVEL", "0")
+    monkeypatch.setenv("ZENML_PARQUET_ROW_GROUP_SIZE", "2")
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    PandasMaterializer(artifact).handle_return(pd.DataFrame({"a": range(5)}))
+
+    metadata = pq.ParquetFile(str(tmp_path / DEFAULT_FILENAME)).metadata
+    assert metadata.num_row_groups == 3
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+    assert artifact.get_string_custom_property("parquet_compression") == "zstd"
+    assert (
+        artifact.get_int_custom_property("parquet_compression_level") == 0
+    )
+
+
+def test_pandas_materializer_reads_legacy_gzip_files(tmp_path):
+    """Tests that artifacts written by previous versions can still be
+    read."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    df.to_parquet(
+        os.path.join(artifact.uri, LEGACY_FILENAME), compression="gzip"
+    )
+
+    pd.testing.assert_frame_equal(
+        PandasMaterializer(artifact).handle_input(pd.DataFrame), df
+    )
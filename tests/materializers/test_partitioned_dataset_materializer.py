@@ -0,0 +1,98 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import datetime
+import os
+
+import pandas as pd
+import pytest
+
+from zenml.artifacts.data_artifact import DataArtifact
+from zenml.materializers.partitioned_dataset_materializer import (
+    PartitionedDataset,
+    PartitionedDatasetMaterializer,
+)
+
+
+def _get_dataframe() -> pd.DataFrame:
+    """Returns a dataframe with train and eval rows."""
+    return pd.DataFrame(
+        {
+            "split": ["train", "eval", "train", "eval"],
+            "fold": [0, 0, 1, 1],
+            "value": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+
+
+def test_partitioned_dataset_requires_complete_partition_columns():
+    """Tests that partitioning fails without partition columns or with
+    missing values in them."""
+    with pytest.raises(ValueError):
+        PartitionedDataset.from_dataframe(_get_dataframe(), [])
+
+    df = pd.DataFrame({"split": ["train", None], "value": [1, 2]})
+    with pytest.raises(ValueError):
+        PartitionedDataset.from_dataframe(df, ["split"])
+
+
+def test_partitioned_dataset_materializer_roundtrip(tmp_path):
+    """Tests that partitions are written to hive-style directories and read
+    back by partition values."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    df = _get_dataframe()
+    dataset = PartitionedDataset.from_dataframe(df, ["split", "fold"])
+
+    PartitionedDatasetMaterializer(artifact).handle_return(dataset)
+    partition_dir = tmp_path / "split=train" / "fold=1"
+    assert os.path.exists(partition_dir / "part-0.parquet")
+    assert artifact.split_names == '["eval/0", "eval/1", "train/0", "train/1"]'
+
+    loaded = PartitionedDatasetMaterializer(artifact).handle_input(
+        PartitionedDataset
+    )
+    assert loaded.partition_cols == ["split", "fold"]
+    assert {"split": "train", "fold": 1} in loaded.partitions
+    pd.testing.assert_frame_equal(
+        loaded.read(split="train").sort_index(), df[df.split == "train"]
+    )
+    pd.testing.assert_frame_equal(loaded.read().sort_index(), df)
+    with pytest.raises(ValueError):
+        loaded.read(value=1.0)
+
+
+def test_partitioned_dataset_materializer_restores_date_values(tmp_path):
+    """Tests that date and timestamp partition values keep their types."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    day = datetime.date(2021, 11, 1)
+    df = pd.DataFrame(
+        {
+            "day": [day, day, datetime.date(2021, 11, 2)],
+            "time": pd.to_datetime(["2021-11-01 12:00"] * 3),
+            "value": [1, 2, 3],
+        }
+    )
+    dataset = PartitionedDataset.from_dataframe(df, ["day", "time"])
+
+    PartitionedDatasetMaterializer(artifact).handle_return(dataset)
+    loaded = PartitionedDatasetMaterializer(artifact).handle_input(
+        PartitionedDataset
+    )
+
+    assert loaded.get_keys() == dataset.get_keys()
+    key = loaded.get_keys(day=day)[0]
+    assert type(key[0]) is datetime.date
+    assert isinstance(key[1], pd.Timestamp)
+    assert loaded.read_partition(key)["value"].tolist() == [1, 2]
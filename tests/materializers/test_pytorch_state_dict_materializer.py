@@ -0,0 +1,97 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+
+import pytest
+import torch
+from torch import nn
+
+from zenml.artifacts.model_artifact import ModelArtifact
+from zenml.materializers.default_materializer_registry import (
+    default_materializer_registry,
+)
+from zenml.materializers.pytorch_materializer import PyTorchMaterializer
+from zenml.materializers.pytorch_state_dict_materializer import (
+    ALIGNMENT,
+    DEFAULT_FILENAME,
+    PyTorchStateDictMaterializer,
+)
+from zenml.types.pytorch_types import TorchDict
+
+
+class TiedModel(nn.Module):
+    """Model with tied weights and a buffer."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.encoder = nn.Linear(4, 4)
+        self.decoder = nn.Linear(4, 4)
+        self.decoder.weight = self.encoder.weight
+        self.register_buffer("steps", torch.tensor(3))
+
+
+def test_pytorch_materializer_stays_default():
+    """Tests that the state dict materializer isn't the default for
+    modules."""
+    assert (
+        default_materializer_registry.get_single_materializer_type(nn.Module)
+        is PyTorchMaterializer
+    )
+
+
+def test_pytorch_state_dict_materializer_roundtrip(tmp_path):
+    """Tests that modules are recreated with memory-mapped tensors and that
+    tied weights stay tied."""
+    artifact = ModelArtifact()
+    artifact.uri = str(tmp_path)
+    model = TiedModel()
+
+    PyTorchStateDictMaterializer(artifact).handle_return(model)
+    loaded = PyTorchStateDictMaterializer(artifact).handle_input(TiedModel)
+
+    assert isinstance(loaded, TiedModel)
+    assert loaded.decoder.weight is loaded.encoder.weight
+    for name, tensor in model.state_dict().items():
+        assert torch.equal(loaded.state_dict()[name], tensor)
+    assert loaded.encoder.weight.data_ptr() % ALIGNMENT == 0
+    inputs = torch.ones(1, 4)
+    assert torch.allclose(loaded.decoder(inputs), model.decoder(inputs))
+
+
+def test_pytorch_state_dict_materializer_stores_dicts(tmp_path):
+    """Tests that dicts of tensors with all dtypes are stored and that other
+    values are rejected."""
+    artifact = ModelArtifact()
+    artifact.uri = str(tmp_path)
+    state_dict = TorchDict(
+        half=torch.rand(3, dtype=torch.float16),
+        brain=torch.rand(2, 2).to(torch.bfloat16),
+        mask=torch.tensor([True, False]),
+        scalar=torch.tensor(1.5),
+        empty=torch.zeros(0, 3),
+    )
+
+    PyTorchStateDictMaterializer(artifact).handle_return(state_dict)
+    loaded = PyTorchStateDictMaterializer(artifact).handle_input(TorchDict)
+
+    assert isinstance(loaded, TorchDict)
+    for name, tensor in state_dict.items():
+        assert loaded[name].dtype == tensor.dtype
+        assert torch.equal(loaded[name], tensor)
+
+    os.remove(os.path.join(artifact.uri, DEFAULT_FILENAME))
+    with pytest.raises(ValueError):
+        PyTorchStateDictMaterializer(artifact).handle_return(
+            TorchDict(epoch=1)
+        )
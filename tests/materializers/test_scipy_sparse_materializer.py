@@ -0,0 +1,68 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import numpy as np
+import pytest
+from scipy import sparse
+
+from zenml.artifacts.data_artifact import DataArtifact
+from zenml.materializers.default_materializer_registry import (
+    default_materializer_registry,
+)
+from zenml.materializers.scipy_sparse_materializer import (
+    ScipySparseMaterializer,
+)
+
+
+@pytest.mark.parametrize("matrix_class", [sparse.csr_matrix, sparse.csc_matrix])
+def test_scipy_sparse_materializer_roundtrip(tmp_path, matrix_class):
+    """Tests that sparse matrices keep their format and are read with
+    memory-mapped arrays."""
+    assert (
+        default_materializer_registry.get_single_materializer_type(
+            matrix_class
+        )
+        is ScipySparseMaterializer
+    )
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    matrix = matrix_class(sparse.random(100, 50, density=0.01, format="coo"))
+
+    ScipySparseMaterializer(artifact).handle_return(matrix)
+    loaded = ScipySparseMaterializer(artifact).handle_input(matrix_class)
+
+    assert isinstance(loaded, matrix_class)
+    # Views of the read-only memory-mapped files
+    assert not loaded.data.flags.writeable
+    assert not loaded.indices.flags.writeable
+    assert loaded.shape == matrix.shape
+    assert (loaded != matrix).nnz == 0
+
+
+def test_scipy_sparse_materializer_stores_index_arrays_as_int32(tmp_path):
+    """Tests that int64 index arrays are stored with the dtype scipy uses,
+    so loading doesn't copy them."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    matrix = sparse.random(100, 50, density=0.01, format="csr")
+    matrix.indices = matrix.indices.astype(np.int64)
+    matrix.indptr = matrix.indptr.astype(np.int64)
+
+    ScipySparseMaterializer(artifact).handle_return(matrix)
+    loaded = ScipySparseMaterializer(artifact).handle_input(sparse.csr_matrix)
+
+    assert loaded.indices.dtype == np.int32
+    assert loaded.indptr.dtype == np.int32
+    assert not loaded.indices.flags.writeable
+    assert not loaded.indptr.flags.writeable
+    assert (loaded != matrix).nnz == 0
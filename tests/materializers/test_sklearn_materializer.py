@@ -0,0 +1,59 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+import pickle
+
+import numpy as np
+from sklearn.neighbors import KNeighborsClassifier
+
+from zenml.artifacts.model_artifact import ModelArtifact
+from zenml.materializers.sklearn_materializer import (
+    PICKLE_FILENAME,
+    SklearnMaterializer,
+)
+
+
+def _get_model() -> KNeighborsClassifier:
+    """Returns a fitted kNN model."""
+    features = np.arange(2000, dtype=float).reshape(1000, 2)
+    labels = np.arange(1000) % 2
+    return KNeighborsClassifier(n_neighbors=1).fit(features, labels)
+
+
+def test_sklearn_materializer_memory_maps_fitted_arrays(tmp_path):
+    """Tests that the fitted arrays of a model are memory-mapped
+    read-only."""
+    artifact = ModelArtifact()
+    artifact.uri = str(tmp_path)
+    model = _get_model()
+
+    SklearnMaterializer(artifact).handle_return(model)
+    loaded = SklearnMaterializer(artifact).handle_input(KNeighborsClassifier)
+
+    assert isinstance(loaded._fit_X, np.memmap)
+    assert not loaded._fit_X.flags.writeable
+    np.testing.assert_array_equal(
+        loaded.predict([[2.0, 3.0]]), model.predict([[2.0, 3.0]])
+    )
+
+
+def test_sklearn_materializer_reads_legacy_pickle_files(tmp_path):
+    """Tests that models pickled by previous versions can still be read."""
+    artifact = ModelArtifact()
+    artifact.uri = str(tmp_path)
+    with open(os.path.join(artifact.uri, PICKLE_FILENAME), "wb") as f:
+        pickle.dump(_get_model(), f)
+
+    loaded = SklearnMaterializer(artifact).handle_input(KNeighborsClassifier)
+    assert loaded.n_neighbors == 1
@@ -0,0 +1,75 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import glob
+import os
+
+import pytest
+import tensorflow as tf
+
+from zenml.artifacts.data_artifact import DataArtifact
+from zenml.materializers.tf_dataset_materializer import (
+    DEFAULT_FILENAME,
+    TensorflowDatasetMaterializer,
+)
+
+
+class HashGzipMaterializer(TensorflowDatasetMaterializer):
+    NUM_SHARDS = 4
+    SHARD_BY = "hash"
+    COMPRESSION = "GZIP"
+
+
+class LabelMaterializer(TensorflowDatasetMaterializer):
+    SHARD_FUNC = staticmethod(lambda feature, label: label)
+
+
+@pytest.mark.parametrize(
+    "materializer_class",
+    [TensorflowDatasetMaterializer, HashGzipMaterializer, LabelMaterializer],
+)
+def test_tf_dataset_materializer_writes_shards(tmp_path, materializer_class):
+    """Tests that datasets are written to multiple shards and read back with
+    all their elements."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    dataset = tf.data.Dataset.from_tensor_slices(
+        (tf.range(100), tf.range(100) % 2)
+    ).map(lambda feature, label: (feature, tf.cast(label, tf.int64)))
+
+    materializer_class(artifact).handle_return(dataset)
+    loaded = materializer_class(artifact).handle_input(tf.data.Dataset)
+
+    shards = glob.glob(
+        os.path.join(artifact.uri, DEFAULT_FILENAME, "*", "*.shard")
+    )
+    assert len(shards) > 1
+    assert loaded.element_spec == dataset.element_spec
+    assert sorted(
+        (int(feature), int(label)) for feature, label in loaded
+    ) == [(i, i % 2) for i in range(100)]
+
+
+def test_tf_dataset_materializer_keeps_order_of_index_shards(tmp_path):
+    """Tests that datasets sharded by index are read in their original
+    order."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    dataset = tf.data.Dataset.range(103)
+
+    TensorflowDatasetMaterializer(artifact).handle_return(dataset)
+    loaded = TensorflowDatasetMaterializer(artifact).handle_input(
+        tf.data.Dataset
+    )
+
+    assert [int(element) for element in loaded] == list(range(103))
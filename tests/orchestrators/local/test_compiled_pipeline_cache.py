@@ -0,0 +1,149 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import pytest
+import tfx.orchestration.pipeline as tfx_pipeline
+from tfx.orchestration import metadata
+from tfx.proto.orchestration import pipeline_pb2
+
+from zenml.orchestrators.local import local_dag_runner
+from zenml.orchestrators.local.compiled_pipeline_cache import (
+    CompiledPipelineCache,
+    get_pipeline_fingerprint,
+)
+from zenml.orchestrators.local.local_dag_runner import LocalDagRunner
+from zenml.steps.base_step_config import BaseStepConfig
+from zenml.steps.step_decorator import step
+
+
+class FingerprintConfig(BaseStepConfig):
+    value: int = 1
+
+
+@step
+def fingerprint_producer(config: FingerprintConfig) -> int:
+    return config.value
+
+
+@step(name="fingerprint_producer")
+def changed_fingerprint_producer(config: FingerprintConfig) -> int:
+    return config.value + 1
+
+
+@step
+def fingerprint_consumer(data: int) -> int:
+    return data
+
+
+def _create_pipeline(tmp_path, producer, with_consumer=True):
+    """Creates a logical pipeline of a producer and an optional consumer.
+
+    Args:
+        tmp_path: Directory for the pipeline root and metadata.
+        producer: The producer step instance.
+        with_consumer: Whether to add a step consuming the producer output.
+    """
+    steps = [producer]
+    output = producer()
+    if with_consumer:
+        consumer = fingerprint_consumer()
+        consumer(data=output)
+        steps.append(consumer)
+    return tfx_pipeline.Pipeline(
+        pipeline_name="fingerprint_pipeline",
+        components=[step_.component for step_ in steps],
+        pipeline_root=str(tmp_path / "artifacts"),
+        metadata_connection_config=metadata.sqlite_metadata_connection_config(
+            str(tmp_path / "metadata.db")
+        ),
+    )
+
+
+def test_compiled_pipeline_cache_roundtrip(tmp_path):
+    """Tests that cached pipelines can be loaded with the same key."""
+    cache = CompiledPipelineCache(cache_dir=str(tmp_path))
+    pipeline = pipeline_pb2.Pipeline()
+    pipeline.pipeline_info.id = "some_pipeline"
+
+    assert cache.load("key") is None
+
+    cache.save("key", pipeline)
+
+    assert cache.load("key") == pipeline
+    assert cache.load("other_key") is None
+
+
+def test_compiled_pipeline_cache_ignores_corrupted_files(tmp_path):
+    """Tests that corrupted cache files are treated as cache misses."""
+    cache = CompiledPipelineCache(cache_dir=str(tmp_path))
+    (tmp_path / "key.pb").write_bytes(b"not a pipeline")
+
+    assert cache.load("key") is None
+
+
+def test_pipeline_fingerprint_of_unchanged_pipeline(tmp_path):
+    """Tests that recreating a pipeline results in the same fingerprint."""
+    first = _create_pipeline(tmp_path, fingerprint_producer())
+    second = _create_pipeline(tmp_path, fingerprint_producer())
+
+    assert get_pipeline_fingerprint(first)
+    assert get_pipeline_fingerprint(first) == get_pipeline_fingerprint(second)
+
+
+@pytest.mark.parametrize(
+    "changed_producer, with_consumer",
+    [
+        (fingerprint_producer(FingerprintConfig(value=2)), True),
+        (changed_fingerprint_producer(), True),
+        (fingerprint_producer(), False),
+    ],
+    ids=["parameters", "source", "dag"],
+)
+def test_pipeline_fingerprint_changes_with_pipeline(
+    tmp_path, changed_producer, with_consumer
+):
+    """Tests that changing step parameters, step source code or the DAG
+    changes the fingerprint."""
+    pipeline = _create_pipeline(tmp_path, fingerprint_producer())
+    changed_pipeline = _create_pipeline(
+        tmp_path, changed_producer, with_consumer=with_consumer
+    )
+
+    assert get_pipeline_fingerprint(pipeline) != get_pipeline_fingerprint(
+        changed_pipeline
+    )
+
+
+def test_unchanged_pipeline_is_not_compiled_again(tmp_path, monkeypatch):
+    """Tests that the runner loads an unchanged pipeline from the cache
+    instead of compiling it."""
+    cache = CompiledPipelineCache(cache_dir=str(tmp_path / "cache"))
+    monkeypatch.setattr(
+        local_dag_runner, "CompiledPipelineCache", lambda: cache
+    )
+    runner = LocalDagRunner(cache_compiled_pipelines=True)
+    compiled_pipeline = runner._compile(
+        _create_pipeline(tmp_path, fingerprint_producer())
+    )
+
+    def _fail_compilation(*args, **kwargs):
+        raise AssertionError("Unchanged pipeline was compiled again.")
+
+    monkeypatch.setattr(
+        local_dag_runner.compiler.Compiler, "compile", _fail_compilation
+    )
+
+    assert (
+        runner._compile(_create_pipeline(tmp_path, fingerprint_producer()))
+        == compiled_pipeline
+    )
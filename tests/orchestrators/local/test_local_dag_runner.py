@@ -0,0 +1,122 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+import threading
+import time
+from typing import List
+
+import pytest
+import tfx.orchestration.pipeline as tfx_pipeline
+
+from zenml.metadata.sqlite_metadata_wrapper import SQLiteMetadataStore
+from zenml.orchestrators.local.local_dag_runner import (
+    LocalDagRunner,
+    run_nodes_concurrently,
+)
+from zenml.steps.step_decorator import step
+
+
+@step
+def isolated_producer() -> int:
+    return os.getpid()
+
+
+@step
+def isolated_consumer(producer_pid: int) -> List[int]:
+    return [producer_pid, os.getpid()]
+
+
+def test_local_dag_runner_rejects_invalid_parallelism():
+    """Tests that the runner needs to run at least one step at a time."""
+    with pytest.raises(ValueError):
+        LocalDagRunner(max_parallelism=0)
+
+
+def test_concurrent_nodes_respect_upstream_nodes():
+    """Tests that nodes only get launched once their upstream nodes
+    finished and that independent nodes run at the same time."""
+    upstream_node_ids = {
+        "importer": set(),
+        "normalizer_train": {"importer"},
+        "normalizer_test": {"importer"},
+        "trainer": {"normalizer_train", "normalizer_test"},
+    }
+    finished = []
+    running = set()
+    max_running = 0
+    lock = threading.Lock()
+
+    def launch(node_id):
+        nonlocal max_running
+        with lock:
+            assert upstream_node_ids[node_id] <= set(finished)
+            running.add(node_id)
+            max_running = max(max_running, len(running))
+        time.sleep(0.1)
+        with lock:
+            running.remove(node_id)
+            finished.append(node_id)
+
+    run_nodes_concurrently(
+        list(upstream_node_ids), upstream_node_ids, launch, max_parallelism=2
+    )
+
+    assert finished[0] == "importer"
+    assert finished[-1] == "trainer"
+    assert max_running == 2
+
+
+def test_concurrent_nodes_stop_after_failure():
+    """Tests that no downstream nodes are launched after a node failed."""
+    upstream_node_ids = {"first": set(), "second": {"first"}}
+    launched = []
+
+    def launch(node_id):
+        launched.append(node_id)
+        raise RuntimeError(node_id)
+
+    with pytest.raises(RuntimeError):
+        run_nodes_concurrently(
+            list(upstream_node_ids), upstream_node_ids, launch, 4
+        )
+
+    assert launched == ["first"]
+
+
+def test_isolated_steps_run_in_spawned_processes(tmp_path):
+    """Tests that isolated steps run in separate spawned worker processes,
+    which regenerate the step executors, and pass their outputs on."""
+    producer, consumer = isolated_producer(), isolated_consumer()
+    consumer(producer_pid=producer())
+    metadata_store = SQLiteMetadataStore(uri=str(tmp_path / "metadata.db"))
+    pipeline = tfx_pipeline.Pipeline(
+        pipeline_name="isolated_pipeline",
+        components=[producer.component, consumer.component],
+        pipeline_root=str(tmp_path / "artifacts"),
+        metadata_connection_config=metadata_store.get_tfx_metadata_config(),
+        enable_cache=False,
+    )
+
+    LocalDagRunner(isolate_steps=True, process_start_method="spawn").run(
+        pipeline
+    )
+
+    run = metadata_store.get_pipeline("isolated_pipeline").runs[-1]
+    outputs = {
+        step_view.name.rsplit(".", 1)[-1]: step_view.output.read()
+        for step_view in run.steps
+    }
+    producer_pid = outputs["isolated_producer"]
+    assert outputs["isolated_consumer"][0] == producer_pid
+    assert len({os.getpid(), *outputs["isolated_consumer"]}) == 3
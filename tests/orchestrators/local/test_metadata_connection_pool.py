@@ -0,0 +1,98 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from types import SimpleNamespace
+
+import pytest
+from ml_metadata.proto import metadata_store_pb2
+
+from zenml.orchestrators.local import metadata_connection_pool
+from zenml.orchestrators.local.metadata_connection_pool import (
+    MetadataConnectionPool,
+)
+
+
+@pytest.fixture
+def connection_config():
+    """Returns a connection config for an in-memory metadata store."""
+    config = metadata_store_pb2.ConnectionConfig()
+    config.fake_database.SetInParent()
+    return config
+
+
+def test_pool_reuses_released_connections(connection_config):
+    """Tests that a released connection gets reused instead of opening
+    a new one."""
+    with MetadataConnectionPool(connection_config) as pool:
+        store = pool.acquire()
+        pool.release(store)
+
+        assert pool.acquire() is store
+        assert pool.num_opened_connections == 1
+
+
+def test_pool_opens_new_connection_if_all_are_in_use(connection_config):
+    """Tests that connections in use are never handed out twice."""
+    with MetadataConnectionPool(connection_config) as pool:
+        first_store = pool.acquire()
+        second_store = pool.acquire()
+
+        assert first_store is not second_store
+        assert pool.num_opened_connections == 2
+
+
+def test_pooled_metadata_returns_connection_on_exit(connection_config):
+    """Tests that the TFX metadata wrapper borrows from and returns
+    connections to the pool, also for nested `with` blocks."""
+    with MetadataConnectionPool(connection_config) as pool:
+        mlmd_connection = pool.connection()
+        with mlmd_connection as outer:
+            outer_store = outer.store
+            with mlmd_connection as inner:
+                inner_store = inner.store
+                assert inner_store is not outer_store
+            assert mlmd_connection.store is outer_store
+
+        with pool.connection() as m:
+            assert m.store in (outer_store, inner_store)
+        assert pool.num_opened_connections == 2
+
+
+def test_closed_pool_raises_on_acquire(connection_config):
+    """Tests that connections can't be acquired after closing the pool."""
+    pool = MetadataConnectionPool(connection_config)
+    pool.close()
+
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+
+def test_failed_connections_are_not_counted(connection_config, monkeypatch):
+    """Tests that only successfully opened connections are counted."""
+
+    def _fail_connection(connection_config):
+        raise RuntimeError("Unable to connect.")
+
+    with MetadataConnectionPool(connection_config) as pool:
+        monkeypatch.setattr(
+            metadata_connection_pool,
+            "metadata",
+            SimpleNamespace(Metadata=_fail_connection),
+        )
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+        assert pool.num_opened_connections == 0
+
+        monkeypatch.undo()
+        pool.acquire()
+        assert pool.num_opened_connections == 1
@@ -0,0 +1,235 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import json
+from types import SimpleNamespace
+
+from zenml.enums import CacheMissReason
+from zenml.pipelines import run_plan
+from zenml.pipelines.pipeline_decorator import pipeline
+from zenml.pipelines.run_plan import _get_execution_name
+from zenml.steps.base_step_config import BaseStepConfig
+from zenml.steps.step_cache import StepCache
+from zenml.steps.step_decorator import step
+from zenml.steps.utils import get_step_source_hash
+
+
+@step
+def planned_producer() -> int:
+    return 1
+
+
+@step
+def planned_consumer(data: int) -> int:
+    return data
+
+
+def test_plan_of_pipeline_without_previous_runs():
+    """Tests that steps without previous executions would run and that
+    their downstream steps would get new input artifacts."""
+
+    @pipeline
+    def never_executed_pipeline(producer, consumer):
+        consumer(data=producer())
+
+    plans = never_executed_pipeline(
+        producer=planned_producer(), consumer=planned_consumer()
+    ).plan()
+
+    assert [plan.name for plan in plans] == ["producer", "consumer"]
+    assert not any(plan.is_cached for plan in plans)
+    assert plans[0].reason == CacheMissReason.NO_PREVIOUS_EXECUTION
+    assert plans[1].reason == CacheMissReason.NEW_INPUT_ARTIFACTS
+
+
+def test_plan_of_pipeline_with_disabled_cache():
+    """Tests that no step is cached if the pipeline cache is disabled."""
+
+    @pipeline(enable_cache=False)
+    def uncached_pipeline(producer):
+        producer()
+
+    (plan,) = uncached_pipeline(producer=planned_producer()).plan()
+
+    assert not plan.is_cached
+    assert plan.reason == CacheMissReason.CACHE_DISABLED
+
+
+class PlannedConfig(BaseStepConfig):
+    value: int = 1
+
+
+@step
+def planned_configured_step(config: PlannedConfig) -> int:
+    return config.value
+
+
+@step(enable_cache=True)
+def planned_step_cache_step(config: PlannedConfig) -> int:
+    return config.value
+
+
+def _mock_previous_executions(monkeypatch, *executions):
+    """Mocks the previous executions of steps in the metadata store.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+        *executions: Tuples of a step and its previous execution.
+    """
+    previous_executions = {
+        _get_execution_name(step_): [execution]
+        for step_, execution in executions
+    }
+    monkeypatch.setattr(
+        run_plan,
+        "_get_previous_executions",
+        lambda *_: previous_executions,
+    )
+
+
+def _execution(step_, inputs=None, outputs=None, **changes):
+    """Returns a fake previous execution of a step.
+
+    Args:
+        step_: The executed step.
+        inputs: The input artifacts of the execution.
+        outputs: The output artifacts of the execution.
+        **changes: Overrides of the source hash or parameters.
+    """
+    attributes = {
+        "source_hash": get_step_source_hash(step_),
+        "parameters": {
+            key: json.loads(value) for key, value in step_.PARAM_SPEC.items()
+        },
+        "inputs": inputs or {},
+        "outputs": outputs or {},
+    }
+    attributes.update(changes)
+    return SimpleNamespace(**attributes)
+
+
+def test_plan_of_unchanged_pipeline(monkeypatch):
+    """Tests that steps with an execution using the same code, parameters
+    and inputs are cached."""
+    producer, consumer = planned_producer(), planned_consumer()
+    artifact = SimpleNamespace(id=1, uri="")
+    _mock_previous_executions(
+        monkeypatch,
+        (producer, _execution(producer, outputs={"output": artifact})),
+        (consumer, _execution(consumer, inputs={"data": artifact})),
+    )
+
+    @pipeline
+    def unchanged_pipeline(producer, consumer):
+        consumer(data=producer())
+
+    plans = unchanged_pipeline(producer=producer, consumer=consumer).plan()
+
+    assert [plan.is_cached for plan in plans] == [True, True]
+
+
+def test_plan_of_step_with_changed_code(monkeypatch):
+    """Tests that a step whose source code changed since its latest
+    execution would run."""
+    producer = planned_producer()
+    _mock_previous_executions(
+        monkeypatch, (producer, _execution(producer, source_hash="outdated"))
+    )
+
+    @pipeline
+    def changed_code_pipeline(producer):
+        producer()
+
+    (plan,) = changed_code_pipeline(producer=producer).plan()
+
+    assert not plan.is_cached
+    assert plan.reason == CacheMissReason.CHANGED_CODE
+
+
+def test_plan_of_step_with_changed_parameters(monkeypatch):
+    """Tests that a step whose parameters changed since its latest execution
+    would run and that the changed parameters are reported."""
+    configured = planned_configured_step(PlannedConfig(value=2))
+    _mock_previous_executions(
+        monkeypatch,
+        (configured, _execution(configured, parameters={"value": 1})),
+    )
+
+    @pipeline
+    def changed_parameters_pipeline(configured):
+        configured()
+
+    (plan,) = changed_parameters_pipeline(configured=configured).plan()
+
+    assert not plan.is_cached
+    assert plan.reason == CacheMissReason.CHANGED_PARAMETERS
+    assert "value" in plan.details
+
+
+def test_plan_of_step_with_step_cache_entry(monkeypatch, tmp_path):
+    """Tests that steps with an entry in the step cache are cached even if
+    the pipeline cache is disabled."""
+    step_cache = StepCache(str(tmp_path))
+    monkeypatch.setattr(run_plan, "StepCache", lambda: step_cache)
+    _mock_previous_executions(monkeypatch)
+
+    cached_step = planned_step_cache_step(PlannedConfig(value=3))
+    cached_step()
+    executor_class = cached_step.component.executor_spec.executor_class
+    cache_key = executor_class.get_cache_key(
+        {}, dict(cached_step.component.exec_properties)
+    )
+    step_cache.save(
+        cache_key,
+        {
+            "output": {
+                "uri": str(tmp_path),
+                "materializer": "",
+                "datatype": "",
+                "content_digest": "digest",
+            }
+        },
+    )
+
+    @pipeline(enable_cache=False)
+    def step_cache_pipeline(cached_step):
+        cached_step()
+
+    (plan,) = step_cache_pipeline(cached_step=cached_step).plan()
+
+    assert plan.is_cached
+    assert "step cache" in plan.details
+
+
+def test_plan_of_step_cache_miss_with_changed_parameters(
+    monkeypatch, tmp_path
+):
+    """Tests that step cache misses are explained by comparing against the
+    latest execution instead of being reported as disabled cache."""
+    monkeypatch.setattr(
+        run_plan, "StepCache", lambda: StepCache(str(tmp_path))
+    )
+    changed_step = planned_step_cache_step(PlannedConfig(value=4))
+    _mock_previous_executions(
+        monkeypatch,
+        (changed_step, _execution(changed_step, parameters={"value": 1})),
+    )
+
+    @pipeline(enable_cache=False)
+    def step_cache_miss_pipeline(changed_step):
+        changed_step()
+
+    (plan,) = step_cache_miss_pipeline(changed_step=changed_step).plan()
+
+    assert not plan.is_cached
+    assert plan.reason == CacheMissReason.CHANGED_PARAMETERS
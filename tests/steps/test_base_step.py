@@ -11,11 +11,15 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import asyncio
+from typing import AsyncIterator, Generator, Iterable, Iterator
+
 import pytest
 
 from zenml.exceptions import StepInterfaceError
 from zenml.steps.base_step_config import BaseStepConfig
 from zenml.steps.step_decorator import step
+from zenml.steps.step_input import Lazy
 
 
 def test_initialize_step_with_unexpected_config():
@@ -52,3 +56,97 @@ def test_initialize_step_with_config():
 
     # this should succeed
     step_with_config(config=StepConfig())
+
+
+def test_step_with_invalid_materialization_workers():
+    """Tests that a step needs at least one materialization worker."""
+    with pytest.raises(StepInterfaceError):
+
+        @step(materialization_workers=0)
+        def some_step() -> None:
+            pass
+
+
+def test_materialization_workers_get_passed_to_executor():
+    """Tests that the executor of a step uses the configured number of
+    materialization workers."""
+
+    @step(materialization_workers=4)
+    def some_step() -> int:
+        return 1
+
+    step_instance = some_step()
+    step_instance()
+    executor_class = step_instance.component.executor_spec.executor_class
+
+    assert executor_class.materialization_workers == 4
+
+
+def test_lazy_input_uses_materializer_of_wrapped_type():
+    """Tests that a `Lazy` input is registered with the wrapped type in the
+    input signature of the step."""
+
+    @step
+    def some_step(data: Lazy[int]) -> None:
+        pass
+
+    assert some_step.INPUT_SIGNATURE == {"data": int}
+
+
+def test_generator_step_needs_iterator_annotation():
+    """Tests that steps which yield chunks need to annotate their return
+    type with `Iterator[...]`."""
+    with pytest.raises(StepInterfaceError):
+
+        @step
+        def some_step() -> int:
+            yield 1
+
+
+def test_generator_step_output_signature_uses_chunk_type():
+    """Tests that the output of a generator step has the type of its
+    chunks."""
+
+    @step
+    def some_step() -> Iterator[int]:
+        yield 1
+
+    assert some_step.OUTPUT_SIGNATURE == {"output": int}
+
+
+def test_generator_step_accepts_iterable_and_generator_annotations():
+    """Tests that generator steps can also annotate their return type with
+    `Iterable[...]` or `Generator[...]`."""
+
+    @step
+    def iterable_step() -> Iterable[str]:
+        yield "a"
+
+    @step
+    def generator_step() -> Generator[float, None, None]:
+        yield 1.0
+
+    assert iterable_step.OUTPUT_SIGNATURE == {"output": str}
+    assert generator_step.OUTPUT_SIGNATURE == {"output": float}
+
+
+def test_generator_step_needs_chunk_materializer():
+    """Tests that generator steps fail when they are called if the
+    materializer of their output can't write chunks."""
+
+    @step
+    def some_step() -> Iterator[int]:
+        yield 1
+
+    with pytest.raises(StepInterfaceError):
+        some_step()()
+
+
+def test_async_generator_step_fails():
+    """Tests that steps can't be asynchronous generators."""
+    with pytest.raises(StepInterfaceError):
+
+        @step
+        async def some_step() -> AsyncIterator[int]:
+            yield 1
+            await asyncio.sleep(0)
@@ -0,0 +1,136 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+
+from zenml.artifacts.data_artifact import DataArtifact
+from zenml.io import fileio
+from zenml.steps import step_cache
+from zenml.steps.step_cache import (
+    ContentDigestRecorder,
+    StepCache,
+    get_artifact_content_digest,
+    get_step_cache_key,
+    link_artifact_contents,
+)
+
+
+def _write_artifact(path, contents):
+    """Writes an artifact directory with a single data file."""
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, "data.txt"), "w") as f:
+        f.write(contents)
+    return str(path)
+
+
+def test_content_digest_only_depends_on_contents(tmp_path):
+    """Tests that artifacts with the same files have the same digest,
+    independent of their URI."""
+    first = _write_artifact(tmp_path / "first", "some data")
+    second = _write_artifact(tmp_path / "second", "some data")
+    third = _write_artifact(tmp_path / "third", "other data")
+
+    assert get_artifact_content_digest(first) == get_artifact_content_digest(
+        second
+    )
+    assert get_artifact_content_digest(first) != get_artifact_content_digest(
+        third
+    )
+
+
+def test_cache_key_changes_with_parameters():
+    """Tests that changed step parameters result in a different key."""
+    key = get_step_cache_key("source", {"a": "1"}, {"input": "digest"}, {})
+
+    assert key == get_step_cache_key(
+        "source", {"a": "1"}, {"input": "digest"}, {}
+    )
+    assert key != get_step_cache_key(
+        "source", {"a": "2"}, {"input": "digest"}, {}
+    )
+
+
+def test_step_cache_ignores_entries_with_deleted_artifacts(tmp_path):
+    """Tests that cache entries are only used while their output artifacts
+    exist."""
+    step_cache = StepCache(cache_dir=str(tmp_path / "cache"))
+    uri = _write_artifact(tmp_path / "output", "some data")
+    outputs = {"output": {"uri": uri, "content_digest": "digest"}}
+
+    step_cache.save("key", outputs)
+    assert step_cache.load("key") == outputs
+    assert step_cache.load("other_key") is None
+
+    os.remove(os.path.join(uri, "data.txt"))
+    os.rmdir(uri)
+    assert step_cache.load("key") is None
+
+
+def test_step_cache_stores_computed_content_digests(tmp_path):
+    """Tests that the digest of an artifact without digest property is only
+    computed once."""
+    step_cache = StepCache(cache_dir=str(tmp_path / "cache"))
+    artifact = DataArtifact()
+    artifact.uri = _write_artifact(tmp_path / "input", "some data")
+    digest = get_artifact_content_digest(artifact.uri)
+
+    assert step_cache.get_content_digest(artifact) == digest
+    assert artifact.content_digest == digest
+
+    # The stored digest is used instead of reading the changed files.
+    _write_artifact(tmp_path / "input", "other data")
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path / "input")
+    assert step_cache.get_content_digest(artifact) == digest
+
+
+def test_linked_artifact_has_same_contents(tmp_path):
+    """Tests that linking an artifact makes all its files available under
+    the new URI."""
+    _write_artifact(tmp_path / "source" / "nested", "some data")
+    source = str(tmp_path / "source")
+    destination = str(tmp_path / "destination")
+
+    link_artifact_contents(source, destination)
+
+    assert get_artifact_content_digest(
+        destination
+    ) == get_artifact_content_digest(source)
+
+
+def test_recorded_files_are_not_read_again(tmp_path, monkeypatch):
+    """Tests that files written while recording get the same digest without
+    being read again, unless they were written out of order."""
+    uri = str(tmp_path / "artifact")
+    os.makedirs(uri)
+    with ContentDigestRecorder([uri]) as recorder:
+        with fileio.open(os.path.join(uri, "data.bin"), "wb") as f:
+            f.write(b"some ")
+            f.writelines([b"data"])
+        with fileio.open(os.path.join(uri, "seeked.bin"), "wb") as f:
+            f.write(b"xx")
+            f.seek(0)
+            f.write(b"y")
+    expected_digest = get_artifact_content_digest(uri)
+
+    read_paths = []
+    original_get_file_digest = step_cache._get_file_digest
+
+    def _get_file_digest(path):
+        read_paths.append(os.path.basename(path))
+        return original_get_file_digest(path)
+
+    monkeypatch.setattr(step_cache, "_get_file_digest", _get_file_digest)
+
+    assert recorder.get_content_digest(uri) == expected_digest
+    assert read_paths == ["seeked.bin"]
@@ -11,7 +11,274 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import asyncio
+import sys
+from typing import Iterator
+
+import pytest
+
+from zenml.exceptions import StepInterfaceError
+from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.materializers.built_in_materializer import BuiltInMaterializer
+from zenml.steps import step
+from zenml.steps.base_step import BaseStep
+from zenml.steps.base_step_config import BaseStepConfig
+from zenml.steps.step_input import Lazy
+from zenml.steps.step_output import Output
+from zenml.steps.utils import (
+    SINGLE_RETURN_OUT_NAME,
+    generate_component,
+    get_execution_plan,
+    get_executor_sources,
+    regenerate_executor_class,
+    run_coroutine,
+)
+from zenml.utils import source_utils
 
 
 def test_me():
     """A simple test to check a functionality"""
+
+
+@step
+def module_level_step() -> int:
+    """Step used to test regenerating executor classes."""
+    return 1
+
+
+def test_executor_class_can_be_regenerated_from_sources():
+    """Tests that a step executor class can be recreated from its sources,
+    e.g. inside a worker process."""
+    step_instance = module_level_step()
+    step_instance()
+    executor_class = step_instance.component.executor_spec.executor_class
+
+    sources = get_executor_sources(executor_class)
+    module = sys.modules[executor_class.__module__]
+    delattr(module, executor_class.__name__)
+
+    regenerated_class = regenerate_executor_class(sources)
+
+    assert getattr(module, executor_class.__name__) is regenerated_class
+    assert regenerated_class._FUNCTION is executor_class._FUNCTION
+    assert (
+        regenerated_class.spec_materializer_registry.get_materializer_types()
+        == executor_class.spec_materializer_registry.get_materializer_types()
+    )
+
+
+def test_executor_sources_for_local_step_fail():
+    """Tests that steps defined inside functions can't be regenerated."""
+
+    @step
+    def local_step() -> int:
+        return 1
+
+    step_instance = local_step()
+    step_instance()
+    executor_class = step_instance.component.executor_spec.executor_class
+
+    with pytest.raises(StepInterfaceError):
+        get_executor_sources(executor_class)
+
+
+def test_generated_component_classes_are_reused():
+    """Tests that calling the same step multiple times doesn't generate
+    new classes."""
+    first_instance = module_level_step()
+    first_instance()
+    second_instance = module_level_step()
+    second_instance()
+
+    assert type(first_instance.component) is type(second_instance.component)
+    assert generate_component(first_instance) is generate_component(
+        second_instance
+    )
+
+
+class StatefulStep(BaseStep):
+    """Class-based step whose output depends on its instance state."""
+
+    def __init__(self, *args, offset: int = 0, **kwargs):
+        """Initializes the step with an offset."""
+        super().__init__(*args, **kwargs)
+        self.offset = offset
+
+    def process(self) -> int:
+        """Returns the offset of the step instance."""
+        return self.offset
+
+
+def test_class_based_steps_call_their_own_instance():
+    """Tests that executors of class-based steps use the state of the step
+    instance they were generated for."""
+    default_instance = StatefulStep()
+    configured_instance = StatefulStep(offset=5)
+    changed_instance = StatefulStep()
+    changed_instance.offset = 7
+
+    for step_instance, expected in (
+        (default_instance, 0),
+        (configured_instance, 5),
+        (changed_instance, 7),
+    ):
+        executor_class = generate_component(
+            step_instance
+        ).EXECUTOR_SPEC.executor_class
+        assert executor_class._FUNCTION.__self__ is step_instance
+        assert executor_class._FUNCTION() == expected
+
+
+def test_step_variants_get_separate_executor_classes():
+    """Tests that instances of a step with different materializers get
+    separate executor classes which are importable at the same time."""
+
+    class CustomIntMaterializer(BaseMaterializer):
+        ASSOCIATED_TYPES = [int]
+
+    default_instance = module_level_step()
+    default_instance()
+    custom_instance = module_level_step().with_return_materializers(
+        CustomIntMaterializer
+    )
+    custom_instance()
+
+    default_executor = default_instance.component.executor_spec.executor_class
+    custom_executor = custom_instance.component.executor_spec.executor_class
+
+    assert default_executor is not custom_executor
+    for executor_class in (default_executor, custom_executor):
+        assert (
+            source_utils.import_class_by_path(
+                f"{executor_class.__module__}.{executor_class.__name__}"
+            )
+            is executor_class
+        )
+
+
+def test_execution_plan_separates_config_inputs_and_outputs():
+    """Tests that the execution plan of a step function contains its config,
+    input artifacts and ordered outputs."""
+
+    class StepConfig(BaseStepConfig):
+        value: int = 1
+
+    @step
+    def some_step(
+        first: int, config: StepConfig, second: str
+    ) -> Output(output_b=int, output_a=str):
+        return 1, "a"
+
+    step_instance = some_step()
+    step_instance()
+    executor_class = step_instance.component.executor_spec.executor_class
+    plan = executor_class.get_execution_plan()
+
+    assert plan.config_arg == "config"
+    assert plan.config_type is StepConfig
+    assert plan.input_types == {"first": int, "second": str}
+    assert list(plan.output_types) == ["output_b", "output_a"]
+    assert plan.is_multi_output
+    assert plan.output_materializers == {
+        "output_b": BuiltInMaterializer,
+        "output_a": BuiltInMaterializer,
+    }
+
+
+def test_execution_plan_of_single_output_function():
+    """Tests the execution plan of a function without config and a single
+    output."""
+
+    def some_function(data: int) -> int:
+        return data
+
+    plan = get_execution_plan(some_function, None)
+
+    assert plan.config_arg is None
+    assert plan.input_types == {"data": int}
+    assert plan.output_types == {SINGLE_RETURN_OUT_NAME: int}
+    assert not plan.is_multi_output
+    assert plan.output_materializers == {}
+
+
+def test_execution_plan_marks_lazy_inputs():
+    """Tests that `Lazy` annotations are unwrapped and the corresponding
+    inputs are marked as lazy."""
+
+    def some_function(eager: int, lazy: Lazy[str]) -> int:
+        return eager
+
+    plan = get_execution_plan(some_function, None)
+
+    assert plan.input_types == {"eager": int, "lazy": str}
+    assert plan.lazy_inputs == {"lazy"}
+
+
+def test_lazy_input_loads_only_once():
+    """Tests that a lazy input calls its load function on the first read
+    only."""
+    calls = []
+
+    def load():
+        calls.append(None)
+        return 42
+
+    lazy_input = Lazy(load)
+    assert not lazy_input.is_loaded
+    assert lazy_input.read() == 42
+    assert lazy_input.read() == 42
+    assert lazy_input.is_loaded
+    assert len(calls) == 1
+
+
+def test_execution_plan_of_generator_function():
+    """Tests that generator functions yield chunks of a single output with
+    the type of the chunks."""
+
+    def some_function() -> Iterator[int]:
+        yield 1
+
+    plan = get_execution_plan(some_function, None)
+
+    assert plan.yields_chunks
+    assert plan.output_types == {SINGLE_RETURN_OUT_NAME: int}
+
+
+def test_execution_plan_of_coroutine_function():
+    """Tests that `async def` step functions are marked as coroutines."""
+
+    async def some_function() -> int:
+        return 1
+
+    assert get_execution_plan(some_function, None).is_coroutine
+
+
+def test_run_coroutine_inside_running_event_loop():
+    """Tests that coroutines also run when the calling thread already runs
+    an event loop."""
+
+    async def add(a, b):
+        await asyncio.sleep(0)
+        return a + b
+
+    async def outer():
+        return run_coroutine(add(1, 2))
+
+    assert run_coroutine(add(1, 2)) == 3
+    assert asyncio.get_event_loop().run_until_complete(outer()) == 3
+
+
+def test_lazy_input_partial_reads_are_not_cached():
+    """Tests that reads with options are forwarded to the load function and
+    don't count as loading the complete input."""
+    calls = []
+
+    def load(**read_options):
+        calls.append(read_options)
+        return read_options
+
+    lazy_input = Lazy(load)
+    assert lazy_input.read(columns=["a"]) == {"columns": ["a"]}
+    assert not lazy_input.is_loaded
+    assert lazy_input.read() == {}
+    assert calls == [{"columns": ["a"]}, {}]
@@ -13,5 +13,26 @@
 #  permissions and limitations under the License.
 
 
+from zenml.utils import source_utils
+
+
 def test_me():
     """A simple test to check a functionality"""
+
+
+def test_hashed_source_changes_with_source_code():
+    """Tests that the source hash is stable and differs between functions
+    with different source code."""
+
+    def first_function():
+        return 1
+
+    def second_function():
+        return 2
+
+    assert source_utils.get_hashed_source(
+        first_function
+    ) == source_utils.get_hashed_source(first_function)
+    assert source_utils.get_hashed_source(
+        first_function
+    ) != source_utils.get_hashed_source(second_function)